@@ -1,16 +1,26 @@
-from kafka import KafkaConsumer
 import json
-from pymongo import MongoClient, UpdateOne, DeleteOne
-import logging
-import grpc
-import notification_pb2
-import notification_pb2_grpc
 import time
+import logging
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from pymongo import MongoClient, UpdateOne, DeleteOne
 
 # Set pymongo logger to WARNING level to suppress DEBUG and INFO logs
 logging.getLogger("pymongo").setLevel(logging.WARNING)
 
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger("push_to_mongodb")
+
+batch_size = 100
+flush_interval = 0.5
+max_writer_workers = 4
+
 
 def get_database():
     # Provide the mongodb atlas url to connect python to mongodb using pymongo
@@ -21,129 +31,204 @@ def get_database():
     return client["rpgs"]
 
 
-def insert_or_update_character_by_id(cid, new_char_dict):
-    new_values = {"$set": new_char_dict}
-    return db["character"].update_one({"id": cid}, new_values, upsert=True)
-
-
-def insert_or_update_combat_by_id(cid, new_combat_dict):
-    new_values = {"$set": new_combat_dict}
-    return db["combat"].update_one({"id": cid}, new_values, upsert=True)
-
-
-def bulk_insert_or_update_collection_and_notify(collection_type):
-    operations = []
-    data_list = store_data_for_batch_write[collection_type]
-    store_data_for_batch_write[collection_type] = []
-    for d in data_list:
-        data_action = d.pop("data_action")
-        if data_action == "update":
-            new_values = {"$set": d}
-            operations.append(UpdateOne({"id": d["id"]}, new_values, upsert=True))
-        elif data_action == "delete":
-            operations.append(DeleteOne({"id": d["id"]}))
-
-    notification_success = notify_nextjs(collection_type)
-    if notification_success:
-        print("Notification sent successfully to Next.js.")
-    else:
-        print("Failed to notify Next.js.")
-    return db[collection_type].bulk_write(operations)
-
-
-# Function to run bulk update asynchronously
-def run_bulk_update_and_notify_in_thread(data_type):
-    if len(store_data_for_batch_write[data_type]) > 0:
-        thread = threading.Thread(
-            target=bulk_insert_or_update_collection_and_notify,
-            args=(data_type,),
+class Notifier:
+    # One persistent channel and stub to the Next.js notifier service
+    def __init__(self, target="localhost:50051") -> None:
+        import grpc
+        import notification_pb2
+        import notification_pb2_grpc
+
+        self.grpc = grpc
+        self.notification_pb2 = notification_pb2
+        self.channel = grpc.insecure_channel(target)
+        self.stub = notification_pb2_grpc.NotifierStub(self.channel)
+
+    def notify(self, type):
+        try:
+            response = self.stub.notifyUpdate(
+                self.notification_pb2.updateRequest(
+                    message="New data available", type=type
+                )
+            )
+            return response.success
+        except self.grpc.RpcError as e:
+            logger.warning("Failed to notify Next.js about %s: %s", type, e)
+            return False
+
+    def close(self):
+        self.channel.close()
+
+
+class BatchWriter:
+    """
+    Per-collection batches of pending writes, coalesced by entity id.
+
+    Updates of the same id are merged field by field before being written, a delete
+    replaces everything pending for its id. Every collection batch is written with one
+    unordered bulk_write on a fixed-size worker pool.
+    """
+
+    def __init__(self, db, notifier=None, max_workers=max_writer_workers) -> None:
+        self.db = db
+        self.notifier = notifier
+        self.pending_writes: dict[str, OrderedDict] = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mongodb-writer"
         )
-        thread.start()
-
-
-def notify_nextjs(type):
-    with grpc.insecure_channel("localhost:50051") as channel:
-        stub = notification_pb2_grpc.NotifierStub(channel)
-        response = stub.notifyUpdate(  # Correct method name
-            notification_pb2.updateRequest(
-                message="New data available", type=type
-            )  # Correct message type
-        )
-        return response.success
-
 
-def flush_batch():
-    for data_type in store_data_for_batch_write.keys():
-        run_bulk_update_and_notify_in_thread(data_type)
+    def add(self, data):
+        """Queue a message, returns the number of pending writes of its collection."""
+        data = dict(data)
+        collection_type = data.pop("type")
+        with self.lock:
+            pending = self.pending_writes.setdefault(collection_type, OrderedDict())
+            self.merge(pending, data)
+            return len(pending)
+
+    @staticmethod
+    def merge(pending: OrderedDict, data):
+        entity_id = data["id"]
+        if entity_id in pending:
+            pending_data = pending[entity_id]
+            if (
+                data["data_action"] == "update"
+                and pending_data["data_action"] == "update"
+            ):
+                pending_data.update(data)
+                return
+        pending[entity_id] = data
+
+    def restore(self, collection_type, writes):
+        # Put back the writes of a failed batch, behind the newer pending writes of same ids
+        with self.lock:
+            newer_writes = self.pending_writes.get(collection_type, OrderedDict())
+            restored_writes = OrderedDict((data["id"], data) for data in writes)
+            for data in newer_writes.values():
+                self.merge(restored_writes, data)
+            self.pending_writes[collection_type] = restored_writes
+
+    def get_pending_count(self):
+        with self.lock:
+            return sum(len(pending) for pending in self.pending_writes.values())
+
+    def flush(self):
+        """Submit every non-empty collection batch, returns the futures of the writes."""
+        with self.lock:
+            batches = {
+                collection_type: list(pending.values())
+                for collection_type, pending in self.pending_writes.items()
+                if pending
+            }
+            for collection_type in batches:
+                self.pending_writes[collection_type] = OrderedDict()
+        return {
+            self.executor.submit(self.write, collection_type, writes): (
+                collection_type,
+                writes,
+            )
+            for collection_type, writes in batches.items()
+        }
+
+    def flush_and_wait(self):
+        """Flush and wait for the writes, returns True when every batch was written."""
+        futures = self.flush()
+        wait(futures)
+        is_success = True
+        for future, (collection_type, writes) in futures.items():
+            if future.exception():
+                is_success = False
+                logger.error(
+                    "Failed to write %s %s documents: %s",
+                    len(writes),
+                    collection_type,
+                    future.exception(),
+                )
+                self.restore(collection_type, writes)
+        return is_success
+
+    def write(self, collection_type, writes):
+        operations = []
+        for data in writes:
+            data = dict(data)
+            data_action = data.pop("data_action")
+            if data_action == "update":
+                operations.append(
+                    UpdateOne({"id": data["id"]}, {"$set": data}, upsert=True)
+                )
+            elif data_action == "delete":
+                operations.append(DeleteOne({"id": data["id"]}))
+        result = self.db[collection_type].bulk_write(operations, ordered=False)
+
+        if self.notifier:
+            self.notifier.notify(collection_type)
+        return result
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+def run_consumer(consumer, writer: BatchWriter, shutdown_flag: threading.Event):
+    """
+    Poll the messages into the writer, and flush every flush_interval or when a batch is full.
+    Offsets are committed manually, only after the polled messages have been written.
+    """
+    last_flush_timestamp = time.time()
+    while not shutdown_flag.is_set():
+        records = consumer.poll(timeout_ms=int(flush_interval * 1000))
+        is_batch_full = False
+        for messages in records.values():
+            for message in messages:
+                if writer.add(message.value) >= batch_size:
+                    is_batch_full = True
 
+        if is_batch_full or last_flush_timestamp + flush_interval <= time.time():
+            if writer.get_pending_count() > 0 and writer.flush_and_wait():
+                consumer.commit()
+            last_flush_timestamp = time.time()
 
-def periodic_flush():
-    while not shutdown_flag.is_set():
-        time.sleep(flush_interval)
-        flush_batch()
+    # Write what is left before leaving
+    if writer.get_pending_count() > 0 and writer.flush_and_wait():
+        consumer.commit()
 
 
 # Initialize consumer
-def consume_kafka():
-    consumer = KafkaConsumer(
+def create_kafka_consumer():
+    from kafka import KafkaConsumer
+
+    return KafkaConsumer(
         "rpgs",
         bootstrap_servers="localhost:9092",
         auto_offset_reset="earliest",
         group_id="rpgs_group",
+        enable_auto_commit=False,
         value_deserializer=lambda x: json.loads(x.decode("utf-8")),
     )
-    try:
-        while not shutdown_flag.is_set():
-            for message in consumer:
-                data = message.value
-                data_type = data["type"]
-
-                if len(store_data_for_batch_write[data_type]) >= batch_size:
-                    run_bulk_update_and_notify_in_thread(data_type)
-                else:
-                    store_data_for_batch_write[data_type].append(data)
-    except Exception as e:
-        print(f"Exception in Kafka consumer thread: {e}")
-        shutdown_flag.set()  # Signal to shut down
-    finally:
-        consumer.close()  # Ensure consumer is closed on exit
-
-
-print("Start data streaming process...")
 
-# Initialize the database connection
-db = get_database()
 
-batch_size = 100
-flush_interval = 0.5
-store_data_for_batch_write = {"character": [], "event": []}
-
-# Flag for clean shutdown
-shutdown_flag = threading.Event()
-
-
-# Main function to start threads and handle shutdown
+# Main function to start the consumer and handle shutdown
 def main():
-    try:
-        # Start consumer and flush threads
-        consumer_thread = threading.Thread(target=consume_kafka)
-        flush_thread = threading.Thread(target=periodic_flush)
-        consumer_thread.start()
-        flush_thread.start()
-
-        # Wait for threads to finish
-        consumer_thread.join()
-        flush_thread.join()
+    logger.info("Start data streaming process...")
 
+    # Flag for clean shutdown
+    shutdown_flag = threading.Event()
+    consumer = create_kafka_consumer()
+    notifier = Notifier()
+    writer = BatchWriter(get_database(), notifier)
+    try:
+        run_consumer(consumer, writer, shutdown_flag)
+    except KeyboardInterrupt:
+        logger.info("Shutting down...")
+        shutdown_flag.set()
+        if writer.get_pending_count() > 0 and writer.flush_and_wait():
+            consumer.commit()
     except Exception:
-        print("Shutting down...")
-        shutdown_flag.set()  # Signal threads to terminate
-
-        # Ensure all threads finish their work
-        consumer_thread.join()
-        flush_thread.join()
+        logger.exception("Exception in Kafka consumer")
+    finally:
+        writer.close()
+        notifier.close()
+        consumer.close()  # Ensure consumer is closed on exit
 
 
 if __name__ == "__main__":
     main()
-# python -m grpc_tools.protoc -I. --python_out=. --grpc_python_out=. notification.proto
@@ -0,0 +1,253 @@
+import csv
+import sys
+import time
+import random
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy
+
+sys.path.append("..")
+sys.path.append(".")
+
+from simulate import Simulation
+from components.world.world_builder import WorldBuilder
+from components.character.character_table import get_character_table
+from data.game_settings import ACTION, SIMULATION
+from data.logs.logger import set_level
+
+RUN_COLUMNS = ["run_id", "map", "seed", "char_speed", "mob_generator_amount"]
+SAMPLE_COLUMNS = ["tick", "faction", "alive", "dead", "average_level"]
+
+
+class RunConfig:
+    def __init__(
+        self, run_id, map_path, seed, char_speed, mob_generator_amount, action_settings
+    ) -> None:
+        self.run_id = run_id
+        self.map_path = map_path
+        self.seed = seed
+        self.char_speed = char_speed
+        self.mob_generator_amount = mob_generator_amount
+        # ACTION setting name: value applied for this run only
+        self.action_settings = action_settings
+
+    def to_dict(self):
+        return {
+            "run_id": self.run_id,
+            "map": self.map_path,
+            "seed": self.seed,
+            "char_speed": self.char_speed,
+            "mob_generator_amount": self.mob_generator_amount,
+            **self.action_settings,
+        }
+
+
+def create_run_configs(maps, seeds, char_speeds, mob_generator_amounts, action_grid):
+    # Every combination of the parameter values, action_grid maps a setting to its values
+    action_names = list(action_grid)
+    combinations = itertools.product(
+        maps,
+        char_speeds,
+        mob_generator_amounts,
+        *action_grid.values(),
+        seeds,
+    )
+    return [
+        RunConfig(
+            run_id,
+            map_path,
+            seed,
+            char_speed,
+            mob_generator_amount,
+            dict(zip(action_names, action_values)),
+        )
+        for run_id, (
+            map_path,
+            char_speed,
+            mob_generator_amount,
+            *action_values,
+            seed,
+        ) in enumerate(combinations)
+    ]
+
+
+def get_sample_ticks(ticks, sample_interval):
+    return [*range(sample_interval, ticks, sample_interval), ticks]
+
+
+def init_worker(log_level, verify_caches):
+    # Runs once per worker process, the pool keeps the processes and their imports warm
+    set_level(log_level)
+    SIMULATION.VERIFY_CACHES = verify_caches
+
+
+def run_world(run_config: RunConfig, ticks, sample_interval):
+    """
+    Simulate one world headless and return its result rows, the population, the deaths and
+    the average level of every faction at each sample tick.
+    """
+    WorldBuilder.reset()
+    default_action_settings = {
+        name: getattr(ACTION, name) for name in run_config.action_settings
+    }
+    for name, value in run_config.action_settings.items():
+        setattr(ACTION, name, value)
+    random.seed(run_config.seed)
+    numpy.random.seed(run_config.seed)
+
+    try:
+        simulation = Simulation(
+            map_path=run_config.map_path,
+            char_speed_multiplier=run_config.char_speed,
+            mob_generator_amount=run_config.mob_generator_amount,
+        )
+        character_table = get_character_table()
+        run_values = run_config.to_dict()
+        rows = []
+        for tick in get_sample_ticks(ticks, sample_interval):
+            simulation.advance_to(tick)
+            alive_count, dead_count = simulation.get_population()
+            average_levels = character_table.get_average_level_by_faction()
+            for faction in sorted(alive_count.keys() | dead_count.keys()):
+                rows.append(
+                    {
+                        **run_values,
+                        "tick": tick,
+                        "faction": faction,
+                        "alive": alive_count.get(faction, 0),
+                        "dead": dead_count.get(faction, 0),
+                        "average_level": round(average_levels.get(faction, 0), 3),
+                    }
+                )
+        return rows
+    finally:
+        # The worker process runs the next world with the default settings again
+        for name, value in default_action_settings.items():
+            setattr(ACTION, name, value)
+
+
+def run_batch(
+    run_configs,
+    output_path,
+    ticks,
+    sample_interval,
+    max_workers=None,
+    log_level="WARNING",
+    verify_caches=False,
+):
+    """Run the worlds across a process pool, writing the rows of each run once it is done."""
+    action_names = list(run_configs[0].action_settings) if run_configs else []
+    with open(output_path, "w", newline="") as output_file, ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=init_worker,
+        initargs=(log_level, verify_caches),
+    ) as executor:
+        writer = csv.DictWriter(
+            output_file, fieldnames=RUN_COLUMNS + action_names + SAMPLE_COLUMNS
+        )
+        writer.writeheader()
+        futures = {
+            executor.submit(run_world, run_config, ticks, sample_interval): run_config
+            for run_config in run_configs
+        }
+        for done_count, future in enumerate(as_completed(futures), 1):
+            writer.writerows(future.result())
+            output_file.flush()
+            print(
+                f"[{done_count}/{len(run_configs)}] run {futures[future].run_id} done",
+                file=sys.stderr,
+            )
+
+
+def parse_action_grid(parser, action_args):
+    # NAME=VALUE[,VALUE...], the values are converted to the type of the default setting
+    action_grid = {}
+    for action_arg in action_args or []:
+        name, _, values = action_arg.partition("=")
+        if not values or not hasattr(ACTION, name):
+            parser.error(f"invalid --action '{action_arg}', expected NAME=V1[,V2...]")
+        setting_type = type(getattr(ACTION, name))
+        action_grid[name] = [setting_type(value) for value in values.split(",")]
+    return action_grid
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run a grid of headless worlds in parallel and stream their metrics to a CSV file."
+    )
+    parser.add_argument(
+        "--ticks", type=int, required=True, help="Simulation ticks of every run"
+    )
+    parser.add_argument(
+        "--sample-interval",
+        type=int,
+        default=10000,
+        help="Ticks between two samples of the metrics",
+    )
+    parser.add_argument(
+        "--maps", nargs="+", default=[WorldBuilder.default_map_path], help="Map files"
+    )
+    parser.add_argument(
+        "--seeds", nargs="+", type=int, default=[0], help="Random seeds of the runs"
+    )
+    parser.add_argument(
+        "--char-speeds",
+        nargs="+",
+        type=float,
+        default=[1],
+        help="Character speed multipliers",
+    )
+    parser.add_argument(
+        "--mob-generator-amounts",
+        nargs="+",
+        type=int,
+        default=[1],
+        help="Characters spawned by each mob generator",
+    )
+    parser.add_argument(
+        "--action",
+        action="append",
+        help="ACTION setting values, e.g. BASE_ESCAPE_CHANCE=0.1,0.3, can be repeated",
+    )
+    parser.add_argument(
+        "--output", type=str, default="batch_results.csv", help="Results file"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes, defaults to the CPU count"
+    )
+    parser.add_argument(
+        "--log-level", type=str, default="WARNING", help="Root logging level"
+    )
+    parser.add_argument(
+        "--verify-caches",
+        action="store_true",
+        help="Compare every cached value against its uncached computation",
+    )
+    args = parser.parse_args()
+
+    run_configs = create_run_configs(
+        args.maps,
+        args.seeds,
+        args.char_speeds,
+        args.mob_generator_amounts,
+        parse_action_grid(parser, args.action),
+    )
+    start = time.perf_counter()
+    run_batch(
+        run_configs,
+        args.output,
+        args.ticks,
+        args.sample_interval,
+        max_workers=args.workers,
+        log_level=args.log_level,
+        verify_caches=args.verify_caches,
+    )
+    print(
+        f"Ran {len(run_configs)} worlds in {time.perf_counter() - start:.2f}s, results in {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,11 @@
 import random
-import numpy
+import logging
 from enum import Enum
-import copy
 
-from components.common.damage_formula import get_final_damage_output
 from components.world.store import get_store, EntityType
 from components.common.point import Point
 from components.action.event import Event, CombatEvent, TrainingEvent, EventType
+from components.action.combat_engine import get_combat_engine
 from components.character.character_stat import StatDefinition
 from components.common.path_finding import (
     get_move_from_target,
@@ -28,9 +27,11 @@ from components.attribute.attribute import (
     Strength,
     Agility,
 )
-from data.logs.logger import logger
+from data.logs.logger import get_logger
 from data.game_settings import ACTION
 
+logger = get_logger(__name__)
+
 
 class ActionResult(Enum):
     START_COMBAT = 1
@@ -56,7 +57,7 @@ class Action:
 
     @classmethod
     def execute(cls, character, **kwargs):
-        if not character.is_mob():
+        if not character.is_mob() and logger.isEnabledFor(logging.DEBUG):
             # TODO: The total power should be total value of three powers, this for validation
             (
                 base_stat_power,
@@ -65,7 +66,13 @@ class Action:
             ) = character.get_detailed_power()
             total_power = character.get_power()
             logger.debug(
-                f"{character.get_info()} do {cls.action_name}. Stat: base='{base_stat_power}' equipment='{equipment_power}' status='{status_power}' total='{total_power}'"
+                "%s do %s. Stat: base='%s' equipment='%s' status='%s' total='%s'",
+                character.get_info(),
+                cls.action_name,
+                base_stat_power,
+                equipment_power,
+                status_power,
+                total_power,
             )
         cls.inspect_around(character)
         return cls.do_action(character, **kwargs)
@@ -75,21 +82,27 @@ class Action:
         # TODO: instead of reset memory every action, better delete only old memories, or wrong memories
         # like doesn't see the remembered character at the location (they already escaped)
 
-        character.get_memory().reset()
+        character_memory = character.get_memory()
+        character_memory.reset()
         store = get_store()
         visible_points = character.get_visible_tiles()
         for point in visible_points:
             tile_id = store.get(EntityType.GRID, 0).get_tile(point)
             tile = store.get(EntityType.TILE, tile_id)
 
-            # Remember the tile permanently
-            # TODO: Beware of too much data copied, when character remember/store the whole map
-            # TODO: we should remember the tile status at the moment (use copy) instead of something like store the tile_id.
-            # To make case like character A remember the item then the item is taken by another character B, A doesn't know until he check the tile again
-            memory_tile = MemoryTile(tile_id, point, copy.deepcopy(tile))
-            character.get_memory().add(
-                EntityType.TILE, tile_id, memory_tile, CharacterMemoryType.PERMANENT
+            # Remember the tile permanently, as the snapshot of its state at the moment
+            # Character A remembers the item, then the item is taken by character B, A doesn't know until he checks the tile again
+            # Snapshots are shared between characters and only rebuilt when the tile version changes
+            memory_tile = character_memory.get(
+                EntityType.TILE, tile_id, CharacterMemoryType.PERMANENT
             )
+            if memory_tile is None or memory_tile.get_version() != tile.get_version():
+                character_memory.add(
+                    EntityType.TILE,
+                    tile_id,
+                    MemoryTile(tile_id, point, tile.get_snapshot()),
+                    CharacterMemoryType.PERMANENT,
+                )
 
             # Examine combat event on visible tiles
             if tile.is_combat_happen():
@@ -105,24 +118,20 @@ class Action:
                         CharacterMemoryType.TEMPORARY,
                     )
 
-            # Examine character powers on visible tiles
-            character_ids_on_tile = store.get(
-                EntityType.TILE, tile_id
-            ).get_character_ids()
-            if len(character_ids_on_tile) > 0:
-                for cid in character_ids_on_tile:
-                    other_character = store.get(EntityType.CHARACTER, cid)
-                    memory = MemoryCharacter(
-                        cid, other_character.pos, other_character.get_race()
-                    )
-                    memory.remember_power(
-                        character,
-                        other_character,
-                        perception_accuracy=ACTION.BASE_POWER_PERCEPTION_ACCURACY,
-                    )
-                    character.get_memory().add(
-                        EntityType.CHARACTER, cid, memory, CharacterMemoryType.TEMPORARY
-                    )
+        # Examine character powers on visible tiles
+        for cid in character.get_visible_character_ids():
+            other_character = store.get(EntityType.CHARACTER, cid)
+            memory = MemoryCharacter(
+                cid, other_character.pos, other_character.get_race()
+            )
+            memory.remember_power(
+                character,
+                other_character,
+                perception_accuracy=ACTION.BASE_POWER_PERCEPTION_ACCURACY,
+            )
+            character.get_memory().add(
+                EntityType.CHARACTER, cid, memory, CharacterMemoryType.TEMPORARY
+            )
 
         # Increase proficiency
         # TODO: Increase something like Sensitive, currently not implemented
@@ -138,15 +147,22 @@ class Move(Action):
         next_move = character.get_strategy(CharacterStrategyType.Move).get_next_move(
             character
         )
+        if next_move is None:
+            logger.debug("%s has no valid move", character.get_info())
+            return False, []
 
         previous_tile = get_tile_object(character.pos)
         previous_tile.remove_character_id(character.get_info().id)
 
         # Perform move, move into tile and trigger following logics
         character.pos += next_move
+        store.get(EntityType.GRID, 0).get_spatial_index().move(
+            character.get_info().id, character.pos
+        )
         new_tile = get_tile_object(character.pos)
         new_tile.character_move_in(character)
         character.tile_id = new_tile.id
+        character.mark_data_changed()
 
         # Increase proficiency
         character.gain_proficiency(Agility.get_name(), 10)
@@ -170,16 +186,14 @@ class Search(Action):
         success_chance = 0.5  # TODO: this should based on character's attribute
         if random.random() < success_chance:
             current_tile = get_tile_object(character.pos)
-            collectable_items = current_tile.get_collectable_items()
-            received_item = numpy.random.choice(
-                list(collectable_items.keys()),
-                p=list(collectable_items.values()),
-            )
+            received_item = current_tile.get_collectable_item_sampler().sample()
             character.add_item(received_item)
-            logger.debug(f"{character.get_info()} collected {received_item.get_name()}")
+            logger.debug(
+                "%s collected %s", character.get_info(), received_item.get_name()
+            )
             return True, [ActionResult.SUCCESS_FIND_ITEM]
 
-        logger.debug(f"{character.get_info()} Search failed")
+        logger.debug("%s Search failed", character.get_info())
         return False, [ActionResult.FAIL_FIND_ITEM]
 
 
@@ -207,10 +221,10 @@ class Train(Action):
 
         if target_attr:
             target_attr_name = target_attr.get_name()
-            logger.debug(f"{character.get_info()} Training for {target_attr_name}")
+            logger.debug("%s Training for %s", character.get_info(), target_attr_name)
             character.gain_proficiency(target_attr_name, 20)
         else:
-            logger.debug(f"{character.get_info()} Training for overall")
+            logger.debug("%s Training for overall", character.get_info())
             character.gain_experience(50)
             character.gain_proficiency(Vitality.get_name(), 5)
             character.gain_proficiency(Strength.get_name(), 5)
@@ -274,35 +288,25 @@ class Fight(Action):
             charcter_faction
         )
         # TODO: smarter target selection
-        target_character_id = random.choice(target_character_ids)
+        # Target, skill or basic attack and damage, prepared with the other fights of the tick
+        target_character_id, used_skill, damage_dealt = get_combat_engine().take_attack(
+            character, target_character_ids
+        )
         target_character = store.get(EntityType.CHARACTER, target_character_id)
         character_power = character.character_stats.get_stat_value(StatDefinition.POWER)
         target_character_defense = target_character.character_stats.get_stat_value(
             StatDefinition.DEFENSE
         )
-
-        # Select skill or basic attack
-        use_skill_strategy = character.get_strategy(CharacterStrategyType.USE_SKILL)
-        is_used_skill = False
-        if use_skill_strategy:
-            next_skill, skill_damage = use_skill_strategy.get_next_skill(character)
-            if next_skill and character.can_use_skill(next_skill):
-                is_used_skill = True
-                character.use_skill(next_skill)
-                damage_dealt = get_final_damage_output(
-                    source_damage=skill_damage,
-                    target_defense=target_character_defense,
-                )
-                logger.debug(
-                    f"{character.get_info()} used {next_skill.get_name()} cost {next_skill.get_energy_cost()}"
-                )
-        if not is_used_skill:
-            # Use basic attack, with multiplier is 1
-            damage_dealt = get_final_damage_output(
-                source_damage=character_power,
-                target_defense=target_character_defense,
+        if used_skill:
+            character.use_skill(used_skill)
+            logger.debug(
+                "%s used %s cost %s",
+                character.get_info(),
+                used_skill.get_name(),
+                used_skill.get_energy_cost(),
             )
-            logger.debug(f"{character.get_info()} used basic attack")
+        else:
+            logger.debug("%s used basic attack", character.get_info())
         target_character.character_stats.update_stat(
             StatDefinition.CURRENT_HEALTH,
             -damage_dealt,
@@ -314,9 +318,16 @@ class Fight(Action):
         # Increase proficiency
         character.gain_proficiency(Strength.get_name(), 20)
         target_character.gain_proficiency(Endurance.get_name(), 20)
+        combat_event.update_character_power(target_character)
 
         logger.debug(
-            f"{character.get_info()}:POWER{character_power} hit {target_character.get_info()}:DEFENSE{target_character_defense} for {damage_dealt} damage, left {target_character_remaining_health} HP"
+            "%s:POWER%s hit %s:DEFENSE%s for %s damage, left %s HP",
+            character.get_info(),
+            character_power,
+            target_character.get_info(),
+            target_character_defense,
+            damage_dealt,
+            target_character_remaining_health,
         )
         if not target_character.is_alive():
             combat_event.kill_character(character, target_character)
@@ -350,7 +361,7 @@ class Escape(Action):
         character.gain_proficiency(Agility.get_name(), 20)
 
         if random.random() < escape_chance:
-            logger.debug(f"{character.get_info()} escape successfully")
+            logger.debug("%s escape successfully", character.get_info())
             character_id = character.get_info().id
             combat_event.remove_character_id(character.get_race(), character_id)
 
@@ -363,5 +374,5 @@ class Escape(Action):
                 ActionResult.MOVED_INTO_NEW_TILE,
             ]
 
-        logger.debug(f"{character.get_info()} escape failed")
+        logger.debug("%s escape failed", character.get_info())
         return False, [ActionResult.FAIL_ESCAPE_COMBAT]
@@ -0,0 +1,216 @@
+import random
+
+import numpy
+
+from components.common.damage_formula import get_final_damage_output
+from components.character.character_stat import StatDefinition
+from components.character.character_strategy import CharacterStrategyType
+from components.character.character_table import get_character_table
+from components.world.store import get_store, EntityType
+
+from data.logs.logger import get_logger
+from data.game_settings import SIMULATION
+
+logger = get_logger(__name__)
+
+
+class PreparedAttack:
+    __slots__ = ("draw", "target_id", "skill", "damage", "skill_key", "target_version")
+
+    def __init__(self, draw, target_id, skill, damage, skill_key, target_version):
+        self.draw = draw
+        self.target_id = target_id
+        self.skill = skill
+        self.damage = damage
+        self.skill_key = skill_key
+        self.target_version = target_version
+
+
+class CombatEngine:
+    """
+    Resolves the attacks of every fighter due in the same tick as one batch.
+
+    prepare_attacks draws the targets and computes the skill choices, the defenses and the
+    damages of all fighters with NumPy over the character table. The fights still run in
+    the scheduled order, each one takes its prepared attack and only recomputes it when an
+    earlier fight of the tick changed its inputs, so the outcomes follow the same
+    distribution as resolving every attack on its own.
+    """
+
+    def __init__(self) -> None:
+        self.prepared_attacks: dict[int, PreparedAttack] = {}
+        # character_id: (skill key, skill, skill damage), the skill choice of the use skill strategy
+        self.skill_choices: dict[int, tuple] = {}
+        self.prepared_count = 0
+        self.recomputed_count = 0
+
+    def reset(self):
+        self.prepared_attacks.clear()
+        self.skill_choices.clear()
+        self.prepared_count = 0
+        self.recomputed_count = 0
+
+    @staticmethod
+    def get_skill_key(character):
+        # Everything the skill choice depends on: final stats, attributes and skill masteries
+        return (
+            character.get_character_stat().get_final_stat_key(character),
+            character.get_character_attributes().get_version(),
+            tuple(
+                (name, skill.get_mastery())
+                for name, skill in character.get_skills().items()
+            ),
+        )
+
+    def get_skill_choice(self, character, skill_key=None):
+        """Skill and its damage picked by the use skill strategy, memoized per character."""
+        use_skill_strategy = character.get_strategy(CharacterStrategyType.USE_SKILL)
+        if not use_skill_strategy:
+            return None, 0
+        if skill_key is None:
+            skill_key = self.get_skill_key(character)
+        character_id = character.get_id()
+        skill_choice = self.skill_choices.get(character_id)
+        if skill_choice is None or skill_choice[0] != skill_key:
+            skill_choice = (skill_key, *use_skill_strategy.get_next_skill(character))
+            self.skill_choices[character_id] = skill_choice
+        elif SIMULATION.VERIFY_CACHES:
+            expected_skill_choice = use_skill_strategy.get_next_skill(character)
+            if skill_choice[1:] != expected_skill_choice:
+                raise Exception(
+                    f"Stale skill choice of {character.get_info()}, cached {skill_choice[1:]} expected {expected_skill_choice}"
+                )
+        return skill_choice[1], skill_choice[2]
+
+    def prepare_attacks(self, characters):
+        store = get_store()
+        table = get_character_table()
+        fighters = []
+        target_ids = []
+        for character in characters:
+            combat_event_id = character.get_combat_event_id()
+            if combat_event_id is None or not character.is_alive():
+                continue
+            combat_event = store.get(EntityType.EVENT, combat_event_id)
+            if (
+                combat_event is None
+                or character.get_race() not in combat_event.get_factions()
+            ):
+                continue
+            targets = combat_event.get_target_character_ids_of_faction(
+                character.get_race()
+            )
+            if not targets:
+                continue
+            # Drawn from the random module like random.choice, seeded runs stay reproducible
+            draw = random.random()
+            fighters.append((character, draw))
+            target_ids.append(targets[int(draw * len(targets))])
+        if not fighters:
+            return
+
+        skill_keys = []
+        skills = []
+        skill_damages = []
+        skill_costs = []
+        for character, _ in fighters:
+            skill_key = self.get_skill_key(character)
+            skill, skill_damage = self.get_skill_choice(character, skill_key)
+            skill_keys.append(skill_key)
+            skills.append(skill)
+            skill_damages.append(skill_damage)
+            skill_costs.append(skill.get_energy_cost() if skill else 0)
+
+        attacker_slots = numpy.array(
+            [character.get_table_slot() for character, _ in fighters]
+        )
+        target_slots = numpy.array(
+            [table.get_slot(target_id) for target_id in target_ids]
+        )
+        has_skill = numpy.array([skill is not None for skill in skills])
+        is_skill_used = has_skill & (
+            table.get_column("current_energy")[attacker_slots]
+            >= numpy.array(skill_costs)
+        )
+        source_damages = numpy.where(
+            is_skill_used,
+            numpy.array(skill_damages, dtype=numpy.float64),
+            table.get_column("power")[attacker_slots],
+        )
+        damages = numpy.maximum(
+            0, source_damages - table.get_column("defense")[target_slots]
+        ).tolist()
+        target_versions = table.get_column("stat_version")[target_slots].tolist()
+
+        for idx, (character, draw) in enumerate(fighters):
+            damage = damages[idx]
+            self.prepared_attacks[character.get_id()] = PreparedAttack(
+                draw,
+                target_ids[idx],
+                skills[idx] if is_skill_used[idx] else None,
+                int(damage) if damage.is_integer() else damage,
+                skill_keys[idx],
+                target_versions[idx],
+            )
+
+    def take_attack(self, character, target_character_ids):
+        """
+        Target id, used skill or None for a basic attack and damage of the character's attack.
+        The prepared attack is reused while its target, skill choice and stats are unchanged.
+        """
+        store = get_store()
+        table = get_character_table()
+        prepared_attack = self.prepared_attacks.pop(character.get_id(), None)
+        draw = prepared_attack.draw if prepared_attack else random.random()
+        target_id = target_character_ids[int(draw * len(target_character_ids))]
+        target_character = store.get(EntityType.CHARACTER, target_id)
+
+        if (
+            prepared_attack
+            and prepared_attack.target_id == target_id
+            and prepared_attack.target_version
+            == table.get_value("stat_version", target_character.get_table_slot())
+            and prepared_attack.skill_key == self.get_skill_key(character)
+        ):
+            self.prepared_count += 1
+            if SIMULATION.VERIFY_CACHES:
+                expected_attack = self.compute_attack(character, target_character)
+                if (prepared_attack.skill, prepared_attack.damage) != expected_attack:
+                    raise Exception(
+                        f"Stale prepared attack of {character.get_info()}, prepared {(prepared_attack.skill, prepared_attack.damage)} expected {expected_attack}"
+                    )
+            return target_id, prepared_attack.skill, prepared_attack.damage
+
+        self.recomputed_count += 1
+        return (target_id, *self.compute_attack(character, target_character))
+
+    # Unbatched attack, the used skill or None for a basic attack and the damage
+    def compute_attack(self, character, target_character):
+        target_defense = target_character.get_character_stat().get_stat_value(
+            StatDefinition.DEFENSE
+        )
+        skill, skill_damage = self.get_skill_choice(character)
+        if skill and character.can_use_skill(skill):
+            return skill, get_final_damage_output(skill_damage, target_defense)
+        character_power = character.get_character_stat().get_stat_value(
+            StatDefinition.POWER
+        )
+        return None, get_final_damage_output(character_power, target_defense)
+
+    def clear_prepared_attacks(self):
+        # Fighters that escaped or died before their turn leave their attack unused
+        self.prepared_attacks.clear()
+
+    def get_stats(self):
+        return {
+            "prepared_attacks": self.prepared_count,
+            "recomputed_attacks": self.recomputed_count,
+            "skill_choices": len(self.skill_choices),
+        }
+
+
+combat_engine = CombatEngine()
+
+
+def get_combat_engine():
+    return combat_engine
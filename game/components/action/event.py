@@ -2,7 +2,10 @@ from components.character.character_stat import StatDefinition
 from components.world.store import get_store, EntityType
 from enum import Enum
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+from data.game_settings import SIMULATION
+
+logger = get_logger(__name__)
 
 
 class EventType(Enum):
@@ -17,7 +20,8 @@ class Event:
     def __init__(self) -> None:
         self.id = Event.id_counter
         Event.id_counter += 1
-        pass
+        # Dirty tracking of the data published by to_dict
+        self.is_data_changed = True
 
     def execute(self):
         pass
@@ -25,6 +29,15 @@ class Event:
     def get_id(self):
         return self.id
 
+    def mark_data_changed(self):
+        self.is_data_changed = True
+
+    def has_data_changed(self):
+        return self.is_data_changed
+
+    def on_data_published(self):
+        self.is_data_changed = False
+
 
 class CombatEvent(Event):
     # faction = character class name
@@ -33,11 +46,16 @@ class CombatEvent(Event):
         self.character_faction_ids = {}
         # TODO: if there are more than one target faction of a character, they should have priority
         self.hostile_faction_map = {}
+        # Running power of every character by faction, faction-{character_id-power}
+        self.faction_character_powers = {}
+        self.faction_total_powers = {}
         self.tile_id = tile_id
         tile = get_store().get(EntityType.TILE, self.tile_id)
         tile.set_tile_combat_status(is_combat=True, combat_event_id=self.id)
 
-        logger.debug(f"New combat happen: {self.get_id()}:{self.character_faction_ids}")
+        logger.debug(
+            "New combat happen: %s:%s", self.get_id(), self.character_faction_ids
+        )
 
     def add_hostile_faction(self, faction, hostile_faction):
         if faction in self.hostile_faction_map:
@@ -53,17 +71,47 @@ class CombatEvent(Event):
             self.add_hostile_faction(hostile_faction, faction)
 
     def add_character_id(self, faction, character_id):
+        self.mark_data_changed()
         if faction not in self.character_faction_ids:
             self.character_faction_ids[faction] = [character_id]
+            self.faction_character_powers[faction] = {}
+            self.faction_total_powers[faction] = 0
         else:
             self.character_faction_ids[faction].append(character_id)
+        self.set_character_power(
+            faction,
+            character_id,
+            get_store().get(EntityType.CHARACTER, character_id).get_power(),
+        )
+
+    def set_character_power(self, faction, character_id, power):
+        character_powers = self.faction_character_powers[faction]
+        self.faction_total_powers[faction] += power - character_powers.get(
+            character_id, 0
+        )
+        character_powers[character_id] = power
+
+    # Called whenever the power of a character in the combat may have changed (damaged, leveled up, statuses)
+    def update_character_power(self, character):
+        faction = character.get_race()
+        character_id = character.get_info().id
+        if character_id in self.faction_character_powers.get(faction, {}):
+            self.set_character_power(faction, character_id, character.get_power())
+
+    def remove_faction_powers(self, faction):
+        self.faction_character_powers.pop(faction)
+        self.faction_total_powers.pop(faction)
 
     def remove_character_id(self, character_faction, character_id):
         if character_faction in self.character_faction_ids:
+            self.mark_data_changed()
             self.character_faction_ids[character_faction].remove(character_id)
+            self.set_character_power(character_faction, character_id, 0)
+            self.faction_character_powers[character_faction].pop(character_id)
             if len(self.character_faction_ids[character_faction]) == 0:
                 self.remove_faction_from_hostile_faction_map(character_faction)
                 self.character_faction_ids.pop(character_faction)
+                self.remove_faction_powers(character_faction)
 
                 # Exit combat for all characters has no hostile faction in combat
 
@@ -119,6 +167,8 @@ class CombatEvent(Event):
 
         self.remove_faction_from_hostile_faction_map(faction)
         self.character_faction_ids.pop(faction)
+        self.remove_faction_powers(faction)
+        self.mark_data_changed()
 
         if len(self.character_faction_ids.keys()) == 0:
             store = get_store()
@@ -130,7 +180,7 @@ class CombatEvent(Event):
             character.exit_combat()
 
     def kill_character(self, character, killed_character):
-        logger.debug(f"{character.get_info()} killed {killed_character.get_info()}")
+        logger.debug("%s killed %s", character.get_info(), killed_character.get_info())
 
         store = get_store()
 
@@ -148,6 +198,7 @@ class CombatEvent(Event):
         tile_id = killed_character.tile_id
         tile = store.get(EntityType.TILE, tile_id)
         tile.remove_character_id(killed_character_id)
+        store.get(EntityType.GRID, 0).get_spatial_index().remove(killed_character_id)
 
         self.remove_character_id(target_faction, killed_character_id)
 
@@ -158,17 +209,23 @@ class CombatEvent(Event):
         # return False
 
     def get_hostile_power(self, faction):
-        store = get_store()
-        target_character_ids = self.get_target_character_ids_of_faction(faction)
-        target_characters = [
-            store.get(EntityType.CHARACTER, cid) for cid in target_character_ids
-        ]
-        sum_power = 0
-        for target_character in target_characters:
-            sum_power += target_character.get_power()
-        return sum_power
+        return sum(
+            self.get_total_power_by_faction(target_faction)
+            for target_faction in self.hostile_faction_map.get(faction, [])
+        )
 
     def get_total_power_by_faction(self, faction):
+        total_power = self.faction_total_powers.get(faction, 0)
+        if SIMULATION.VERIFY_CACHES:
+            expected_total_power = self.compute_total_power_by_faction(faction)
+            if total_power != expected_total_power:
+                raise Exception(
+                    f"Stale {faction} power total in combat {self.get_id()}, cached {total_power} expected {expected_total_power}"
+                )
+        return total_power
+
+    # Uncached total power, sums the power of every character of the faction
+    def compute_total_power_by_faction(self, faction):
         store = get_store()
         sum_power = 0
         character_ids = self.get_character_ids_with_faction(faction)
@@ -5,7 +5,9 @@ from components.character.character_action import (
 )
 from components.archetype.skill.skill import Skill, SkillMastery
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class UnlockArchetypeGoal(Goal):
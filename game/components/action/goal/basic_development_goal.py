@@ -4,7 +4,9 @@ from components.character.character_action import (
     CharacterActionModifyReason,
 )
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class AttributeTrainingGoal(Goal):
@@ -43,7 +45,9 @@ class AttributeTrainingGoal(Goal):
         )
         if character_attr.is_capped():
             logger.debug(
-                f"Attribute {character_attr} of the character reached the cap, but require {self.target_attribute}"
+                "Attribute %s of the character reached the cap, but require %s",
+                character_attr,
+                self.target_attribute,
             )
             return True
         return False
@@ -52,7 +56,9 @@ class AttributeTrainingGoal(Goal):
         from components.knowledge.knowledge import KnowledgeType
 
         logger.debug(
-            f"{self.get_name()} is currently blocked due to capped Attribute {self.target_attribute}"
+            "%s is currently blocked due to capped Attribute %s",
+            self.get_name(),
+            self.target_attribute,
         )
 
         # TODO: is_increased let character know it already maxed out or not
@@ -64,10 +70,12 @@ class AttributeTrainingGoal(Goal):
         )
         increase_attr_cap_goal = knowledge_increase_attr_cap.get_goal(character)
         logger.debug(
-            f"Resolve block of {self.get_name()} with character knowledge {knowledge_increase_attr_cap.get_name()}, that add the {increase_attr_cap_goal.get_name()}"
+            "Resolve block of %s with character knowledge %s, that add the %s",
+            self.get_name(),
+            knowledge_increase_attr_cap.get_name(),
+            increase_attr_cap_goal.get_name(),
         )
-        priority = character.add_goal(1, increase_attr_cap_goal)
-        return priority
+        return character.add_goal(1, increase_attr_cap_goal)
 
     def can_apply_to(self, character):
         return character.get_character_action().has_action(ActionType.TRAIN)
@@ -1,9 +1,11 @@
 from enum import Enum
 
 from components.action.goal.goal import Goal
-from components.common.priority_dict import PriorityDict
+from components.common.priority_dict import PriorityDict, PriorityDictItem
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class GoalPriorityDict:
@@ -21,10 +23,11 @@ class CharacterGoal:
     def __init__(self) -> None:
         self.goals = PriorityDict()
         self.current_goal: Goal = None
-        self.current_priority: int = -1
+        self.current_handle: PriorityDictItem = None
         self.current_apply_status: CharacterGoalStatus = CharacterGoalStatus.NOTHING
 
-    def add(self, priority: int, goal: Goal, update_if_exist=False):
+    # priority 1 or less pushes the goal to the front, a handle inserts it right after that goal
+    def add(self, priority: int | PriorityDictItem, goal: Goal, update_if_exist=False):
         goal_name = goal.get_name()
 
         # existing_duplicated_goal = None
@@ -40,18 +43,18 @@ class CharacterGoal:
         # self.goals.set_with_highest_priority(goal.get_name(), goal)
         # self.load_current_goal()
         # logger.debug(f"Added new goal {goal}")
-        logger.debug(f"Adding goal {goal}")
+        logger.debug("Adding goal %s", goal)
         if goal.is_unique() and self.goals.has(goal_name, goal):
-            logger.debug(f"Goal '{goal}' already added")
-            return -1
+            logger.debug("Goal '%s' already added", goal)
+            return None
         else:
-            if priority <= 1:
-                priority = self.goals.set_with_highest_priority(goal_name, goal)
-                self.load_current_goal()
+            if isinstance(priority, PriorityDictItem):
+                handle = self.goals.insert_after(priority, goal_name, goal)
             else:
-                priority = self.goals.set_to_priority(priority, goal_name, goal)
-            logger.debug(f"Added new goal {goal}")
-            return priority
+                handle = self.goals.push_front(goal_name, goal)
+                self.load_current_goal()
+            logger.debug("Added new goal %s", goal)
+            return handle
 
     def get(self):
         return self.goals.get_highest_priority()
@@ -83,7 +86,7 @@ class CharacterGoal:
             if not self.current_goal.is_applied_to_character():
                 self.current_goal.apply_to_character(character)
             self.current_goal.apply_to_actions(character)
-            logger.debug(f"Applied goal {self.current_goal}")
+            logger.debug("Applied goal %s", self.current_goal)
 
     def reset_status_to_waiting(self):
         if self.current_apply_status == CharacterGoalStatus.ALREADY_APPLIED:
@@ -100,7 +103,7 @@ class CharacterGoal:
         if not self.current_goal:
             if self.is_empty():
                 return None
-            self.current_priority, self.current_goal = self.get()
+            self.current_handle, self.current_goal = self.get()
             self.on_start_goal()
 
     def get_current_goal(self):
@@ -108,20 +111,20 @@ class CharacterGoal:
         return self.current_goal
 
     def clear_current_goal(self):
-        logger.debug(f"Clear the current goal {self.get_current_goal().get_name()}")
+        logger.debug("Clear the current goal %s", self.get_current_goal().get_name())
         self.current_goal = None
-        self.goals.remove_with_priority(self.current_priority)
-        self.current_priority = -1
+        self.goals.remove(self.current_handle)
+        self.current_handle = None
 
     def check_done_current_goal(self, character):
         if self.has_goal() and self.get_current_goal().is_complete(character):
-            logger.debug(f"Goal {self.get_current_goal().get_name()} is completed")
+            logger.debug("Goal %s is completed", self.get_current_goal().get_name())
             self.on_complete_goal(character)
             return True
         return False
 
     def check_block_current_goal(self, character):
         if self.has_goal() and self.get_current_goal().is_block(character):
-            logger.debug(f"Goal {self.get_current_goal().get_name()} is blocked")
+            logger.debug("Goal %s is blocked", self.get_current_goal().get_name())
             return True
         return False
@@ -8,7 +8,9 @@ from components.action.action import ActionResult
 from components.item.item import Rarity, ItemType
 from components.item.equipment import DamagedAncientArmor, DamagedAncientSword
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class Goal:
@@ -27,8 +29,9 @@ class Goal:
 
     def resolve_block(self, character):
         self.on_complete(character)
-        lowest_priority = self.add_resolve_block_goals(character)
-        character.add_goal(lowest_priority, self)
+        # Re-add the blocked goal right after the goals resolving it
+        handle = self.add_resolve_block_goals(character)
+        character.add_goal(handle if handle else 1, self)
 
     def add_resolve_block_goals(self, character):
         pass
@@ -173,7 +176,10 @@ class FindingItemGoal(Goal):
         if item.get_final_rarity() < self.target_rarity:
             return False
         logger.debug(
-            f"Item {item.get_name()} is satisfied with the goal to collect items with type={[item_type.name for item_type in self.target_item_types]}, rarity>={self.target_rarity.name}"
+            "Item %s is satisfied with the goal to collect items with type=%s, rarity>=%s",
+            item.get_name(),
+            [item_type.name for item_type in self.target_item_types],
+            self.target_rarity.name,
         )
         return True
 
@@ -196,10 +202,10 @@ class FindingItemGoal(Goal):
     def add_item_to_goal(self, item):
         item_name = item.get_name()
         if item_name in self.collected_item_name:
-            logger.debug(f"Item {item_name} is already collected")
+            logger.debug("Item %s is already collected", item_name)
         elif item_name not in self.target_items:
             self.target_items[item_name] = item
-            logger.debug(f"Added {item_name} to the FindingItemGoal goal")
+            logger.debug("Added %s to the FindingItemGoal goal", item_name)
 
     # TODO: Later change to find the specific items
     def is_complete(self, character):
@@ -1,9 +1,10 @@
 import random
 
 from components.action.strategy.base_strategy import BaseStrategy
-from components.common.point import Point
+from components.common.point import Point, NEIGHBOR_OFFSETS
 from components.common.path_finding import (
     get_move_from_target,
+    get_move_to_location,
     check_valid_step,
 )
 from components.world.store import get_store, EntityType
@@ -12,9 +13,11 @@ from components.memory.memory import MemoryCharacter, MemoryEvent, PowerEst
 from components.utils.tile_utils import get_tile_object
 from components.action.goal.goal import FindingItemGoal
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
 from data.game_settings import ACTION
 
+logger = get_logger(__name__)
+
 
 class MoveStrategy(BaseStrategy):
     def __init__(self):
@@ -27,23 +30,16 @@ class MoveStrategy(BaseStrategy):
 
 class RandomMove:
     @staticmethod
-    def get_next_move(character, retry=0):
-        if retry == 50:
-            # TODO: very small chance for a bug, character stay a same spot althrough they can move
+    def get_next_move(character):
+        # Uniform among the valid steps, None when the character cannot move at all
+        valid_moves = [
+            move
+            for move in NEIGHBOR_OFFSETS
+            if check_valid_step(character, character.pos + move)
+        ]
+        if not valid_moves:
             return None
-        direction = random.randint(0, 3)
-        next_move = Point(0, 0)
-        if direction == 0:
-            next_move = Point(0, -1)
-        elif direction == 1:
-            next_move = Point(0, 1)
-        elif direction == 2:
-            next_move = Point(-1, 0)
-        elif direction == 3:
-            next_move = Point(1, 0)
-        if not check_valid_step(character, character.pos + next_move):
-            return RandomMove.get_next_move(character, retry=retry + 1)
-        return next_move
+        return random.choice(valid_moves)
 
 
 class ThinkingMove(MoveStrategy):
@@ -55,7 +51,8 @@ class ThinkingMove(MoveStrategy):
             current_goal = character.get_current_goal()
             if current_goal.is_finding_item():
                 logger.debug(
-                    f"{character.get_info()} has the FindingItem goal, looking for the tile contains the item"
+                    "%s has the FindingItem goal, looking for the tile contains the item",
+                    character.get_info(),
                 )
                 # TODO: Better strategy for reaching the collectable tiles
                 # Currently, When there is no collectable tiles in the memory, Human -> go left, Demon -> go right
@@ -71,13 +68,14 @@ class ThinkingMove(MoveStrategy):
                         )
                     ):
                         logger.debug(
-                            f"{character.get_info()} has the memory about the {tile.get_name()} contain the satisfied items, moving into it"
+                            "%s has the memory about the %s contain the satisfied items, moving into it",
+                            character.get_info(),
+                            tile.get_name(),
                         )
-                        return get_move_from_target(
+                        return get_move_to_location(
                             character,
                             character.pos,
                             memory_tile.get_location(),
-                            is_chasing=True,
                         )
 
         # Join nearby combat of own faction if favorable
@@ -91,13 +89,17 @@ class ThinkingMove(MoveStrategy):
                     PowerEst.WEAKER,
                 ]:
                     logger.debug(
-                        f"{character.get_info()}:{character.get_power()} is joining combat {memory_event.get_id()}:{memory_event.get_location()}:{memory_event.get_power_est()}"
+                        "%s:%s is joining combat %s:%s:%s",
+                        character.get_info(),
+                        character.get_power(),
+                        memory_event.get_id(),
+                        memory_event.get_location(),
+                        memory_event.get_power_est(),
                     )
-                    return get_move_from_target(
+                    return get_move_to_location(
                         character,
                         character.pos,
                         memory_event.get_location(),
-                        is_chasing=True,
                     )
 
         # Chase or escape nearby enemies
@@ -126,7 +128,10 @@ class ThinkingMove(MoveStrategy):
                     PowerEst.WEAKER,
                 ]:
                     logger.debug(
-                        f"{character.get_info()}:{character.get_power()} is chasing {memory_character.get_power_est()}"
+                        "%s:%s is chasing %s",
+                        character.get_info(),
+                        character.get_power(),
+                        memory_character.get_power_est(),
                     )
                     return get_move_from_target(
                         character,
@@ -153,13 +158,17 @@ class AgressiveMobMove(MoveStrategy):
                 #     PowerEst.WEAKER,
                 # ]:
                 logger.debug(
-                    f"{character.get_info()}:{character.get_power()} is joining combat {memory_event.get_id()}:{memory_event.get_location()}:{memory_event.get_power_est()}"
+                    "%s:%s is joining combat %s:%s:%s",
+                    character.get_info(),
+                    character.get_power(),
+                    memory_event.get_id(),
+                    memory_event.get_location(),
+                    memory_event.get_power_est(),
                 )
-                return get_move_from_target(
+                return get_move_to_location(
                     character,
                     character.pos,
                     memory_event.get_location(),
-                    is_chasing=True,
                 )
 
         # Chase or escape nearby enemies
@@ -173,7 +182,10 @@ class AgressiveMobMove(MoveStrategy):
                 #     PowerEst.WEAKER,
                 # ]:
                 logger.debug(
-                    f"{character.get_info()}:{character.get_power()} is chasing {memory_character.get_power_est()}"
+                    "%s:%s is chasing %s",
+                    character.get_info(),
+                    character.get_power(),
+                    memory_character.get_power_est(),
                 )
                 return get_move_from_target(
                     character,
@@ -200,7 +212,10 @@ class PassiveMobMove(MoveStrategy):
                     PowerEst.MUCH_STRONGER,
                 ]:
                     logger.debug(
-                        f"{character.get_info()}:{character.get_power()} is escaping from {memory_character.get_power_est()}"
+                        "%s:%s is escaping from %s",
+                        character.get_info(),
+                        character.get_power(),
+                        memory_character.get_power_est(),
                     )
                     return get_move_from_target(
                         character,
@@ -2,7 +2,9 @@ from enum import Enum
 
 from components.archetype.lineage import Lineage
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class Archetype(Lineage):
@@ -1,7 +1,9 @@
 from components.archetype.archetype import Archetype
 from components.archetype.skill.character_skill import CharacterSkill
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class CharacterArchetype:
@@ -19,7 +21,7 @@ class CharacterArchetype:
         if self.has_archetype(archetype):
             raise Exception(f"{archetype.get_name()} already existed in {self}")
         self.archetypes.append(archetype)
-        logger.debug(f"Added Achertype {archetype.get_name()}")
+        logger.debug("Added Achertype %s", archetype.get_name())
 
     def get_archetypes(self):
         return self.archetypes
@@ -1,6 +1,8 @@
 from components.archetype.skill.skill import Skill, SkillMastery
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class CharacterSkill:
@@ -12,10 +14,10 @@ class CharacterSkill:
 
     def add_skill(self, skill: Skill):
         if self.has_skill(skill):
-            logger.debug(f"Already learned the skill {skill}")
+            logger.debug("Already learned the skill %s", skill)
         else:
             self.skills[skill.get_name()] = skill
-            logger.debug(f"Learned the skill {skill}")
+            logger.debug("Learned the skill %s", skill)
 
     def get_skills(self) -> dict[str, Skill]:
         return self.skills
@@ -3,7 +3,9 @@ from enum import Enum
 from components.attribute.attribute import Attribute, Strength, Agility
 from components.character.character_stat import StatDefinition
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class SkillType(Enum):
@@ -68,7 +70,7 @@ class Skill:
             * self.mastery_multipliers[self.mastery]
             * self.base_multiplier
         )
-        logger.debug(f"Total multiplier of {self.get_name()}: {total_multiplier}")
+        logger.debug("Total multiplier of %s: %s", self.get_name(), total_multiplier)
         return int(
             character_stat.get_stat_value(StatDefinition.POWER) * total_multiplier
         )
@@ -85,7 +87,7 @@ class Skill:
     def gain_mastery_proficiency(self, mastery_point: int):
         if self.mastery_proficiency == SkillMastery.PERFECTION:
             logger.debug(
-                f"Perfection mastery of {self.get_name()}, cannot learn anything more"
+                "Perfection mastery of %s, cannot learn anything more", self.get_name()
             )
             return False, "Perfection"
         real_mastery_gain = int(mastery_point / self.mastery_gain[self.mastery])
@@ -93,7 +95,7 @@ class Skill:
         if self.mastery_proficiency >= 100:
             self.increase_mastery_level()
             logger.debug(
-                f"Mastery of {self.get_name()} leveled up, current is {self.mastery}"
+                "Mastery of %s leveled up, current is %s", self.get_name(), self.mastery
             )
             if self.mastery == SkillMastery.BEGINNER:
                 return True, "Learned"
@@ -4,7 +4,9 @@ from components.character.character_stat import CharacterStat, StatDefinition
 from components.character.stat import NumericalStat
 from components.utils.visualization_converter import convert_to_progress_string
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class AttributeProficiencyResult(Enum):
@@ -109,7 +111,7 @@ class Attribute:
         before_cap = self.get_cap()
         self.cap += value
         logger.debug(
-            f"{self.get_name()} cap increase from {before_cap} to {self.get_cap()}"
+            "%s cap increase from %s to %s", self.get_name(), before_cap, self.get_cap()
         )
 
     def increase_proficiency(self, value: int):
@@ -1,6 +1,8 @@
 from components.attribute.attribute import Attribute
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class CharacterAttribute:
@@ -12,6 +14,11 @@ class CharacterAttribute:
         else:
             self.base_attrs = {}
         self.additional_attrs = {}
+        # Bumped on every change of the values, caps or proficiencies
+        self.version = 0
+
+    def get_version(self):
+        return self.version
 
     def get_base_attrs(self):
         return self.base_attrs
@@ -25,6 +32,7 @@ class CharacterAttribute:
 
     def modify_cap(self, attr_name: str, value: int):
         self.get_base_attr(attr_name).modify_cap(value)
+        self.on_attribute_change()
 
     def modify_caps(self, attr_name_to_value):
         for attr_name, value in attr_name_to_value.items():
@@ -59,7 +67,9 @@ class CharacterAttribute:
     def add_base_attribute(self, attr: Attribute):
         attr_name = attr.get_name()
         if attr_name in self.base_attrs:
-            logger.debug(f"Overide the base {self.base_attrs[attr_name]} with {attr}")
+            logger.debug(
+                "Overide the base %s with %s", self.base_attrs[attr_name], attr
+            )
         self.base_attrs[attr_name] = attr
         self.on_attribute_change()
 
@@ -74,27 +84,31 @@ class CharacterAttribute:
     def add_additional_attribute(self, attr_identity: str, attr: Attribute):
         if attr_identity in self.additional_attrs:
             self.additional_attrs[attr_identity] = attr
-            logger.debug(f"Override the attribute effect from {attr_identity}: {attr}")
+            logger.debug(
+                "Override the attribute effect from %s: %s", attr_identity, attr
+            )
         else:
             self.additional_attrs[attr_identity] = attr
-            logger.debug(f"Add the attribute effect from {attr_identity}: {attr}")
+            logger.debug("Add the attribute effect from %s: %s", attr_identity, attr)
         self.on_attribute_change()
 
     # attr_identity is often the name of the attribute modification source
     def remove_additional_attribute(self, attr_identity: str):
         if attr_identity in self.additional_attrs:
             logger.debug(
-                f"Removing the attribute {self.additional_attrs[attr_identity]} affected by {attr_identity}"
+                "Removing the attribute %s affected by %s",
+                self.additional_attrs[attr_identity],
+                attr_identity,
             )
             self.additional_attrs.pop(attr_identity)
         else:
-            logger.debug(f"Cannot find the attribute affected by {attr_identity}")
+            logger.debug("Cannot find the attribute affected by %s", attr_identity)
         self.on_attribute_change()
 
     # TODO: This should placed in the character class, since we don't need to pass the character to every function above
     def on_attribute_change(self):
         # TODO: Update the total affect or optimization (update latest change attr only)on the character
-        pass
+        self.version += 1
 
     def __str__(self):
         return " | ".join(
@@ -4,6 +4,7 @@
 # )
 from components.common.point import Point
 from components.common.game_object import GameObject
+from components.display.damage_tracker import get_damage_tracker
 from components.action.event import Event, CombatEvent, TrainingEvent, EventType
 from components.action.strategy.base_strategy import BaseStrategy
 from components.action.action import ActionResult
@@ -25,6 +26,7 @@ from components.character.character_strategy import (
     CharacterStrategyType,
 )
 from components.character.character_stat import CharacterStat, StatDefinition
+from components.character.character_table import get_character_table
 from components.character.stat import NumericalStat
 from components.attribute.attribute import AttributeProficiencyResult, Attribute
 from components.attribute.character_attribute import CharacterAttribute
@@ -39,6 +41,7 @@ from components.character.character_power import CharacterPower
 from components.memory.character_memory import CharacterMemory
 from components.character.character_behavior import FightingBehavior
 from components.action.goal.character_goal import CharacterGoal
+from components.common.priority_dict import PriorityDictItem
 
 from components.knowledge.character_knowledge import CharacterKnowledge
 from components.knowledge.knowledge import Knowledge, KnowledgeType
@@ -50,7 +53,10 @@ from components.world.store import get_store, EntityType
 
 from components.utils.visualization_converter import convert_to_progress_string
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+from data.game_settings import SIMULATION
+
+logger = get_logger(__name__)
 
 
 class Character(GameObject):
@@ -64,8 +70,12 @@ class Character(GameObject):
         race: Race,
         level: int,
     ):
+        # Row of the columnar state, allocated first as the position is written through
+        self.character_table = get_character_table()
+        self.table_slot = self.character_table.add(
+            character_info.id, race.__class__.__name__, pos, level
+        )
         super().__init__(pos, img)
-        self.pos = pos
         self.img = img
         self.action_percentage = 0
         self.character_info = character_info
@@ -73,6 +83,7 @@ class Character(GameObject):
         # self.character_stats = character_stats
         self.character_attributes = character_attributes
         self.character_stats = CharacterStat(character_attr=character_attributes)
+        self.character_stats.bind_table(self.character_table, self.table_slot)
         self.character_status = CharacterStatus()
         self.race = race
         self.character_archetype = CharacterArchetype()
@@ -93,19 +104,78 @@ class Character(GameObject):
         self.character_inventory = CharacterInventory()
         self.character_equipment = CharacterEquipment()
 
-        self.is_dead = False
+        # Dirty tracking of the data published by to_dict, stat changes are tracked by the stat version
+        self.is_data_changed = True
+        self.published_stat_version = -1
+
+        # (power, max power) memoized with the final stat key
+        self.power_cache = None
+        self.power_cache_key = None
+        # Detailed info string memoized with the key of everything it displays
+        self.info_string_cache = None
+        self.info_string_cache_key = None
 
         store = get_store()
-        self.tile_id = store.get(EntityType.GRID, 0).tiles[pos.x][pos.y]
+        grid = store.get(EntityType.GRID, 0)
+        self.tile_id = grid.tiles[pos.x][pos.y]
         tile = store.get(EntityType.TILE, self.tile_id)
         tile.add_character_id(character_info.id)
+        grid.get_spatial_index().add(character_info.id, self.get_race(), pos)
 
         self.is_just_changed_location = True
 
-        logger.debug(f"{self.get_info()} has {self.get_power()} power")
+        logger.debug("%s has %s power", self.get_info(), self.get_power())
+
+    # -------------------- WORLD HANDOFF ----------------------------------------------------------
+
+    # The table row stays in the process the character is handed off from
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("character_table")
+        state["table_slot"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.character_table = get_character_table()
+        self.table_slot = self.character_table.add(
+            self.get_id(), self.get_race(), self.position, self.get_current_level()
+        )
+        self.character_stats.bind_table(self.character_table, self.table_slot)
+
+    def leave_world(self):
+        # Unregister from the store, the tile, the spatial index and the character table
+        store = get_store()
+        character_id = self.get_id()
+        store.get(EntityType.TILE, self.tile_id).remove_character_id(character_id)
+        store.get(EntityType.GRID, 0).get_spatial_index().remove(character_id)
+        store.remove(EntityType.CHARACTER, character_id)
+        self.character_table.remove(character_id)
+
+    def enter_world(self):
+        store = get_store()
+        grid = store.get(EntityType.GRID, 0)
+        character_id = self.get_id()
+        self.tile_id = grid.tiles[self.pos.x][self.pos.y]
+        store.add(EntityType.CHARACTER, character_id, self)
+        store.get(EntityType.TILE, self.tile_id).add_character_id(character_id)
+        grid.get_spatial_index().add(character_id, self.get_race(), self.pos)
+        self.set_redraw_status(True)
 
     # -------------------- INFORMATION, RACE, STATE ----------------------------------------------------------
 
+    @property
+    def pos(self):
+        return self.position
+
+    @pos.setter
+    def pos(self, pos: Point):
+        self.position = pos
+        self.character_table.set_position(self.table_slot, pos)
+
+    def get_table_slot(self):
+        return self.table_slot
+
     def get_location(self):
         return self.pos
 
@@ -128,15 +198,26 @@ class Character(GameObject):
         return self.character_knowledge
 
     def is_alive(self):
-        return (
-            not self.is_dead
-            and self.character_stats.get_stat(StatDefinition.CURRENT_HEALTH).value > 0
-        )
+        return self.character_table.is_alive(self.table_slot)
 
     # TODO: Better management state
     def set_state(self, state):
         if state == "dead":
-            self.is_dead = True
+            self.character_table.set_value("alive", self.table_slot, False)
+            self.mark_data_changed()
+
+    def mark_data_changed(self):
+        self.is_data_changed = True
+
+    def has_data_changed(self):
+        return (
+            self.is_data_changed
+            or self.character_stats.get_version() != self.published_stat_version
+        )
+
+    def on_data_published(self):
+        self.is_data_changed = False
+        self.published_stat_version = self.character_stats.get_version()
 
     def is_hostile_with(self, character: "Character"):
         hostile_races = self.race.get_hostile_races()
@@ -189,6 +270,21 @@ class Character(GameObject):
     def get_visible_tile_objects(self):
         return self.character_vision.get_visible_tile_objects(self.get_pos())
 
+    def get_visible_point_set(self):
+        return self.character_vision.get_visible_point_set(self.get_pos())
+
+    # Other characters standing on the visible tiles, optionally only of the given factions
+    def get_visible_character_ids(self, factions=None):
+        spatial_index = get_store().get(EntityType.GRID, 0).get_spatial_index()
+        visible_point_set = self.get_visible_point_set()
+        return [
+            character_id
+            for character_id, pos in spatial_index.iterate_radius(
+                self.get_pos(), self.character_vision.get_range(), factions
+            )
+            if pos in visible_point_set
+        ]
+
     def set_vision_range(self, vision_range: int):
         self.character_vision.set_range(vision_range)
 
@@ -203,16 +299,19 @@ class Character(GameObject):
     def gain_proficiency(self, attr_name: str, value: int):
         attr = self.get_character_attributes().get_base_attr(attr_name)
         attr_prof_result: AttributeProficiencyResult = attr.increase_proficiency(value)
+        self.get_character_attributes().on_attribute_change()
         if attr_prof_result is AttributeProficiencyResult.IS_LEVELED_UP:
             new_stat_gained = attr.clone()
             new_stat_gained.set_value(1)
             self.get_character_stat().update_stat_with_new_attribute_gained(
                 new_stat_gained
             )
-            logger.debug(f"The attribute {attr_name} is leveled up {attr.get_info()}")
+            logger.debug(
+                "The attribute %s is leveled up %s", attr_name, attr.get_info()
+            )
         if attr_prof_result is AttributeProficiencyResult.IS_CAPPED:
             logger.debug(
-                f"The attribute {attr_name} is reaching its cap {attr.get_cap()}"
+                "The attribute %s is reaching its cap %s", attr_name, attr.get_cap()
             )
             # TODO: is_increased let character know it already maxed out or not
             # later we can change goal when maxed out proficiency
@@ -232,25 +331,57 @@ class Character(GameObject):
 
     def level_up(self):
         logger.debug(
-            f"{self.get_info()} level up, before attributes: {self.get_character_attributes()}"
+            "%s level up, before attributes: %s",
+            self.get_info(),
+            self.get_character_attributes(),
         )
         self.get_character_attributes().modify_caps(self.race.get_attributes_cap_gain())
         logger.debug(
-            f"{self.get_info()} leveled up, after attributes: {self.get_character_attributes()}"
+            "%s leveled up, after attributes: %s",
+            self.get_info(),
+            self.get_character_attributes(),
         )
 
     def gain_experience(self, exp_value: int):
         is_level_up = self.level.add_exp(exp_value)
+        self.mark_data_changed()
         if is_level_up:
             self.level_up()
+            self.character_table.set_value(
+                "level", self.table_slot, self.level.get_current_level()
+            )
+            get_store().invalidate_level_order()
+            # The level is drawn on the character's tile
+            get_damage_tracker().mark_tile(self.tile_id)
 
     # -------------------- POWER ----------------------------------------------------------
 
+    def get_cached_powers(self):
+        final_stat_key = self.character_stats.get_final_stat_key(self)
+        if self.power_cache_key != final_stat_key:
+            final_stat = self.get_final_stat()
+            self.power_cache = (
+                CharacterPower.get_power(final_stat),
+                CharacterPower.get_max_power(final_stat),
+            )
+            self.power_cache_key = final_stat_key
+        elif SIMULATION.VERIFY_CACHES:
+            final_stat = self.character_stats.compute_final_stat(self)
+            expected_powers = (
+                CharacterPower.get_power(final_stat),
+                CharacterPower.get_max_power(final_stat),
+            )
+            if self.power_cache != expected_powers:
+                raise Exception(
+                    f"Stale power cache of {self.get_info()}, cached {self.power_cache} expected {expected_powers}"
+                )
+        return self.power_cache
+
     def get_power(self):
-        return CharacterPower.get_power(self.get_final_stat())
+        return self.get_cached_powers()[0]
 
     def get_max_power(self):
-        return CharacterPower.get_max_power(self.get_final_stat())
+        return self.get_cached_powers()[1]
 
     def get_detailed_power(self):
         return CharacterPower.get_detailed_character_power(self)
@@ -265,6 +396,14 @@ class Character(GameObject):
 
     def set_character_action(self, character_action):
         self.character_action_management.set(character_action, self)
+        self.mark_data_changed()
+
+    # Combat of the current combat action, None when not fighting
+    def get_combat_event_id(self):
+        character_action = self.get_character_action()
+        if isinstance(character_action, CombatCharacterAction):
+            return character_action.get_combat_event_id()
+        return None
 
     def enter_combat(self, combat_event_id):
         self.set_character_action(
@@ -282,7 +421,7 @@ class Character(GameObject):
         health_ratio = self.get_final_stat().get_health_ratio()
         if health_ratio < 0.25:
             logger.debug(
-                f"{self.get_info()} suffered from HeavyInjury after exit combat"
+                "%s suffered from HeavyInjury after exit combat", self.get_info()
             )
             self.character_status.add_status(HeavyInjury(5))
             # TODO: Later add more complexity or consider about refactoring
@@ -300,7 +439,7 @@ class Character(GameObject):
             )
         elif health_ratio < 0.5:
             logger.debug(
-                f"{self.get_info()} suffered from LightInjury after exit combat"
+                "%s suffered from LightInjury after exit combat", self.get_info()
             )
             self.character_status.add_status(LightInjury(5))
             self.add_goal(
@@ -341,6 +480,13 @@ class Character(GameObject):
         # Decrease all statuses' duration by one, only for status that can be expired overtime
         self.character_status.change_duration(-1)
 
+        # Keep the combat power totals up to date with the power changed by this action
+        combat_event_id = self.get_combat_event_id()
+        if combat_event_id is not None:
+            combat_event = get_store().get(EntityType.EVENT, combat_event_id)
+            if combat_event:
+                combat_event.update_character_power(self)
+
         # Check goal is done yet
         if self.character_goal.has_goal():
             self.check_done_current_goal()
@@ -361,19 +507,15 @@ class Character(GameObject):
                     return False, [ActionResult.JOIN_COMBAT]
 
         # Enter a tile with other characters standing on it, may cause a combat event happen
-        all_characters = [
-            store.get(EntityType.CHARACTER, cid)
-            for cid in new_tile.get_character_ids()
-            if cid != self.get_info().id
-        ]
+        spatial_index = store.get(EntityType.GRID, 0).get_spatial_index()
         hostile_faction_to_characters = {}
         for hostile_faction in self.get_hostile_races():
-            hostile_faction_to_characters[hostile_faction] = []
-            for other_character in all_characters:
-                if other_character.get_race() == hostile_faction:
-                    hostile_faction_to_characters[hostile_faction].append(
-                        other_character
-                    )
+            hostile_faction_to_characters[hostile_faction] = [
+                store.get(EntityType.CHARACTER, cid)
+                for cid in spatial_index.get_character_ids_at(
+                    self.pos, factions=(hostile_faction,)
+                )
+            ]
         for hostile_faction in self.get_hostile_races():
             if len(hostile_faction_to_characters[hostile_faction]) > 0:
                 new_combat_event: CombatEvent = CombatEvent(new_tile.get_id())
@@ -453,17 +595,20 @@ class Character(GameObject):
 
     def add_behavior(self, key, behavior):
         logger.debug(
-            f"{self.get_info()} added behavior '{key}':'{behavior.__class__.__name__}'"
+            "%s added behavior '%s':'%s'",
+            self.get_info(),
+            key,
+            behavior.__class__.__name__,
         )
         self.behaviors[key] = behavior
 
     # -------------------- GOAL ----------------------------------------------------------
 
-    def add_goal(self, priority: int, goal):
-        priority = self.character_goal.add(priority, goal)
-        if priority <= 1:
+    def add_goal(self, priority, goal):
+        handle = self.character_goal.add(priority, goal)
+        if handle and not isinstance(priority, PriorityDictItem):
             self.character_action_management.on_new_goal_added(self)
-        return priority
+        return handle
 
     def has_goal(self):
         return self.character_goal.has_goal()
@@ -510,7 +655,8 @@ class Character(GameObject):
             )
             if after_power > before_power:
                 logger.debug(
-                    f"The new collected equipment {item.get_name()} is stronger than current, apply it"
+                    "The new collected equipment %s is stronger than current, apply it",
+                    item.get_name(),
                 )
                 self.equip(item)
         elif on_add_item_action is OnAddItemAction.CAN_CONSUME_ITEM:
@@ -524,7 +670,7 @@ class Character(GameObject):
             )
         self.get_character_inventory().remove_item(equipment_name)
         self.get_character_equipment().equip(equipment)
-        logger.debug(f"Character equipped {equipment.get_name()}")
+        logger.debug("Character equipped %s", equipment.get_name())
         # get_world_notification_manager().publish(
         #     WorldNotificationType.CHARACTER.CHANGE_INFO, self.get_id()
         # )
@@ -573,7 +719,10 @@ class Character(GameObject):
 
             reason_string = [f"{key.name}: {value}" for key, value in requires.items()]
             logger.debug(
-                f"{self.get_info()} cannot unlock Archetype {archetype.get_name()}, requiments has not met: {reason_string}"
+                "%s cannot unlock Archetype %s, requiments has not met: %s",
+                self.get_info(),
+                archetype.get_name(),
+                reason_string,
             )
             required_attrs = requires.get(Archetype.UnlockType.REQUIRE_ATTRIBUTES, None)
             if required_attrs:
@@ -606,8 +755,10 @@ class Character(GameObject):
 
     def use_skill(self, skill):
         energy_cost = skill.get_energy_cost()
-        self.character_stats.get_stat(StatDefinition.CURRENT_ENERGY).modify_with_value(
-            -energy_cost, NumericalStat.NumericalType.REAL
+        self.character_stats.modify_stat_with_value(
+            StatDefinition.CURRENT_ENERGY,
+            -energy_cost,
+            NumericalStat.NumericalType.REAL,
         )
         return True
 
@@ -634,7 +785,33 @@ class Character(GameObject):
     def get_exp_visualization(self):
         return self.get_level().get_exp_visualization()
 
+    def get_info_string_key(self):
+        # Only the values shown by the info string, the action bar is keyed by its filled blocks
+        return (
+            int((1 - self.action_percentage) * 20),
+            self.level.current_level,
+            self.level.current_exp,
+            self.character_stats.get_final_stat_key(self),
+            self.character_attributes.get_version(),
+            len(self.character_archetype.get_archetypes()),
+            len(self.character_archetype.get_skills()),
+            self.get_current_goal() if self.character_goal.has_goal() else None,
+        )
+
     def get_character_detailed_info_string(self):
+        info_string_key = self.get_info_string_key()
+        if self.info_string_cache_key != info_string_key:
+            self.info_string_cache = self.compute_character_detailed_info_string()
+            self.info_string_cache_key = info_string_key
+        elif SIMULATION.VERIFY_CACHES:
+            expected_info_string = self.compute_character_detailed_info_string()
+            if self.info_string_cache != expected_info_string:
+                raise Exception(
+                    f"Stale info string of {self.get_info()}, cached {self.info_string_cache} expected {expected_info_string}"
+                )
+        return self.info_string_cache
+
+    def compute_character_detailed_info_string(self):
         # TODO: Some like equipments and buffs should be displayed as icon instead of raw text
         return (
             f"Action: {self.get_action_percentage_visualization()} | "
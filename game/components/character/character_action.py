@@ -1,5 +1,5 @@
-import numpy
 from enum import Enum
+from functools import lru_cache
 import copy
 
 from components.action.action import (
@@ -16,8 +16,11 @@ from components.action.action import (
 )
 from components.character.character_behavior import FightingBehavior
 from components.character.character_stat import StatDefinition
+from components.utils.random_utils import WeightedSampler
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class ActionType(Enum):
@@ -41,6 +44,8 @@ class CharacterAction:
         self.actions = {}
         self.base_actions = {}
         self.kwargs = kwargs
+        # Sampler of self.actions, rebuilt only after the probabilities changed
+        self.action_sampler: WeightedSampler = None
 
         # TODO: this is a workaround for a bug
         # When character actively set the new character action (combat, find item)
@@ -69,19 +74,60 @@ class CharacterAction:
     def get_modified_actions(self, character):
         return self.actions
 
+    def get_action_sampler(self, actions):
+        if actions is self.actions:
+            if self.action_sampler is None:
+                self.action_sampler = CharacterAction.get_shared_action_sampler(
+                    CharacterAction.get_action_probabilities_key(actions)
+                )
+            return self.action_sampler
+        # Temporary actions from get_modified_actions
+        return CharacterAction.get_shared_action_sampler(
+            CharacterAction.get_action_probabilities_key(actions)
+        )
+
+    @staticmethod
+    def get_action_probabilities_key(actions):
+        return tuple((at["class"], at["prob"]) for at in actions.values())
+
+    # Samplers are shared between every character action having the same probabilities
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def get_shared_action_sampler(action_probabilities_key):
+        return WeightedSampler(
+            [action_class for action_class, _ in action_probabilities_key],
+            [prob for _, prob in action_probabilities_key],
+        )
+
     def get_next_action(self, character):
         modified_actions = self.get_modified_actions(character)
-        action_list = [at["class"] for at in modified_actions.values()]
-        prob_list = [at["prob"] for at in modified_actions.values()]
-        next_action_id = numpy.random.choice(
-            numpy.arange(0, len(action_list)),
-            p=[ap / 100 for ap in prob_list],
-        )
-        return action_list[next_action_id]
+        return self.get_action_sampler(modified_actions).sample()
+
+    @staticmethod
+    def get_next_actions(characters):
+        """
+        Draw the next action of many characters at once, one vectorized draw for each
+        distinct action sampler. Returns the action classes in the order of the characters.
+        """
+        character_indices_by_sampler = {}
+        for idx, character in enumerate(characters):
+            character_action = character.get_character_action()
+            sampler = character_action.get_action_sampler(
+                character_action.get_modified_actions(character)
+            )
+            character_indices_by_sampler.setdefault(sampler, []).append(idx)
+
+        next_actions = [None] * len(characters)
+        for sampler, character_indices in character_indices_by_sampler.items():
+            sampled_actions = sampler.sample_many(len(character_indices))
+            for idx, action in zip(character_indices, sampled_actions):
+                next_actions[idx] = action
+        return next_actions
 
     def set_action_probabilities(self, action_prob_dict):
         for action_type, new_prob in action_prob_dict.items():
             self.actions[action_type] = new_prob
+        self.action_sampler = None
 
     def do_action(self, character):
         next_action = self.get_next_action(character)
@@ -116,7 +162,7 @@ class CharacterAction:
         """
         # Validate target action
         if target not in self.base_actions:
-            logger.debug(f"Cannot find action '{target}' in base actions.")
+            logger.debug("Cannot find action '%s' in base actions.", target)
             return
 
         # Determine the new probability for the target action
@@ -183,14 +229,15 @@ class CharacterAction:
                 self.actions[action_type]["prob"] = new_prob
                 total_assigned_prob += new_prob
         else:
-            logger.debug(f"Invalid mode '{mode}'. Use 'multiply' or 'fixed'.")
+            logger.debug("Invalid mode '%s'. Use 'multiply' or 'fixed'.", mode)
             return
 
         # Assign remaining probability to the last action
         if last_action_type:
             self.actions[last_action_type]["prob"] = max(0, 100 - total_assigned_prob)
+        self.action_sampler = None
 
-        logger.debug(f"Modified probabilities for action '{target}': {self.actions}")
+        logger.debug("Modified probabilities for action '%s': %s", target, self.actions)
 
     def on_change(self):
         # Trigger when the character action is being replaced
@@ -201,7 +248,8 @@ class CharacterAction:
         #     self.is_applied_goal = False
         #     logger.debug(f"Reset applied goal")
         self.actions = copy.deepcopy(self.base_actions)
-        logger.debug(f"Reset probabilities: {self.actions}")
+        self.action_sampler = None
+        logger.debug("Reset probabilities: %s", self.actions)
 
     def set_kwargs(self, key, value):
         self.kwargs[key] = value
@@ -262,6 +310,9 @@ class CombatCharacterAction(CharacterAction):
         else:
             self.escape_threshold = 0.25
 
+    def get_combat_event_id(self):
+        return self.kwargs.get("combat_event_id")
+
     def get_modified_actions(self, character):
         health_ratio = character.get_character_stat().get_health_ratio()
         if health_ratio < self.escape_threshold:
@@ -307,4 +358,4 @@ class FindItemCharacterAction(CharacterAction):
     def on_action_done(self):
         self.attempt_counter += 1
         if self.attempt_counter <= self.max_attempt:
-            logger.debug(f"Search attempt: {self.attempt_counter}")
+            logger.debug("Search attempt: %s", self.attempt_counter)
@@ -8,7 +8,9 @@ from components.character.character_action import (
 from components.action.goal.character_goal import CharacterGoalStatus, CharacterGoal
 
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class CharacterActionManagement:
@@ -29,7 +31,9 @@ class CharacterActionManagement:
         self.on_start_character_action(character)
 
         logger.debug(
-            f"{character.get_info()} has changed character action to {character_action.get_name()}"
+            "%s has changed character action to %s",
+            character.get_info(),
+            character_action.get_name(),
         )
 
     def check_and_apply_goal(self, character):
@@ -1,13 +1,19 @@
 from components.item.equipment import Equipment, EquipmentType
 
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class CharacterEquipment:
     def __init__(self) -> None:
         self.weapon: Equipment = None
         self.armor: Equipment = None
+        self.version = 0
+
+    def get_version(self):
+        return self.version
 
     def get_weapon(self):
         return self.weapon
@@ -29,9 +35,11 @@ class CharacterEquipment:
 
     def equip_weapon(self, weapon: Equipment):
         self.weapon = weapon
+        self.version += 1
 
     def equip_armor(self, armor: Equipment):
         self.armor = armor
+        self.version += 1
 
     def clone(self):
         new_character_equipment = CharacterEquipment()
@@ -3,7 +3,9 @@ from enum import Enum
 from components.item.equipment import EquipmentType
 from components.item.item import Item
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class OnAddItemAction(Enum):
@@ -34,12 +36,15 @@ class CharacterInventory:
             # TODO: get the most suitable/powerful version of the item if there are multiple duplicated item
             self.items[item_name].pop(0)
             logger.debug(
-                f"Successfully remove one item {item_name} from the character inventory, left {len(self.items[item_name])} coppies"
+                "Successfully remove one item %s from the character inventory, left %s coppies",
+                item_name,
+                len(self.items[item_name]),
             )
             if len(self.items[item_name]) == 0:
                 self.items.pop(item_name)
                 logger.debug(
-                    f"Successfully remove the whole item {item_name} from the character inventory"
+                    "Successfully remove the whole item %s from the character inventory",
+                    item_name,
                 )
 
     def get_equipment_by_types(self, equipment_type: EquipmentType):
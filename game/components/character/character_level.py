@@ -1,5 +1,7 @@
 from components.character.class_level import ClassLevel
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class CharacterLevel:
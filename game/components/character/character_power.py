@@ -2,7 +2,9 @@ import copy
 
 from components.character.character_stat import StatDefinition, CharacterStat
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class CharacterPower:
@@ -56,7 +58,10 @@ class CharacterPower:
         )
 
         logger.debug(
-            f"Power before and after equip {target_equipment.get_name()}: {before_equipment_applied_stat_power} and {after_equipment_applied_stat_power}"
+            "Power before and after equip %s: %s and %s",
+            target_equipment.get_name(),
+            before_equipment_applied_stat_power,
+            after_equipment_applied_stat_power,
         )
 
         return before_equipment_applied_stat_power, after_equipment_applied_stat_power
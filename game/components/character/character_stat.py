@@ -2,11 +2,14 @@ import random
 from enum import Enum
 import copy
 
-from components.character.stat import NumericalStat, CategoricalStat, Stat
+from components.character.stat import NumericalStat, CategoricalStat, Stat, ColumnStat
 from components.utils.visualization_converter import convert_to_progress_string
 
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+from data.game_settings import SIMULATION
+
+logger = get_logger(__name__)
 
 
 class StatDefinition(Enum):
@@ -33,6 +36,18 @@ stat_class = {
     StatDefinition.RESISTANCE: NumericalStat,
 }
 
+# Columns of the character table holding the base stats of the bound character stats
+stat_columns = {
+    StatDefinition.MAX_HEALTH: "max_health",
+    StatDefinition.CURRENT_HEALTH: "current_health",
+    StatDefinition.MAX_ENERGY: "max_energy",
+    StatDefinition.CURRENT_ENERGY: "current_energy",
+    StatDefinition.POWER: "power",
+    StatDefinition.SPEED: "speed",
+    StatDefinition.DEFENSE: "defense",
+    StatDefinition.REGENATION: "regeneration",
+}
+
 
 class CharacterStat:
     def __init__(self, stats_list=None, character_attr=None) -> None:
@@ -40,9 +55,60 @@ class CharacterStat:
             self.stats_list = stats_list
         else:
             self.stats_list = {}
+        # Bumped on every change of the base stats, used as a part of the final stat cache key
+        self.version = 0
+        # Row of the character table holding the base stats and the version, None when unbound
+        self.table = None
+        self.table_slot = None
+        self.final_stat_cache = None
+        self.final_stat_cache_key = None
         if character_attr:
             self.apply_character_attributes(character_attr)
 
+    def get_version(self):
+        if self.table is not None:
+            return self.table.get_value("stat_version", self.table_slot)
+        return self.version
+
+    def on_stat_changed(self):
+        if self.table is not None:
+            self.table.set_value(
+                "stat_version", self.table_slot, self.get_version() + 1
+            )
+        else:
+            self.version += 1
+
+    # The table row stays in its process, the stats travel as plain values
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self.table is not None:
+            state["stats_list"] = {
+                stat_def: stat.clone() for stat_def, stat in self.stats_list.items()
+            }
+            state["version"] = self.get_version()
+            state["table"] = None
+            state["table_slot"] = None
+        return state
+
+    def bind_table(self, table, slot):
+        # Moves the stat values into the table row, the stats read and write it from now on
+        self.table = table
+        self.table_slot = slot
+        self.table.set_value("stat_version", slot, self.version)
+        for stat_def, stat in list(self.stats_list.items()):
+            self.set_stat(stat_def, stat)
+
+    def set_stat(self, stat_def: StatDefinition, stat: NumericalStat):
+        if self.table is not None and stat_def in stat_columns:
+            stat = ColumnStat(
+                self.table,
+                stat_columns[stat_def],
+                self.table_slot,
+                stat.value,
+                **{NumericalStat.numerical_type_key: stat.numerical_type},
+            )
+        self.stats_list[stat_def] = stat
+
     def clone(self):
         new_stats_list = {}
         for stat_def, stat in self.stats_list.items():
@@ -84,8 +150,9 @@ class CharacterStat:
             if stat_def in self.stats_list:
                 self.get_stat(stat_def).modify(stat)
             else:
-                self.stats_list[stat_def] = stat
-            logger.debug(f"Character gained {stat_def.name}={stat}")
+                self.set_stat(stat_def, stat)
+            logger.debug("Character gained %s=%s", stat_def.name, stat)
+        self.on_stat_changed()
 
     def apply_character_attributes(self, character_attr):
         final_attrs = character_attr.get_final_attributes()
@@ -97,22 +164,29 @@ class CharacterStat:
                     if stat_def in self.stats_list:
                         self.get_stat(stat_def).modify(stat)
                     else:
-                        self.stats_list[stat_def] = stat
+                        self.set_stat(stat_def, stat)
 
         # TODO: Currently inefficiently when first initialization, we need to set current health/energy = max health/energy
-        self.stats_list[StatDefinition.CURRENT_HEALTH] = CharacterStat.create_stat(
+        self.set_stat(
             StatDefinition.CURRENT_HEALTH,
-            self.get_stat_value(StatDefinition.MAX_HEALTH),
-            **{NumericalStat.numerical_type_key: NumericalStat.NumericalType.REAL},
+            CharacterStat.create_stat(
+                StatDefinition.CURRENT_HEALTH,
+                self.get_stat_value(StatDefinition.MAX_HEALTH),
+                **{NumericalStat.numerical_type_key: NumericalStat.NumericalType.REAL},
+            ),
         )
-        self.stats_list[StatDefinition.CURRENT_ENERGY] = CharacterStat.create_stat(
+        self.set_stat(
             StatDefinition.CURRENT_ENERGY,
-            self.get_stat_value(StatDefinition.MAX_ENERGY),
-            **{NumericalStat.numerical_type_key: NumericalStat.NumericalType.REAL},
+            CharacterStat.create_stat(
+                StatDefinition.CURRENT_ENERGY,
+                self.get_stat_value(StatDefinition.MAX_ENERGY),
+                **{NumericalStat.numerical_type_key: NumericalStat.NumericalType.REAL},
+            ),
         )
+        self.on_stat_changed()
 
         logger.debug(
-            f"Applied new character attributes: {character_attr}, new stats: {self}"
+            "Applied new character attributes: %s, new stats: %s", character_attr, self
         )
 
     @staticmethod
@@ -123,7 +197,8 @@ class CharacterStat:
         if stat_def in self.stats_list:
             raise Exception(f"Already added the stat type '{stat_def}'")
         new_stat = CharacterStat.create_stat(stat_def, value)
-        self.stats_list[stat_def] = new_stat
+        self.set_stat(stat_def, new_stat)
+        self.on_stat_changed()
 
     def get_stat(self, stat_def: StatDefinition, force=True):
         if stat_def in self.stats_list:
@@ -143,6 +218,18 @@ class CharacterStat:
             else:
                 return 0
 
+    def get_stat_values(self):
+        return {stat_def: stat.value for stat_def, stat in self.stats_list.items()}
+
+    def modify_stat_with_value(
+        self,
+        stat_def: StatDefinition,
+        value,
+        numerical_type: NumericalStat.NumericalType,
+    ):
+        self.get_stat(stat_def).modify_with_value(value, numerical_type)
+        self.on_stat_changed()
+
     def update_stat(self, stat_def: StatDefinition, value):
         if stat_def in self.stats_list:
             if not isinstance(value, Stat):
@@ -162,6 +249,7 @@ class CharacterStat:
                     self.stats_list[StatDefinition.MAX_ENERGY].value,
                     self.stats_list[stat_def].value,
                 )
+            self.on_stat_changed()
         else:
             raise Exception(f"No {stat_def} found")
 
@@ -201,7 +289,8 @@ class CharacterStat:
 
         return applied_character_stat
 
-    def get_final_stat(self, character):
+    # Uncached final stat, base stats with equipments then statuses applied
+    def compute_final_stat(self, character):
         equipment_applied_character_stat = self.get_applied_equipments_character_stat(
             character.get_character_equipment()
         )
@@ -212,16 +301,43 @@ class CharacterStat:
             equipment_applied_character_stat, character.get_character_status()
         )
 
-    def get_health_ratio(self):
+    def get_final_stat_key(self, character):
         return (
-            self.get_stat(StatDefinition.CURRENT_HEALTH).value
-            / self.get_stat(StatDefinition.MAX_HEALTH).value
+            self.get_version(),
+            character.get_character_equipment().get_version(),
+            character.get_character_status().get_version(),
+        )
+
+    def get_final_stat(self, character):
+        """
+        Final stat memoized until the base stats, the equipments or the statuses change.
+        The returned stat is shared and read-only, clone it before modifying.
+        """
+        final_stat_key = self.get_final_stat_key(character)
+        if self.final_stat_cache_key != final_stat_key:
+            self.final_stat_cache = ReadOnlyCharacterStat(
+                self.compute_final_stat(character).stats_list
+            )
+            self.final_stat_cache_key = final_stat_key
+        elif SIMULATION.VERIFY_CACHES:
+            expected_final_stat = self.compute_final_stat(character)
+            if (
+                self.final_stat_cache.get_stat_values()
+                != expected_final_stat.get_stat_values()
+            ):
+                raise Exception(
+                    f"Stale final stat cache, cached '{self.final_stat_cache}' expected '{expected_final_stat}'"
+                )
+        return self.final_stat_cache
+
+    def get_health_ratio(self):
+        return self.get_stat_value(StatDefinition.CURRENT_HEALTH) / self.get_stat_value(
+            StatDefinition.MAX_HEALTH
         )
 
     def get_energy_ratio(self):
-        return (
-            self.get_stat(StatDefinition.CURRENT_ENERGY).value
-            / self.get_stat(StatDefinition.MAX_ENERGY).value
+        return self.get_stat_value(StatDefinition.CURRENT_ENERGY) / self.get_stat_value(
+            StatDefinition.MAX_ENERGY
         )
 
     def get_health_visualization(self):
@@ -239,3 +355,30 @@ class CharacterStat:
                 for stat_def, stat in list(self.stats_list.items())
             ]
         )
+
+
+class ReadOnlyCharacterStat(CharacterStat):
+    # Shared view of a cached final stat, every modification has to go through the base stat
+    def get_stat(self, stat_def: StatDefinition, force=True):
+        stat = super().get_stat(stat_def, force)
+        return stat.clone() if stat else stat
+
+    def on_stat_changed(self):
+        raise Exception(
+            f"{self.__class__.__name__} is read-only, modify the base character stat instead"
+        )
+
+    def update_stat_with_new_attribute_gained(self, attr):
+        self.on_stat_changed()
+
+    def apply_character_attributes(self, character_attr):
+        self.on_stat_changed()
+
+    def add_stat(self, stat_def: StatDefinition, value):
+        self.on_stat_changed()
+
+    def update_stat(self, stat_def: StatDefinition, value):
+        self.on_stat_changed()
+
+    def modify_stat_with_value(self, stat_def: StatDefinition, value, numerical_type):
+        self.on_stat_changed()
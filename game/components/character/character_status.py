@@ -1,11 +1,18 @@
 from components.character.status import Status
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class CharacterStatus:
     def __init__(self) -> None:
         self.statuses = {}  # StatusClass-Status
+        # Bumped when a status is added or removed, extending a duration keeps the version
+        self.version = 0
+
+    def get_version(self):
+        return self.version
 
     def add_status(self, status: Status):
         status_class = status.get_status_class()
@@ -17,14 +24,20 @@ class CharacterStatus:
                 >= status.get_status_level()
             ):
                 logger.debug(
-                    f"Extend the {self.statuses[status_class].__class__.__name__} with {status.__class__.__name__} to {status_duration} turns"
+                    "Extend the %s with %s to %s turns",
+                    self.statuses[status_class].__class__.__name__,
+                    status.__class__.__name__,
+                    status_duration,
                 )
                 self.statuses[status_class].set_duration(status_duration)
         else:
             logger.debug(
-                f"Add new status {status.__class__.__name__} for {status_duration} turns"
+                "Add new status %s for %s turns",
+                status.__class__.__name__,
+                status_duration,
             )
             self.statuses[status_class] = status
+            self.version += 1
 
     def get_statuses(self):
         return self.statuses
@@ -40,7 +53,9 @@ class CharacterStatus:
             if status.is_expired()
         }
         for expired_status_name in expired_statuses.keys():
-            logger.debug(f"{expired_status_name} has expired")
+            logger.debug("%s has expired", expired_status_name)
+        if expired_statuses:
+            self.version += 1
 
         self.statuses = {
             status_name: status
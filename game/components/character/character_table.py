@@ -0,0 +1,205 @@
+import numpy
+
+from components.common.point import Point
+from components.character.character_stat import stat_columns
+
+INITIAL_CAPACITY = 256
+
+COLUMN_TYPES = {
+    **{column: numpy.float64 for column in stat_columns.values()},
+    "character_id": numpy.int64,
+    "pos_x": numpy.int32,
+    "pos_y": numpy.int32,
+    "level": numpy.int32,
+    "faction": numpy.int16,
+    "alive": bool,
+    "next_action_tick": numpy.int64,
+    "stat_version": numpy.int64,
+}
+
+
+class CharacterTable:
+    """
+    Struct-of-arrays state of every character, one row per slot.
+
+    The base stats, the stat version and the alive flag are read and written through the
+    table by the bound CharacterStat and Character. The position, the level and the next
+    action tick are written through on every change, the characters keep reading their own.
+    Whole-population passes like regeneration, death checks and due actions run as
+    vectorized operations over the columns instead of walking the object graphs.
+    """
+
+    def __init__(self, capacity=INITIAL_CAPACITY) -> None:
+        self.capacity = capacity
+        self.size = 0
+        self.slots: dict[int, int] = {}
+        # Rows of the characters removed from the table, reused by the next additions
+        self.free_slots: list[int] = []
+        self.faction_ids: dict[str, int] = {}
+        self.columns = {
+            column: numpy.zeros(capacity, dtype=column_type)
+            for column, column_type in COLUMN_TYPES.items()
+        }
+
+    def reset(self):
+        self.size = 0
+        self.slots.clear()
+        self.free_slots.clear()
+        self.faction_ids.clear()
+
+    def get_faction_id(self, faction):
+        if faction not in self.faction_ids:
+            self.faction_ids[faction] = len(self.faction_ids)
+        return self.faction_ids[faction]
+
+    def grow(self):
+        self.capacity *= 2
+        for column, values in self.columns.items():
+            grown_values = numpy.zeros(self.capacity, dtype=values.dtype)
+            grown_values[: self.size] = values[: self.size]
+            self.columns[column] = grown_values
+
+    def add(self, character_id, faction, pos: Point, level: int):
+        if character_id in self.slots:
+            raise Exception(
+                f"Character {character_id} is already in the character table"
+            )
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.size == self.capacity:
+                self.grow()
+            slot = self.size
+            self.size += 1
+        self.slots[character_id] = slot
+
+        columns = self.columns
+        columns["character_id"][slot] = character_id
+        columns["pos_x"][slot] = pos.x
+        columns["pos_y"][slot] = pos.y
+        columns["level"][slot] = level
+        columns["faction"][slot] = self.get_faction_id(faction)
+        columns["alive"][slot] = True
+        columns["next_action_tick"][slot] = -1
+        for column in stat_columns.values():
+            columns[column][slot] = 0
+        columns["stat_version"][slot] = 0
+        return slot
+
+    def remove(self, character_id):
+        if character_id not in self.slots:
+            raise Exception(f"Character {character_id} is not in the character table")
+        slot = self.slots.pop(character_id)
+        self.columns["character_id"][slot] = -1
+        self.columns["alive"][slot] = False
+        self.columns["next_action_tick"][slot] = -1
+        self.free_slots.append(slot)
+
+    def has(self, character_id):
+        return character_id in self.slots
+
+    def get_slot(self, character_id):
+        return self.slots[character_id]
+
+    def get_column(self, column):
+        # View of the used rows, reallocated when the table grows so do not keep it around
+        return self.columns[column][: self.size]
+
+    def get_value(self, column, slot):
+        # Stats are declared as int and float values, whole values are read back as int
+        value = self.columns[column][slot].item()
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    def set_value(self, column, slot, value):
+        self.columns[column][slot] = value
+
+    def set_position(self, slot, pos: Point):
+        self.columns["pos_x"][slot] = pos.x
+        self.columns["pos_y"][slot] = pos.y
+
+    def is_alive(self, slot):
+        return bool(
+            self.columns["alive"][slot] and self.columns["current_health"][slot] > 0
+        )
+
+    def get_character_ids(self, slots):
+        return self.columns["character_id"][slots].tolist()
+
+    # -------------------- VECTORIZED PASSES ----------------------------------------------------------
+
+    def get_alive_mask(self):
+        return self.get_column("alive") & (self.get_column("current_health") > 0)
+
+    def get_dying_slots(self):
+        """Slots still flagged alive while their health already dropped to zero."""
+        return numpy.flatnonzero(
+            self.get_column("alive") & (self.get_column("current_health") <= 0)
+        )
+
+    def get_due_slots(self, tick: int):
+        next_action_ticks = self.get_column("next_action_tick")
+        return numpy.flatnonzero(
+            self.get_alive_mask()
+            & (next_action_ticks >= 0)
+            & (next_action_ticks <= tick)
+        )
+
+    def regenerate(self, slots=None):
+        """
+        Recover the regeneration value of health and energy, capped by their max values,
+        for the given slots or every alive character.
+        """
+        if slots is None:
+            slots = numpy.flatnonzero(self.get_alive_mask())
+        columns = self.columns
+        regeneration = columns["regeneration"][slots]
+        columns["current_health"][slots] = numpy.minimum(
+            columns["max_health"][slots],
+            columns["current_health"][slots] + regeneration,
+        )
+        columns["current_energy"][slots] = numpy.minimum(
+            columns["max_energy"][slots],
+            columns["current_energy"][slots] + regeneration,
+        )
+        columns["stat_version"][slots] += 1
+
+    def get_faction_mask(self, is_alive=True):
+        mask = self.get_alive_mask()
+        if not is_alive:
+            mask = ~mask & (self.get_column("character_id") >= 0)
+        return mask
+
+    def count_by_faction(self, is_alive=True):
+        mask = self.get_faction_mask(is_alive)
+        counts = numpy.bincount(
+            self.get_column("faction")[mask], minlength=len(self.faction_ids)
+        )
+        return {
+            faction: int(counts[faction_id])
+            for faction, faction_id in self.faction_ids.items()
+            if counts[faction_id]
+        }
+
+    def get_average_level_by_faction(self, is_alive=True):
+        mask = self.get_faction_mask(is_alive)
+        factions = self.get_column("faction")[mask]
+        counts = numpy.bincount(factions, minlength=len(self.faction_ids))
+        level_sums = numpy.bincount(
+            factions,
+            weights=self.get_column("level")[mask],
+            minlength=len(self.faction_ids),
+        )
+        return {
+            faction: float(level_sums[faction_id] / counts[faction_id])
+            for faction, faction_id in self.faction_ids.items()
+            if counts[faction_id]
+        }
+
+
+character_table = CharacterTable()
+
+
+def get_character_table():
+    return character_table
@@ -69,5 +69,35 @@ class NumericalStat(Stat):
         )
 
 
+class ColumnStat(NumericalStat):
+    """
+    Numerical stat whose value lives in a column of the character table, the table is
+    read and written on every access so vectorized passes see and change the same value.
+    """
+
+    def __init__(self, table, column, slot, value, **kwargs) -> None:
+        self.table = table
+        self.column = column
+        self.slot = slot
+        super().__init__(value, **kwargs)
+
+    @property
+    def value(self):
+        return self.table.get_value(self.column, self.slot)
+
+    @value.setter
+    def value(self, value):
+        self.table.set_value(self.column, self.slot, value)
+
+    # Modified in place, a new NumericalStat would detach the stat from its column
+    def __iadd__(self, other: "NumericalStat"):
+        if isinstance(other, NumericalStat):
+            if self.numerical_type != other.numerical_type:
+                raise Exception(f"NumericalType need to be the same to use addition")
+            self.value += other.value
+            return self
+        return NotImplemented
+
+
 class CategoricalStat(Stat):
     pass
@@ -4,7 +4,9 @@ from components.character.stat import NumericalStat
 from enum import Enum
 
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class StatusType(Enum):
@@ -0,0 +1,132 @@
+import numpy
+
+# Transforms from the local octant coordinates (dx, dy) to the grid coordinates
+# x = cx + dx * xx + dy * xy, y = cy + dx * yx + dy * yy
+OCTANT_TRANSFORMS = (
+    (1, 0, 0, 1),
+    (0, 1, 1, 0),
+    (0, -1, 1, 0),
+    (-1, 0, 0, 1),
+    (-1, 0, 0, -1),
+    (0, -1, -1, 0),
+    (0, 1, -1, 0),
+    (1, 0, 0, -1),
+)
+
+_diamond_offsets = {}
+
+
+def get_diamond_offsets(radius: int):
+    """
+    Offsets of every point within the Manhattan distance `radius`, excluding the origin.
+    Computed once per radius and shared by every caller.
+    """
+    if radius not in _diamond_offsets:
+        dx, dy = numpy.mgrid[-radius : radius + 1, -radius : radius + 1]
+        dx, dy = dx.ravel(), dy.ravel()
+        mask = (numpy.abs(dx) + numpy.abs(dy) <= radius) & ((dx != 0) | (dy != 0))
+        offsets = numpy.stack((dx[mask], dy[mask]), axis=1).astype(numpy.int32)
+        offsets.setflags(write=False)
+        _diamond_offsets[radius] = offsets
+    return _diamond_offsets[radius]
+
+
+def get_visible_coordinates(blocking_map: numpy.ndarray, x: int, y: int, radius: int):
+    """
+    Compute the field of view from (x, y) on a boolean vision-blocking map.
+
+    Returns an (n, 2) int array of the visible (x, y) coordinates within the Manhattan
+    distance `radius`, excluding the origin. Blocking cells are visible themselves but
+    hide everything behind them.
+    """
+    width, height = blocking_map.shape
+    if radius <= 0:
+        return numpy.empty((0, 2), dtype=numpy.int32)
+
+    # Fast path: nothing blocks the vision around the origin, the diamond is fully visible
+    min_x, max_x = max(0, x - radius), min(width, x + radius + 1)
+    min_y, max_y = max(0, y - radius), min(height, y + radius + 1)
+    if not blocking_map[min_x:max_x, min_y:max_y].any():
+        points = get_diamond_offsets(radius) + (x, y)
+        in_bounds = (
+            (points[:, 0] >= 0)
+            & (points[:, 0] < width)
+            & (points[:, 1] >= 0)
+            & (points[:, 1] < height)
+        )
+        return points[in_bounds]
+
+    # Shadowcast inside the window around the origin only, in window-local coordinates
+    blocking = blocking_map[min_x:max_x, min_y:max_y].tolist()
+    local_x, local_y = x - min_x, y - min_y
+    visible = set()
+    for transform in OCTANT_TRANSFORMS:
+        _cast_light(
+            blocking,
+            max_x - min_x,
+            max_y - min_y,
+            local_x,
+            local_y,
+            radius,
+            1,
+            1.0,
+            0.0,
+            transform,
+            visible,
+        )
+    visible.discard((local_x, local_y))
+    if not visible:
+        return numpy.empty((0, 2), dtype=numpy.int32)
+    return numpy.array(sorted(visible), dtype=numpy.int32) + (min_x, min_y)
+
+
+def _cast_light(
+    blocking, width, height, cx, cy, radius, row, start, end, transform, visible
+):
+    # Recursive shadowcasting over one octant, scanning rows outward from the origin
+    if start < end:
+        return
+    xx, xy, yx, yy = transform
+    new_start = start
+    for distance in range(row, radius + 1):
+        blocked = False
+        for dx in range(-distance, 1):
+            dy = -distance
+            left_slope = (dx - 0.5) / (dy + 0.5)
+            right_slope = (dx + 0.5) / (dy - 0.5)
+            if start < right_slope:
+                continue
+            if end > left_slope:
+                break
+
+            map_x = cx + dx * xx + dy * xy
+            map_y = cy + dx * yx + dy * yy
+            in_bounds = 0 <= map_x < width and 0 <= map_y < height
+            if in_bounds and abs(dx) + abs(dy) <= radius:
+                visible.add((map_x, map_y))
+
+            is_blocking = not in_bounds or blocking[map_x][map_y]
+            if blocked:
+                if is_blocking:
+                    new_start = right_slope
+                else:
+                    blocked = False
+                    start = new_start
+            elif is_blocking and distance < radius:
+                blocked = True
+                _cast_light(
+                    blocking,
+                    width,
+                    height,
+                    cx,
+                    cy,
+                    radius,
+                    distance + 1,
+                    start,
+                    left_slope,
+                    transform,
+                    visible,
+                )
+                new_start = right_slope
+        if blocked:
+            break
@@ -1,5 +1,3 @@
-from pygame import Surface
-
 from components.common.point import Point
 
 
@@ -7,9 +5,21 @@ class GameObject:
     def __init__(self, pos: Point, img: str):
         self.pos = pos
         self.img = img
+        self.image = None
 
-    def draw(self, screen: Surface):
+    def draw(self, screen):
         pass
 
     def get_pos(self):
         return self.pos
+
+    def get_image_path(self):
+        return self.img
+
+    # The sprite is only loaded when a renderer asks for it, so the simulation can run headless
+    def get_image(self):
+        if self.image is None and self.img:
+            import pygame
+
+            self.image = pygame.image.load(self.img)
+        return self.image
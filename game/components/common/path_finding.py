@@ -1,4 +1,4 @@
-from components.common.point import Point
+from components.common.point import Point, UP, DOWN, LEFT, RIGHT
 from components.world.store import get_store, EntityType
 from components.utils.tile_utils import get_tile_object
 
@@ -13,10 +13,40 @@ def check_valid_step(character, new_pos: Point):
 
 def get_move_from_target(character, current: Point, target: Point, is_chasing=True):
     """
-    Calculate the next move to either chase or escape from a target point in a 2D matrix,
-    prioritizing the axis with the greater distance difference.
+    Calculate the next move to either chase or escape from a target point in a 2D matrix.
+    Chasing follows the shortest path around obstacles and restricted tiles, escaping and
+    unreachable targets fall back to a greedy step on the axis with the greater distance.
     """
-    moves = [Point(0, -1), Point(0, 1), Point(-1, 0), Point(1, 0)]
+    if is_chasing:
+        path_finder = get_store().get(EntityType.GRID, 0).get_path_finder()
+        next_pos = path_finder.get_next_step(
+            character.get_restricted_tile_types(), current, target
+        )
+        if next_pos is not None:
+            return next_pos - current
+
+    return get_greedy_move_from_target(character, current, target, is_chasing)
+
+
+def get_move_to_location(character, current: Point, target: Point):
+    """
+    Next move toward a static location like a combat or an item tile. The flow field
+    toward the location is shared by every character heading there, unreachable
+    locations fall back to a greedy step.
+    """
+    flow_fields = get_store().get(EntityType.GRID, 0).get_flow_fields()
+    next_pos = flow_fields.get_next_step(
+        character.get_restricted_tile_types(), current, (target,)
+    )
+    if next_pos is not None:
+        return next_pos - current
+
+    return get_greedy_move_from_target(character, current, target)
+
+
+def get_greedy_move_from_target(
+    character, current: Point, target: Point, is_chasing=True
+):
     best_move = None
     base_distance = float("inf") if is_chasing else float("-inf")
 
@@ -26,9 +56,9 @@ def get_move_from_target(character, current: Point, target: Point, is_chasing=Tr
 
     # Determine dominant axis
     if delta_x > delta_y:
-        prioritized_moves = [Point(-1, 0), Point(1, 0)] + [Point(0, -1), Point(0, 1)]
+        prioritized_moves = (LEFT, RIGHT, UP, DOWN)
     else:
-        prioritized_moves = [Point(0, -1), Point(0, 1)] + [Point(-1, 0), Point(1, 0)]
+        prioritized_moves = (UP, DOWN, LEFT, RIGHT)
 
     for move in prioritized_moves:
         new_pos = current + move
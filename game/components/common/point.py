@@ -2,9 +2,46 @@ import math
 
 
 class Point:
+    """
+    Immutable 2D integer point, hashable so it can be used in sets and as a dict key.
+
+    Points inside the interned area are shared instances, Point.get and the arithmetic
+    operators return them instead of allocating a new point for every step.
+    """
+
+    __slots__ = ("x", "y", "hash")
+
+    # interned[x][y], covering the grid registered with intern_area
+    interned: list[list["Point"]] = []
+    interned_width = 0
+    interned_height = 0
+
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "hash", hash((x, y)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self):
+        return (Point.get, (self.x, self.y))
+
+    @classmethod
+    def intern_area(cls, width, height):
+        # Pre-build the points of a width x height grid, called when the grid is created
+        if width > cls.interned_width or height > cls.interned_height:
+            width = max(width, cls.interned_width)
+            height = max(height, cls.interned_height)
+            cls.interned = [[Point(x, y) for y in range(height)] for x in range(width)]
+            cls.interned_width = width
+            cls.interned_height = height
+
+    @classmethod
+    def get(cls, x, y) -> "Point":
+        if 0 <= x < cls.interned_width and 0 <= y < cls.interned_height:
+            return cls.interned[x][y]
+        return Point(x, y)
 
     @staticmethod
     def get_distance_man(A: "Point", B: "Point") -> int:
@@ -14,19 +51,28 @@ class Point:
     def get_distance_euc(A: "Point", B: "Point") -> float:
         return math.sqrt((A.x - B.x) ** 2 + (A.y - B.y) ** 2)
 
+    def get_neighbors(self):
+        return [self + offset for offset in NEIGHBOR_OFFSETS]
+
     def __add__(self, other):
         if isinstance(other, Point):
-            return Point(self.x + other.x, self.y + other.y)
+            return Point.get(self.x + other.x, self.y + other.y)
         return NotImplemented
 
     def __sub__(self, other):
         if isinstance(other, Point):
-            return Point(self.x - other.x, self.y - other.y)
+            return Point.get(self.x - other.x, self.y - other.y)
         return NotImplemented
 
+    def __neg__(self):
+        return Point.get(-self.x, -self.y)
+
     def __str__(self) -> str:
         return f"({self.x},{self.y})"
 
+    def __repr__(self) -> str:
+        return f"Point({self.x}, {self.y})"
+
     def __eq__(self, other):
         if isinstance(other, Point):
             return self.x == other.x and self.y == other.y
@@ -37,6 +83,15 @@ class Point:
             return not self.__eq__(other)
         return True
 
+    def __hash__(self):
+        return self.hash
+
     def reverse(self):
-        self.x = -self.x
-        self.y = -self.y
+        return -self
+
+
+UP = Point(0, -1)
+DOWN = Point(0, 1)
+LEFT = Point(-1, 0)
+RIGHT = Point(1, 0)
+NEIGHBOR_OFFSETS = (UP, DOWN, LEFT, RIGHT)
@@ -1,59 +1,72 @@
 import heapq
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class PriorityDictItem:
-    # Allow multiple values of a same key
-    def __init__(self, priority, value):
-        self.priority = priority
+    # Handle of an item, allow multiple values of a same key
+    # The order is a tuple compared lexicographically, a smaller order comes first
+    def __init__(self, order, key, value):
+        self.order = order
+        self.key = key
         self.value = value
+        self.removed = False
 
-    def set_priority(self, new_priority):
-        self.priority = new_priority
+    def get_order(self):
+        return self.order
 
-    def get_priority(self):
-        return self.priority
+    def get_key(self):
+        return self.key
 
     def get_value(self):
         return self.value
 
+    def is_removed(self):
+        return self.removed
+
+    def __lt__(self, other: "PriorityDictItem"):
+        return self.order < other.order
+
 
 class PriorityDict:
+    """
+    Heap of items ordered by relative ordering keys, indexed by key.
+
+    Pushing to the front or after another item never rewrites the existing orders:
+    front items take a decreasing top-level order, items inserted after a handle extend
+    the order of that handle, so (3,) < (3, -2) < (3, -1) < (4,).
+    Removal is lazy, removed handles are skipped when they reach the top of the heap.
+    """
+
     def __init__(self):
+        self.heap: list[PriorityDictItem] = []
         self.dict: dict[str, list[PriorityDictItem]] = {}
+        self.size = 0
+        self.front_counter = 0
+        self.child_counter = 0
 
-    def set(self, priority, key, value):
-        new_item = PriorityDictItem(priority, value)
+    def set(self, order, key, value):
+        new_item = PriorityDictItem(order, key, value)
+        heapq.heappush(self.heap, new_item)
         if key in self.dict:
             self.dict[key].append(new_item)
         else:
             self.dict[key] = [new_item]
-        logger.debug(f"Added item {key} to priority dict with priority {priority}")
-
-    def set_with_highest_priority(self, target_key, target_value):
-        highest_priority = float("inf")
-        for key, values in self.dict.items():
-            for value in values:
-                cur_priority = value.get_priority()
-                if cur_priority < highest_priority:
-                    highest_priority = cur_priority
-                value.set_priority(cur_priority + 1)
-        if highest_priority == float("inf"):
-            highest_priority = 1
-        self.set(highest_priority, target_key, target_value)
-        return highest_priority
-
-    # Push an item to the middle of the priority queue, after a specific priority
-    # Push away all the items has lower priority
-    def set_to_priority(self, priority, target_key, target_value):
-        for key, values in self.dict.items():
-            for value in values:
-                cur_priority = value.get_priority()
-                if cur_priority >= priority:
-                    value.set_priority(cur_priority + 2)
-        self.set(priority + 1, target_key, target_value)
-        return priority + 1
+        self.size += 1
+        logger.debug("Added item %s to priority dict with order %s", key, order)
+        return new_item
+
+    def push_front(self, key, value):
+        self.front_counter -= 1
+        return self.set((self.front_counter,), key, value)
+
+    # Push an item to the middle of the priority queue, right after a specific handle
+    # The handle may already be popped or removed, the order is kept in the queue anyway
+    def insert_after(self, handle: PriorityDictItem, key, value):
+        self.child_counter -= 1
+        return self.set(handle.get_order() + (self.child_counter,), key, value)
 
     def get(self, key):
         if key in self.dict:
@@ -71,34 +84,35 @@ class PriorityDict:
         return False
 
     def empty(self):
-        return len(self.dict) == 0
-
-    # TODO: Temporary use the priority as unique key to remove element
-    def remove_with_priority(self, target_priority):
-        for key, values in self.dict.items():
-            self.dict[key] = [
-                value for value in values if value.get_priority() != target_priority
-            ]
+        return self.size == 0
+
+    def remove(self, handle: PriorityDictItem):
+        if handle.is_removed():
+            return
+        handle.removed = True
+        self.size -= 1
+        items = self.dict[handle.get_key()]
+        items.remove(handle)
+        if len(items) == 0:
+            self.dict.pop(handle.get_key())
+
+    def discard_removed(self):
+        while self.heap and self.heap[0].is_removed():
+            heapq.heappop(self.heap)
+
+    def peek_highest_priority(self):
+        self.discard_removed()
+        if not self.heap:
+            return None
+        return self.heap[0]
 
     def get_highest_priority(self):
-        highest_priority = float("inf")
-        highest_priority_value = None
-        highest_idx = -1
-        highest_key = ""
-        for key, values in self.dict.items():
-            for idx, value in enumerate(values):
-                cur_priority = value.get_priority()
-                if cur_priority < highest_priority:
-                    highest_priority = cur_priority
-                    highest_priority_value = value.get_value()
-                    highest_idx = idx
-                    highest_key = key
-
-        self.dict[highest_key].pop(highest_idx)
-        if len(self.dict[highest_key]) == 0:
-            self.dict.pop(highest_key)
-
-        return highest_priority, highest_priority_value
+        highest_item = self.peek_highest_priority()
+        if highest_item is None:
+            raise KeyError("Priority dict is empty.")
+        self.remove(highest_item)
+        heapq.heappop(self.heap)
+        return highest_item, highest_item.get_value()
 
     def __contains__(self, key):
         """Check if the key exists in the dictionary."""
@@ -106,4 +120,4 @@ class PriorityDict:
 
     def __len__(self):
         """Get the number of valid entries in the dictionary."""
-        return len(self.dict)
+        return self.size
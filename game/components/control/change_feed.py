@@ -0,0 +1,94 @@
+import time
+
+from components.world.store import EntityType
+from components.database.producer import produce_messages
+from components.utils.dict_utils import flatten_dict
+from data.game_settings import STREAMING
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ChangeFeed:
+    """
+    Publishes only the changed fields of the characters and events, as flattened
+    dotted paths with a monotonically increasing sequence number.
+    Every keyframe interval the full state of every entity is published again,
+    for the consumers joining late.
+    """
+
+    published_entity_types = (EntityType.CHARACTER, EntityType.EVENT)
+
+    def __init__(self, keyframe_interval=STREAMING.KEYFRAME_INTERVAL) -> None:
+        self.sequence = 0
+        self.keyframe_interval = keyframe_interval
+        self.last_keyframe_timestamp = None
+        # Last published flattened state, (type, id)-{path-value}
+        self.published_states = {}
+
+    def get_sequence(self):
+        return self.sequence
+
+    def next_sequence(self):
+        self.sequence += 1
+        return self.sequence
+
+    def is_keyframe_due(self):
+        return (
+            self.last_keyframe_timestamp is None
+            or self.last_keyframe_timestamp + self.keyframe_interval <= time.time()
+        )
+
+    def get_delta_message(self, entity, is_keyframe=False):
+        entity_state = flatten_dict(entity.to_dict())
+        key = (entity_state["type"], entity_state["id"])
+        published_state = self.published_states.get(key, {})
+        self.published_states[key] = entity_state
+
+        if is_keyframe:
+            changes = entity_state
+        else:
+            changes = {
+                path: value
+                for path, value in entity_state.items()
+                if path not in published_state or published_state[path] != value
+            }
+            if not changes:
+                return None
+
+        message = {
+            **changes,
+            "id": entity_state["id"],
+            "type": entity_state["type"],
+            "data_action": "update",
+            "seq": self.next_sequence(),
+        }
+        if is_keyframe:
+            message["is_keyframe"] = True
+        return message
+
+    def publish(self, store):
+        is_keyframe = self.is_keyframe_due()
+        if is_keyframe:
+            # Removed entities are already published as deletes by the store
+            self.published_states = {}
+            self.last_keyframe_timestamp = time.time()
+
+        published_count = 0
+        for entity_type in ChangeFeed.published_entity_types:
+            for entity in store.get_all(entity_type):
+                if not is_keyframe and not entity.has_data_changed():
+                    continue
+                message = self.get_delta_message(entity, is_keyframe)
+                entity.on_data_published()
+                if message:
+                    produce_messages(message)
+                    published_count += 1
+
+        logger.debug(
+            "Published %s %s messages up to sequence %s",
+            published_count,
+            "keyframe" if is_keyframe else "delta",
+            self.sequence,
+        )
+        return published_count
@@ -5,7 +5,9 @@ import math
 from components.common.point import Point
 from components.configuration.display_setting import DisplaySetting
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class ControlEventHandler:
@@ -81,7 +83,7 @@ class ControlEventHandler:
                 self.selected_surface = surface_id
                 if surface_id == "world_surface":
                     mouse_x, mouse_y = event.pos
-                    self.selected_tile_pos = Point(
+                    self.selected_tile_pos = Point.get(
                         (self.offset_x + mouse_x) // display_setting.cell_size,
                         (self.offset_y + mouse_y) // display_setting.cell_size,
                     )
@@ -91,7 +93,7 @@ class ControlEventHandler:
                         self.selected_character_info_id = None
                     else:
                         self.selected_character_info_id = surface_id
-                logger.debug(f"Clicked on surface {self.selected_character_info_id}")
+                logger.debug("Clicked on surface %s", self.selected_character_info_id)
             elif event.button == 4:  # Scroll up for zoom in
                 new_cell_size = min(
                     display_setting.cell_size + 5, display_setting.max_cell_size
@@ -1,8 +1,12 @@
 import time
 
 from components.world.store import get_store, EntityType
-from components.database.producer import produce_messages
-from data.logs.logger import logger
+from components.database.producer import is_producing_enabled
+from components.control.change_feed import ChangeFeed
+from data.game_settings import STREAMING
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class Monitoring:
@@ -10,6 +14,7 @@ class Monitoring:
         self.timestamp_fps = time.time()
         self.timestamp_data = time.time()
         self.frame_count = 0
+        self.change_feed = ChangeFeed()
 
     def check(self):
         self.fps_check()
@@ -18,26 +23,17 @@ class Monitoring:
     def fps_check(self):
         self.frame_count += 1
         if self.timestamp_fps + 1 < time.time():
-            logger.debug(f"FPS: {self.frame_count}")
+            logger.debug("FPS: %s", self.frame_count)
             self.check_population()
             self.frame_count = 0
             self.timestamp_fps = time.time()
 
     def update_data(self):
-        if self.timestamp_data + 1 < time.time():
-            store = get_store()
-            all_characters = store.get_all(EntityType.CHARACTER)
-            for character in all_characters:
-                character_dict = character.to_dict()
-                character_dict["data_action"] = "update"
-                produce_messages(character_dict)
-
-            all_events = store.get_all(EntityType.EVENT)
-            for event in all_events:
-                event_dict = event.to_dict()
-                event_dict["data_action"] = "update"
-                produce_messages(event_dict)
-
+        if (
+            self.timestamp_data + STREAMING.PUBLISH_INTERVAL < time.time()
+            and is_producing_enabled()
+        ):
+            self.change_feed.publish(get_store())
             self.timestamp_data = time.time()
 
     def check_population(self):
@@ -57,5 +53,5 @@ class Monitoring:
                     dead_count[character_race] = 1
                 else:
                     dead_count[character_race] += 1
-        logger.debug(f"DEAD: {dead_count}")
-        logger.debug(f"ALIVE: {alive_count}")
+        logger.debug("DEAD: %s", dead_count)
+        logger.debug("ALIVE: %s", alive_count)
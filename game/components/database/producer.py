@@ -1,19 +1,212 @@
-from kafka import KafkaProducer
 import json
+import atexit
+import threading
+from collections import OrderedDict
 
-# Initialize producer
-# producer = KafkaProducer(
-#     bootstrap_servers="localhost:9092",
-#     value_serializer=lambda v: json.dumps(v).encode("utf-8"),
-# )
+from components.utils.dict_utils import flatten_dict
+from data.game_settings import STREAMING
+from data.logs.logger import get_logger
 
-# topic = "rpgs"
+logger = get_logger(__name__)
 
 
-# Sending messages to Kafka topic
-def produce_messages(data):
-    return
+def serialize_message(data):
+    # Compact JSON, the consumer side still reads one JSON document per record
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+class MessageBroker:
+    def send_batch(self, topic, messages: list[bytes]):
+        pass
+
+    def close(self):
+        pass
+
+
+class KafkaBroker(MessageBroker):
+    def __init__(
+        self,
+        bootstrap_servers=STREAMING.BOOTSTRAP_SERVERS,
+        compression_type=STREAMING.COMPRESSION_TYPE,
+        linger_ms=STREAMING.LINGER_MS,
+    ) -> None:
+        # Imported here, the game runs without kafka installed when streaming is disabled
+        from kafka import KafkaProducer
+
+        # Kafka groups the records sent within linger_ms into one compressed batch
+        self.producer = KafkaProducer(
+            bootstrap_servers=bootstrap_servers,
+            compression_type=compression_type,
+            linger_ms=linger_ms,
+        )
+
+    def send_batch(self, topic, messages: list[bytes]):
+        for message in messages:
+            self.producer.send(topic, message)
+
+    def close(self):
+        self.producer.flush()
+        self.producer.close()
+
+
+class InMemoryBroker(MessageBroker):
+    # In-process stand-in of the broker, keeps every batch it receives
+    def __init__(self) -> None:
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def send_batch(self, topic, messages: list[bytes]):
+        with self.lock:
+            self.batches.append((topic, list(messages)))
+
+    def get_batches(self):
+        with self.lock:
+            return list(self.batches)
+
+    def get_messages(self, topic=None):
+        return [
+            json.loads(message)
+            for batch_topic, messages in self.get_batches()
+            if topic is None or batch_topic == topic
+            for message in messages
+        ]
+
+
+class MessageProducer:
+    """
+    Buffers the messages of the game loop and sends them in batches from a background thread.
+
+    Pending messages are coalesced by (type, id), only the latest state of an entity
+    is sent for each flush window. The buffer is bounded, when it is full new entities
+    are dropped instead of blocking the game loop.
+    """
+
+    def __init__(
+        self,
+        broker: MessageBroker,
+        topic=STREAMING.TOPIC,
+        max_pending_messages=STREAMING.MAX_PENDING_MESSAGES,
+        flush_interval=STREAMING.FLUSH_INTERVAL,
+    ) -> None:
+        self.broker = broker
+        self.topic = topic
+        self.max_pending_messages = max_pending_messages
+        self.flush_interval = flush_interval
+        self.pending_messages = OrderedDict()
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.flush_thread: threading.Thread = None
+        self.sent_count = 0
+        self.coalesced_count = 0
+        self.dropped_count = 0
+        self.failed_count = 0
+
+    def start(self):
+        if self.flush_thread is None:
+            self.flush_thread = threading.Thread(
+                target=self.run_flush_loop, name="message-producer", daemon=True
+            )
+            self.flush_thread.start()
+
+    def run_flush_loop(self):
+        while not self.stop_event.wait(self.flush_interval):
+            self.flush()
 
-    producer.send(topic, data)
-    # producer.flush()  # Ensure all messages are sent before closing
-    # producer.close()
+    def produce(self, data):
+        key = (data.get("type"), data.get("id"))
+        with self.lock:
+            if key in self.pending_messages:
+                pending_data = self.pending_messages[key]
+                # Updates are merged field by field, the latest value wins, a delete is never overridden
+                if data.get("data_action") == "delete":
+                    self.pending_messages[key] = data
+                elif pending_data.get("data_action") != "delete":
+                    self.pending_messages[key] = {
+                        **flatten_dict(pending_data),
+                        **flatten_dict(data),
+                    }
+                self.coalesced_count += 1
+                return True
+            if len(self.pending_messages) >= self.max_pending_messages:
+                self.dropped_count += 1
+                return False
+            self.pending_messages[key] = data
+            return True
+
+    def flush(self):
+        with self.lock:
+            if not self.pending_messages:
+                return 0
+            messages = list(self.pending_messages.values())
+            self.pending_messages = OrderedDict()
+
+        try:
+            self.broker.send_batch(
+                self.topic, [serialize_message(message) for message in messages]
+            )
+        except Exception:
+            self.failed_count += len(messages)
+            logger.exception("Failed to send %s messages", len(messages))
+            return 0
+        self.sent_count += len(messages)
+        return len(messages)
+
+    def close(self):
+        self.stop_event.set()
+        if self.flush_thread:
+            self.flush_thread.join()
+            self.flush_thread = None
+        self.flush()
+        self.broker.close()
+
+    def get_stats(self):
+        return {
+            "pending": len(self.pending_messages),
+            "sent": self.sent_count,
+            "coalesced": self.coalesced_count,
+            "dropped": self.dropped_count,
+            "failed": self.failed_count,
+        }
+
+
+producer: MessageProducer = None
+
+
+def get_producer():
+    global producer
+    if producer is None and STREAMING.IS_ENABLED:
+        set_producer(MessageProducer(KafkaBroker()))
+    return producer
+
+
+def set_producer(new_producer: MessageProducer):
+    # Replace the producer used by produce_messages, e.g. with an InMemoryBroker one
+    global producer
+    if producer:
+        producer.close()
+    producer = new_producer
+    if producer:
+        producer.start()
+
+
+def close_producer():
+    # Send what is still pending before the process exits
+    global producer
+    if producer:
+        producer.close()
+        producer = None
+
+
+atexit.register(close_producer)
+
+
+def is_producing_enabled():
+    return producer is not None or STREAMING.IS_ENABLED
+
+
+# Sending messages to Kafka topic, never blocks the game loop
+def produce_messages(data):
+    current_producer = get_producer()
+    if current_producer is None:
+        return False
+    return current_producer.produce(data)
@@ -4,7 +4,9 @@ import time
 from components.display.drawer import Drawer
 from components.configuration.display_setting import DisplaySetting
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class CharacterInfoDisplay:
@@ -14,6 +16,8 @@ class CharacterInfoDisplay:
         self.last_draw_timestamp = time.perf_counter()
         self.character_info_surfaces = {}
         self.character_info_surfaces_pos = {}
+        # Text last drawn in each info box, an unchanged box is not rendered again
+        self.character_info_texts = {}
         self.init_main_surface(display_setting)
         self.text_color = (0, 0, 0)
         self.main_surface_pos = (640, 0)
@@ -22,6 +26,7 @@ class CharacterInfoDisplay:
     def refresh_character_info_surfaces(self):
         logger.debug("Refresh character info surfaces due to change")
         self.character_info_surfaces = {}
+        self.character_info_texts = {}
         self.focusing_character_id = None
 
     def init_main_surface(self, display_setting):
@@ -141,13 +146,15 @@ class CharacterInfoDisplay:
                     character.get_character_detailed_info_string()
                 )
 
-                self.draw_character_info_in_box(
-                    self.character_info_surfaces[cid],
-                    character_detailed_info_string,
-                    font,
-                    self.text_color,
-                    character_box_margin,
-                )
+                if self.character_info_texts.get(cid) != character_detailed_info_string:
+                    self.draw_character_info_in_box(
+                        self.character_info_surfaces[cid],
+                        character_detailed_info_string,
+                        font,
+                        self.text_color,
+                        character_box_margin,
+                    )
+                    self.character_info_texts[cid] = character_detailed_info_string
 
                 self.main_surface.blit(
                     self.character_info_surfaces[cid], (0, current_offset)
@@ -155,5 +162,7 @@ class CharacterInfoDisplay:
                 current_offset += character_surface_height + between_box_margin
 
             surface.blit(self.main_surface, self.main_surface_pos)
+            return [self.main_surface.get_rect(topleft=self.main_surface_pos)]
 
         # self.set_should_redraw(False)
+        return []
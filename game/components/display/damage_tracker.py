@@ -0,0 +1,80 @@
+import time
+
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DamageTracker:
+    """
+    Collects the tiles whose drawing changed since the last frame.
+
+    Tiles and characters report their changes here, the display then redraws only those
+    cells. Nothing is collected until a display enables the tracker, so the headless
+    simulation pays a single attribute check per change.
+    """
+
+    def __init__(self) -> None:
+        self.is_enabled = False
+        self.dirty_tile_ids = set()
+
+    def enable(self):
+        self.is_enabled = True
+
+    def mark_tile(self, tile_id):
+        if self.is_enabled:
+            self.dirty_tile_ids.add(tile_id)
+
+    def pop_dirty_tile_ids(self):
+        dirty_tile_ids = self.dirty_tile_ids
+        self.dirty_tile_ids = set()
+        return dirty_tile_ids
+
+    def clear(self):
+        self.dirty_tile_ids.clear()
+
+
+class FrameStats:
+    # Pixels pushed to the display per frame, logged every log_interval seconds
+    def __init__(self, log_interval=5) -> None:
+        self.log_interval = log_interval
+        self.frame_count = 0
+        self.pixel_count = 0
+        self.last_frame_pixel_count = 0
+        self.interval_frame_count = 0
+        self.interval_pixel_count = 0
+        self.last_log_timestamp = time.perf_counter()
+
+    def record_frame(self, rects):
+        pixel_count = sum(rect.width * rect.height for rect in rects)
+        self.frame_count += 1
+        self.pixel_count += pixel_count
+        self.last_frame_pixel_count = pixel_count
+        self.interval_frame_count += 1
+        self.interval_pixel_count += pixel_count
+
+        now = time.perf_counter()
+        if now - self.last_log_timestamp >= self.log_interval:
+            logger.debug(
+                "Pushed %.0f pixels/frame over %s frames (%.1f frames/s)",
+                self.interval_pixel_count / self.interval_frame_count,
+                self.interval_frame_count,
+                self.interval_frame_count / (now - self.last_log_timestamp),
+            )
+            self.interval_frame_count = 0
+            self.interval_pixel_count = 0
+            self.last_log_timestamp = now
+
+    def get_stats(self):
+        return {
+            "frames": self.frame_count,
+            "last_frame_pixels": self.last_frame_pixel_count,
+            "average_frame_pixels": self.pixel_count / max(self.frame_count, 1),
+        }
+
+
+damage_tracker = DamageTracker()
+
+
+def get_damage_tracker():
+    return damage_tracker
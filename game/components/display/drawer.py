@@ -1,21 +1,16 @@
+from functools import lru_cache
+
+
 class Drawer:
     @staticmethod
-    def render_text_box(surface, text, font, color):
+    @lru_cache(maxsize=256)
+    def get_text_lines(text, font, width):
         """
-        Render text within a specified rectangle, wrapping lines automatically.
-
-        Args:
-            surface: The Pygame surface to render the text onto.
-            text: The string of text to render.
-            font: The Pygame font object to use.
-            color: The color of the text.
-            rect: The rectangle (x, y, width, height) defining the text area.
+        Wrap the text into lines fitting within the width, "|" starts a new line.
+        Memoized by (text, font, width), the words are only measured for a new text.
         """
-        rect = surface.get_rect()
-        x, y, width, height = rect
         words = text.split(" ")
-        space_width, space_height = font.size(" ")
-        line_spacing = space_height + 2
+        space_width, _ = font.size(" ")
 
         lines = []
         current_line = []
@@ -38,11 +33,34 @@ class Drawer:
         if current_line:
             lines.append(" ".join(current_line))
 
+        return tuple(line.strip() for line in lines)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def render_line(line, font, color):
+        # Most lines of an info box stay the same between two draws
+        return font.render(line, True, color)
+
+    @staticmethod
+    def render_text_box(surface, text, font, color):
+        """
+        Render text within a specified rectangle, wrapping lines automatically.
+
+        Args:
+            surface: The Pygame surface to render the text onto.
+            text: The string of text to render.
+            font: The Pygame font object to use.
+            color: The color of the text.
+            rect: The rectangle (x, y, width, height) defining the text area.
+        """
+        rect = surface.get_rect()
+        x, y, width, height = rect
+        _, space_height = font.size(" ")
+        line_spacing = space_height + 2
+
         # Render each line within the height limit
-        for line in lines:
-            line = line.strip()
+        for line in Drawer.get_text_lines(text, font, width):
             if y + space_height > rect[1] + height:
                 break  # Stop rendering if we exceed the height of the box
-            line_surface = font.render(line, True, color)
-            surface.blit(line_surface, (x, y))
+            surface.blit(Drawer.render_line(line, font, tuple(color)), (x, y))
             y += line_spacing
@@ -0,0 +1,66 @@
+import pygame
+
+COMBAT_IMAGE_PATH = "data/sprites/combat.png"
+FOG_COLOR = (0, 0, 0)
+FOG_ALPHA = 200
+
+
+class SpriteCache:
+    """
+    Loaded and scaled sprites shared by every display.
+
+    Each sprite is read from disk once, then scaled once per (image path, cell size),
+    so a zoom level is built the first time it is drawn and reused afterwards.
+    Surfaces are converted to the display pixel format when a display mode is set,
+    which makes every following blit a plain copy.
+    """
+
+    def __init__(self) -> None:
+        self.images: dict[str, pygame.Surface] = {}
+        self.scaled_images: dict[tuple[str, int], pygame.Surface] = {}
+        self.fog_overlays: dict[int, pygame.Surface] = {}
+
+    def get_image(self, image_path) -> pygame.Surface:
+        if image_path not in self.images:
+            image = pygame.image.load(image_path)
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+            self.images[image_path] = image
+        return self.images[image_path]
+
+    def get_scaled_image(self, image_path, cell_size) -> pygame.Surface:
+        key = (image_path, cell_size)
+        if key not in self.scaled_images:
+            self.scaled_images[key] = pygame.transform.scale(
+                self.get_image(image_path), (cell_size, cell_size)
+            )
+        return self.scaled_images[key]
+
+    def get_combat_image(self, cell_size) -> pygame.Surface:
+        return self.get_scaled_image(COMBAT_IMAGE_PATH, cell_size)
+
+    def get_fog_overlay(self, cell_size) -> pygame.Surface:
+        # Darken the tiles that are only remembered, not currently seen
+        if cell_size not in self.fog_overlays:
+            fog_overlay = pygame.Surface((cell_size, cell_size))
+            if pygame.display.get_surface() is not None:
+                fog_overlay = fog_overlay.convert()
+            fog_overlay.fill(FOG_COLOR)
+            fog_overlay.set_alpha(FOG_ALPHA)
+            self.fog_overlays[cell_size] = fog_overlay
+        return self.fog_overlays[cell_size]
+
+    def clear(self):
+        self.images.clear()
+        self.scaled_images.clear()
+        self.fog_overlays.clear()
+
+
+sprite_cache: SpriteCache = None
+
+
+def get_sprite_cache():
+    global sprite_cache
+    if sprite_cache is None:
+        sprite_cache = SpriteCache()
+    return sprite_cache
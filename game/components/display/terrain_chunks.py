@@ -0,0 +1,96 @@
+import pygame
+
+from components.display.sprite_cache import get_sprite_cache
+from components.world.store import get_store, EntityType
+
+CHUNK_SIZE = 16
+
+
+class TerrainChunks:
+    """
+    Static terrain prerendered into surfaces of chunk_size x chunk_size tiles.
+
+    Chunks are built lazily for the current cell size and the current grid version,
+    a zoom or a terrain change drops them. The background of the view is then a few
+    chunk blits whatever the number of tiles in view.
+    """
+
+    def __init__(self, chunk_size=CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
+        self.chunks: dict[tuple[int, int], pygame.Surface] = {}
+        self.cell_size = None
+        self.grid_version = None
+
+    def sync(self, grid, cell_size):
+        if self.cell_size != cell_size or self.grid_version != grid.get_version():
+            self.chunks.clear()
+            self.cell_size = cell_size
+            self.grid_version = grid.get_version()
+
+    def get_chunk(self, grid, chunk_x, chunk_y) -> pygame.Surface:
+        if (chunk_x, chunk_y) not in self.chunks:
+            self.chunks[(chunk_x, chunk_y)] = self.build_chunk(grid, chunk_x, chunk_y)
+        return self.chunks[(chunk_x, chunk_y)]
+
+    def build_chunk(self, grid, chunk_x, chunk_y) -> pygame.Surface:
+        store = get_store()
+        sprite_cache = get_sprite_cache()
+        start_x, start_y = chunk_x * self.chunk_size, chunk_y * self.chunk_size
+        end_x = min(start_x + self.chunk_size, grid.width)
+        end_y = min(start_y + self.chunk_size, grid.height)
+
+        chunk = pygame.Surface(
+            ((end_x - start_x) * self.cell_size, (end_y - start_y) * self.cell_size)
+        )
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert()
+        chunk.fill((0, 0, 0))
+        for cell_x in range(start_x, end_x):
+            for cell_y in range(start_y, end_y):
+                tile = store.get(EntityType.TILE, grid.tiles[cell_x][cell_y])
+                chunk.blit(
+                    sprite_cache.get_scaled_image(
+                        tile.get_image_path(), self.cell_size
+                    ),
+                    (
+                        (cell_x - start_x) * self.cell_size,
+                        (cell_y - start_y) * self.cell_size,
+                    ),
+                )
+        return chunk
+
+    def draw(self, surface: pygame.Surface, grid, offset):
+        # Blit every chunk overlapping the surface
+        offset_x, offset_y = offset
+        width, height = surface.get_size()
+        chunk_pixels = self.chunk_size * self.cell_size
+        chunk_count_x = -(-grid.width // self.chunk_size)
+        chunk_count_y = -(-grid.height // self.chunk_size)
+        for chunk_x in range(
+            max(offset_x // chunk_pixels, 0),
+            min((offset_x + width) // chunk_pixels + 1, chunk_count_x),
+        ):
+            for chunk_y in range(
+                max(offset_y // chunk_pixels, 0),
+                min((offset_y + height) // chunk_pixels + 1, chunk_count_y),
+            ):
+                surface.blit(
+                    self.get_chunk(grid, chunk_x, chunk_y),
+                    (
+                        chunk_x * chunk_pixels - offset_x,
+                        chunk_y * chunk_pixels - offset_y,
+                    ),
+                )
+
+    def draw_cell(self, surface: pygame.Surface, grid, cell_x, cell_y, pos):
+        # Copy the terrain of one cell out of its chunk
+        chunk = self.get_chunk(
+            grid, cell_x // self.chunk_size, cell_y // self.chunk_size
+        )
+        area = pygame.Rect(
+            cell_x % self.chunk_size * self.cell_size,
+            cell_y % self.chunk_size * self.cell_size,
+            self.cell_size,
+            self.cell_size,
+        )
+        surface.blit(chunk, pos, area)
@@ -3,11 +3,15 @@ import time
 
 from components.common.point import Point
 from components.display.drawer import Drawer
+from components.display.sprite_cache import get_sprite_cache
+from components.display.damage_tracker import get_damage_tracker
+from components.display.terrain_chunks import TerrainChunks
 from components.configuration.display_setting import DisplaySetting
 from components.world.store import get_store, EntityType
-from components.utils.tile_utils import get_tile_object
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class WorldDisplay:
@@ -23,6 +27,11 @@ class WorldDisplay:
             )
         )
         self.main_surface_pos = (0, 0)
+        self.damage_tracker = get_damage_tracker()
+        self.damage_tracker.enable()
+        self.tile_positions = {}
+        self.tile_positions_version = None
+        self.terrain_chunks = TerrainChunks()
 
     def get_main_surface(self):
         return self.main_surface
@@ -39,184 +48,217 @@ class WorldDisplay:
         is_display_changed: bool,
         focusing_character,
     ):
+        """
+        Draw the world onto the target surface, returns the rects of the target surface
+        that changed. Without a display change only the tiles reported to the damage
+        tracker are redrawn.
+        """
         store = get_store()
-
-        # Clear screen if display has changed
-        if is_display_changed:
-            self.main_surface.fill((0, 0, 0))
-
-        # Pre-fetch grid and settings
         grid = store.get(EntityType.GRID, 0)
         cell_size = display_setting.cell_size
-        main_screen_width, main_screen_height = display_setting.main_screen_size
         offset_x, offset_y = offset
 
         # Determine visible tiles and memory for focusing character
-        visible_tile_ids, visible_points, memory_tile_ids = self.get_visibility_info(
-            focusing_character
-        )
+        visible_tile_ids, memory_tile_ids = self.get_visibility_info(focusing_character)
 
-        # Draw tiles
-        self.draw_tiles(
-            grid,
-            cell_size,
-            main_screen_width,
-            main_screen_height,
-            offset_x,
-            offset_y,
-            is_display_changed,
-            visible_tile_ids,
-            memory_tile_ids,
-            focusing_character,
-        )
+        self.terrain_chunks.sync(grid, cell_size)
+        dirty_tile_ids = self.damage_tracker.pop_dirty_tile_ids()
+        is_terrain_drawn = False
+        if is_display_changed:
+            self.main_surface.fill((0, 0, 0))
+            cell_positions = self.get_screen_cell_positions(
+                grid, cell_size, display_setting.main_screen_size, offset
+            )
+            # Without fog of war the whole view is terrain, drawn from the prerendered chunks
+            if not focusing_character:
+                self.terrain_chunks.draw(self.main_surface, grid, offset)
+                is_terrain_drawn = True
+        else:
+            cell_positions = self.get_dirty_cell_positions(grid, dirty_tile_ids)
+
+        screen_rect = self.main_surface.get_rect()
+        rects = []
+        for cell_x, cell_y in cell_positions:
+            rect = pygame.Rect(
+                cell_x * cell_size - offset_x,
+                cell_y * cell_size - offset_y,
+                cell_size,
+                cell_size,
+            ).clip(screen_rect)
+            if rect.width == 0 or rect.height == 0:
+                continue
 
-        # Draw characters
-        self.draw_characters(
-            store,
-            cell_size,
-            offset_x,
-            offset_y,
-            main_screen_width,
-            main_screen_height,
-            is_display_changed,
-            font,
-            focusing_character,
-            visible_points,
-        )
+            tile = store.get(EntityType.TILE, grid.tiles[cell_x][cell_y])
+            # Only the dynamic layers are left on top of the drawn terrain
+            if is_terrain_drawn and not (
+                tile.is_combat_happen() or tile.get_character_ids()
+            ):
+                continue
+
+            is_drawn = self.draw_cell(
+                grid,
+                tile,
+                cell_x,
+                cell_y,
+                cell_size,
+                offset_x,
+                offset_y,
+                font,
+                visible_tile_ids,
+                memory_tile_ids,
+                focusing_character,
+                is_terrain_drawn,
+            )
+            if is_drawn:
+                rects.append(rect)
+
+        if is_display_changed:
+            rects = [screen_rect]
 
-        # Render the main surface onto the target surface
-        surface.blit(self.main_surface, (0, 0))
+        # Render the changed parts of the main surface onto the target surface
+        screen_rects = [rect.move(self.main_surface_pos) for rect in rects]
+        for rect, screen_rect in zip(rects, screen_rects):
+            surface.blit(self.main_surface, screen_rect, rect)
+        return screen_rects
 
     def get_visibility_info(self, focusing_character):
         if not focusing_character:
-            return [], [], []
+            return set(), set()
 
-        visible_tile_ids = [
+        visible_tile_ids = {
             tile.get_id() for tile in focusing_character.get_visible_tile_objects()
-        ]
-        visible_points = focusing_character.get_visible_tiles()
-        memory_tile_ids = [
+        }
+        memory_tile_ids = {
             memory_tile.get_tile().get_id()
             for memory_tile in focusing_character.get_memory().get_all(
-                EntityType.TILE, focusing_character.get_location()
+                EntityType.TILE,
+                focusing_character.get_location(),
+                is_sorted_distance=False,
             )
+        }
+        return visible_tile_ids, memory_tile_ids
+
+    def get_screen_cell_positions(self, grid, cell_size, screen_size, offset):
+        screen_width, screen_height = screen_size
+        offset_x, offset_y = offset
+        start_x, start_y = offset_x // cell_size, offset_y // cell_size
+        end_x = (offset_x + screen_width) // cell_size + 1
+        end_y = (offset_y + screen_height) // cell_size + 1
+        return [
+            (cell_x, cell_y)
+            for cell_x in range(max(start_x, 0), min(end_x, grid.width))
+            for cell_y in range(max(start_y, 0), min(end_y, grid.height))
+        ]
+
+    def get_dirty_cell_positions(self, grid, dirty_tile_ids):
+        # Tiles do not know their location, the lookup is rebuilt when the grid changes
+        if self.tile_positions_version != grid.get_version():
+            self.tile_positions = {
+                tile_id: (cell_x, cell_y)
+                for cell_x, row in enumerate(grid.tiles)
+                for cell_y, tile_id in enumerate(row)
+            }
+            self.tile_positions_version = grid.get_version()
+        return [
+            self.tile_positions[tile_id]
+            for tile_id in dirty_tile_ids
+            if tile_id in self.tile_positions
         ]
-        return visible_tile_ids, visible_points, memory_tile_ids
 
-    def draw_tiles(
+    def draw_cell(
         self,
         grid,
+        tile,
+        cell_x,
+        cell_y,
         cell_size,
-        screen_width,
-        screen_height,
         offset_x,
         offset_y,
-        is_display_changed,
+        font,
         visible_tile_ids,
         memory_tile_ids,
         focusing_character,
+        is_terrain_drawn=False,
     ):
-        store = get_store()
-        start_x = offset_x // cell_size * cell_size
-        start_y = offset_y // cell_size * cell_size
-
-        for x in range(start_x, start_x + screen_width + cell_size, cell_size):
-            for y in range(start_y, start_y + screen_height + cell_size, cell_size):
-                cell_x, cell_y = x // cell_size, y // cell_size
-
-                if not (0 <= cell_x < grid.width and 0 <= cell_y < grid.height):
-                    continue
-
-                tile = store.get(EntityType.TILE, grid.tiles[cell_x][cell_y])
-                if not is_display_changed and not tile.should_redraw():
-                    continue
-
-                is_visible = (
-                    not focusing_character
-                    or tile.get_id() in visible_tile_ids
-                    or Point(cell_x, cell_y) == focusing_character.get_pos()
-                    or tile.get_id() in memory_tile_ids
-                )
-
-                if is_visible:
-                    self.render_tile(
-                        tile,
-                        x,
-                        y,
-                        cell_size,
-                        offset_x,
-                        offset_y,
-                        focusing_character and tile.get_id() not in visible_tile_ids,
-                    )
-
-    def render_tile(self, tile, x, y, cell_size, offset_x, offset_y, is_memory_tile):
-        cell_image = tile.get_image()
-        if tile.is_combat_happen():
-            cell_image = pygame.image.load("data/sprites/combat.png")
-        else:
-            tile.reset_redraw_status()
-
-        cell_image = pygame.transform.scale(cell_image, (cell_size, cell_size))
-        self.main_surface.blit(cell_image, (x - offset_x, y - offset_y))
+        is_focusing_pos = (
+            focusing_character is not None
+            and Point.get(cell_x, cell_y) == focusing_character.get_pos()
+        )
+        is_character_visible = (
+            not focusing_character
+            or tile.get_id() in visible_tile_ids
+            or is_focusing_pos
+        )
+        if not is_character_visible and tile.get_id() not in memory_tile_ids:
+            return False
 
-        if is_memory_tile:
-            dark_filter = pygame.Surface(cell_image.get_size())
-            dark_filter.fill((0, 0, 0))
-            dark_filter.set_alpha(200)
-            self.main_surface.blit(dark_filter, (x - offset_x, y - offset_y))
+        x, y = cell_x * cell_size - offset_x, cell_y * cell_size - offset_y
+        self.render_tile(
+            grid,
+            tile,
+            cell_x,
+            cell_y,
+            x,
+            y,
+            cell_size,
+            focusing_character and tile.get_id() not in visible_tile_ids,
+            is_terrain_drawn,
+        )
+        if is_character_visible:
+            self.render_characters(tile, x, y, cell_size, font)
+        return True
 
-    def draw_characters(
+    def render_tile(
         self,
-        store,
+        grid,
+        tile,
+        cell_x,
+        cell_y,
+        x,
+        y,
         cell_size,
-        offset_x,
-        offset_y,
-        screen_width,
-        screen_height,
-        is_display_changed,
-        font,
-        focusing_character,
-        visible_points,
+        is_memory_tile,
+        is_terrain_drawn=False,
     ):
-        all_characters = store.get_all(EntityType.CHARACTER)
-        drawn_positions = set()
-
-        for character in all_characters:
-            char_pos = character.get_pos()
-            if (
-                focusing_character
-                and char_pos not in visible_points
-                and char_pos != focusing_character.get_pos()
-            ):
-                continue
+        sprite_cache = get_sprite_cache()
+        if not is_terrain_drawn:
+            self.terrain_chunks.draw_cell(
+                self.main_surface, grid, cell_x, cell_y, (x, y)
+            )
+        # The combat marker is transparent, it is drawn over the terrain
+        if tile.is_combat_happen():
+            self.main_surface.blit(sprite_cache.get_combat_image(cell_size), (x, y))
 
-            x, y = char_pos.x * cell_size, char_pos.y * cell_size
-            if (x, y) in drawn_positions or not (
-                offset_x <= x < offset_x + screen_width
-                and offset_y <= y < offset_y + screen_height
-            ):
-                continue
+        if is_memory_tile:
+            self.main_surface.blit(sprite_cache.get_fog_overlay(cell_size), (x, y))
 
-            if not character.is_alive() or (
-                not is_display_changed and not character.should_redraw()
-            ):
-                continue
+    def render_characters(self, tile, x, y, cell_size, font):
+        # Only the highest level character of the tile is drawn, with the character count
+        store = get_store()
+        characters = [
+            store.get(EntityType.CHARACTER, character_id)
+            for character_id in tile.get_character_ids()
+        ]
+        alive_characters = [
+            character for character in characters if character and character.is_alive()
+        ]
+        if not alive_characters:
+            return
 
-            drawn_positions.add((x, y))
-            character_icon = pygame.transform.scale(
-                character.img, (cell_size, cell_size)
-            )
-            self.main_surface.blit(character_icon, (x - offset_x, y - offset_y))
+        character = max(
+            alive_characters,
+            key=lambda character: character.get_level().get_current_level(),
+        )
+        character_icon = get_sprite_cache().get_scaled_image(
+            character.get_image_path(), cell_size
+        )
+        self.main_surface.blit(character_icon, (x, y))
 
-            # Render additional details
-            level_text = font.render(
-                str(character.get_level().get_current_level()), True, (0, 255, 0)
-            )
-            self.main_surface.blit(
-                level_text, (x - offset_x + (cell_size - 10), y - offset_y)
-            )
+        # Render additional details
+        level_text = font.render(
+            str(character.get_level().get_current_level()), True, (0, 255, 0)
+        )
+        self.main_surface.blit(level_text, (x + (cell_size - 10), y))
 
-            tile = get_tile_object(char_pos)
-            char_count = len(tile.character_ids)
-            count_text = font.render(str(char_count), True, (255, 0, 0))
-            self.main_surface.blit(count_text, (x - offset_x, y - offset_y))
+        count_text = font.render(str(len(characters)), True, (255, 0, 0))
+        self.main_surface.blit(count_text, (x, y))
@@ -1,6 +1,6 @@
 from enum import Enum
 
-from components.world.store import EntityType, Store
+from components.world.store import EntityType
 from components.memory.memory import (
     Memory,
     MemoryCharacter,
@@ -23,8 +23,16 @@ class CharacterMemory:
     }
 
     def __init__(self) -> None:
-        self.temporary_memories = {}
-        self.permanent_memories = {}
+        # Memories are split per entity type, keyed by entity id
+        self.temporary_memories = {entity_type: {} for entity_type in EntityType}
+        self.permanent_memories = {entity_type: {} for entity_type in EntityType}
+
+    def get_memories(self, memory_type: CharacterMemoryType):
+        if memory_type is CharacterMemoryType.TEMPORARY:
+            return self.temporary_memories
+        elif memory_type is CharacterMemoryType.PERMANENT:
+            return self.permanent_memories
+        raise Exception(f"Unknown memory type '{memory_type}'")
 
     def add(
         self,
@@ -38,58 +46,34 @@ class CharacterMemory:
                 raise Exception(
                     f"Wrong memory class used, should be '{CharacterMemory.memory_map[entity_type].__name__}' instead of '{memory.__class__.__name__}'"
                 )
-        key = Store.get_key(entity_type, id)
-        if memory_type is CharacterMemoryType.TEMPORARY:
-            self.temporary_memories[key] = memory
-        elif memory_type is CharacterMemoryType.PERMANENT:
-            self.permanent_memories[key] = memory
+        self.get_memories(memory_type)[entity_type][id] = memory
 
-    def delete(self, entity_type: EntityType, id):
-        key = Store.get_key(entity_type, id)
-        if key in self.memories:
-            self.memories.pop(key)
+    def get(self, entity_type: EntityType, id, memory_type: CharacterMemoryType):
+        return self.get_memories(memory_type)[entity_type].get(id)
 
-    def get_all(self, entity_type: EntityType):
-        return [
-            obj
-            for key, obj in self.temporary_memories.items()
-            if key.startswith(f"{entity_type.value}")
-        ]
+    def delete(self, entity_type: EntityType, id):
+        self.temporary_memories[entity_type].pop(id, None)
+        self.permanent_memories[entity_type].pop(id, None)
 
     # TODO: Better management for temporary and permanent memories
     def get_all(
         self, entity_type: EntityType, target_point: Point, is_sorted_distance=True
     ):
-        if entity_type is EntityType.TILE:
-            unsorted_memories = [
-                obj
-                for key, obj in self.permanent_memories.items()
-                if key.startswith(f"{entity_type.value}")
-            ]
-            if is_sorted_distance:
-                return sorted(
-                    unsorted_memories,
-                    key=lambda memory: Point.get_distance_man(
-                        memory.get_location(), target_point
-                    ),
-                )
-            else:
-                return unsorted_memories
-        else:
-            unsorted_memories = [
-                obj
-                for key, obj in self.temporary_memories.items()
-                if key.startswith(f"{entity_type.value}")
-            ]
-            if is_sorted_distance:
-                return sorted(
-                    unsorted_memories,
-                    key=lambda memory: Point.get_distance_man(
-                        memory.get_location(), target_point
-                    ),
-                )
-            else:
-                return unsorted_memories
+        # Tiles are remembered permanently, everything else only until the next inspection
+        memory_type = (
+            CharacterMemoryType.PERMANENT
+            if entity_type is EntityType.TILE
+            else CharacterMemoryType.TEMPORARY
+        )
+        unsorted_memories = list(self.get_memories(memory_type)[entity_type].values())
+        if is_sorted_distance:
+            return sorted(
+                unsorted_memories,
+                key=lambda memory: Point.get_distance_man(
+                    memory.get_location(), target_point
+                ),
+            )
+        return unsorted_memories
 
     def reset(self):
-        self.temporary_memories = {}
+        self.temporary_memories = {entity_type: {} for entity_type in EntityType}
@@ -4,7 +4,9 @@ import random
 from components.common.point import Point
 from components.action.event import EventType
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class Memory:
@@ -107,9 +109,14 @@ class MemoryEvent(Memory):
 
 
 class MemoryTile(Memory):
-    def __init__(self, id, pos, tile):
+    # Holds the immutable snapshot of the tile at the moment it was seen, so the character
+    # keeps believing in it until he checks the tile again
+    def __init__(self, id, pos, tile_snapshot):
         super().__init__(id, pos)
-        self.tile = tile
+        self.tile = tile_snapshot
 
     def get_tile(self):
         return self.tile
+
+    def get_version(self):
+        return self.tile.get_version()
@@ -0,0 +1,13 @@
+def flatten_dict(data: dict, prefix=""):
+    """
+    Flatten nested dicts into dotted paths, {"stats": {"power": 1}} -> {"stats.power": 1}.
+    The dotted paths can be used as they are in a MongoDB $set.
+    """
+    flat_data = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat_data.update(flatten_dict(value, f"{path}."))
+        else:
+            flat_data[path] = value
+    return flat_data
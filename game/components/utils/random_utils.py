@@ -1,5 +1,52 @@
 import random
+import bisect
+import itertools
+
+import numpy
 
 
 def random_once(prob):
     return random.random() < prob
+
+
+class WeightedSampler:
+    """
+    Draws values with the given relative weights, weights don't need to be normalized.
+    The cumulative weights are built once, each draw is a binary search over them.
+    """
+
+    def __init__(self, values, weights):
+        self.values = list(values)
+        self.cumulative_weights = list(itertools.accumulate(weights))
+        if not self.values or self.cumulative_weights[-1] <= 0:
+            raise Exception(
+                f"Cannot sample from weights {list(weights)}, the total weight must be positive"
+            )
+        self.total_weight = self.cumulative_weights[-1]
+        self.cumulative_weights_array = None
+
+    def get_values(self):
+        return self.values
+
+    def sample_index(self):
+        idx = bisect.bisect_right(
+            self.cumulative_weights, random.random() * self.total_weight
+        )
+        return min(idx, len(self.values) - 1)
+
+    def sample(self):
+        return self.values[self.sample_index()]
+
+    def sample_many_indices(self, count: int):
+        if self.cumulative_weights_array is None:
+            self.cumulative_weights_array = numpy.array(self.cumulative_weights)
+        indices = numpy.searchsorted(
+            self.cumulative_weights_array,
+            numpy.random.random(count) * self.total_weight,
+            side="right",
+        )
+        return numpy.minimum(indices, len(self.values) - 1)
+
+    # Vectorized draws, for many samples of a same distribution at once
+    def sample_many(self, count: int):
+        return [self.values[idx] for idx in self.sample_many_indices(count)]
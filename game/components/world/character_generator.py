@@ -1,6 +1,4 @@
-import time
 import random
-import pygame
 
 from components.race.race import Human, Demon, Ruin, Forest
 from components.archetype.archetype import Mob, Player
@@ -36,7 +34,10 @@ from components.action.goal.goal import TrainingGoal
 from components.character.character_strategy import CharacterStrategyType
 from components.common.point import Point
 from components.world.store import get_store, EntityType
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+from data.game_settings import SIMULATION
+
+logger = get_logger(__name__)
 
 
 class CharacterGenerator:
@@ -46,15 +47,20 @@ class CharacterGenerator:
         self.amount = amount
         self.spawn_counter = 0
         self.location = location
-        self.timestamp = time.time()
+        # Interval is given in seconds of game time, spawning is scheduled in simulation ticks
+        self.interval_ticks = max(1, int(interval * SIMULATION.TICKS_PER_SECOND))
+        self.next_spawn_tick = self.interval_ticks
 
     def spawn(self):
         pass
 
-    def update(self):
-        if self.timestamp + self.interval < time.time():
-            logger.debug(f"Spawn one {self.name} at {self.location}")
-            self.timestamp = time.time()
+    def get_next_spawn_tick(self):
+        return self.next_spawn_tick
+
+    def update(self, current_tick: int):
+        if self.next_spawn_tick <= current_tick:
+            logger.debug("Spawn one %s at %s", self.name, self.location)
+            self.next_spawn_tick = current_tick + self.interval_ticks
             self.spawn()
             self.spawn_counter += 1
             return True
@@ -86,7 +92,7 @@ class HumanGenerator(CharacterGenerator):
 
         new_human = Character(
             self.location,
-            pygame.image.load("data/sprites/character3.png"),
+            "data/sprites/character3.png",
             CharacterInfo("Human"),
             # stat,
             attributes,
@@ -132,7 +138,7 @@ class DemonGenerator(CharacterGenerator):
         attributes.add_base_attribute(Agility(random.randint(4, 6)))
         new_demon = Character(
             self.location,
-            pygame.image.load("data/sprites/demon2.png"),
+            "data/sprites/demon2.png",
             CharacterInfo("Demon"),
             # stat,
             attributes,
@@ -177,7 +183,7 @@ class RuinMobGenerator(CharacterGenerator):
         attributes.add_base_attribute(Agility(random.randint(3, 5)))
         new_mob = Character(
             self.location,
-            pygame.image.load("data/sprites/ruinmob1.png"),
+            "data/sprites/ruinmob1.png",
             CharacterInfo("RuinMob"),
             # stat,
             attributes,
@@ -212,7 +218,7 @@ class ForsetMobGenerator(CharacterGenerator):
         attributes.add_base_attribute(Agility(random.randint(6, 10)))
         new_mob = Character(
             self.location,
-            pygame.image.load("data/sprites/forestmob1.png"),
+            "data/sprites/forestmob1.png",
             CharacterInfo("ForestMob"),
             # stat,
             attributes,
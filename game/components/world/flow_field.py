@@ -0,0 +1,125 @@
+from collections import OrderedDict
+
+import numpy
+
+from components.common.point import Point, NEIGHBOR_OFFSETS
+from data.game_settings import PATH_FINDING
+
+UNREACHABLE = numpy.iinfo(numpy.int32).max
+
+
+class FlowField:
+    """
+    Distances from every cell to the nearest target and the step that follows the gradient.
+
+    Computed once with a breadth-first wavefront over the passability map, then any
+    number of characters get their next step toward the targets with one lookup.
+    """
+
+    def __init__(self, passable_map: numpy.ndarray, targets) -> None:
+        self.targets = frozenset(targets)
+        self.distances = self.compute_distances(passable_map, self.targets)
+        self.directions = self.compute_directions(self.distances)
+
+    @staticmethod
+    def compute_distances(passable_map: numpy.ndarray, targets):
+        width, height = passable_map.shape
+        distances = numpy.full((width, height), UNREACHABLE, dtype=numpy.int32)
+        frontier = numpy.zeros((width, height), dtype=bool)
+        for target in targets:
+            if 0 <= target.x < width and 0 <= target.y < height:
+                frontier[target.x, target.y] = passable_map[target.x, target.y]
+        distances[frontier] = 0
+
+        distance = 0
+        while frontier.any():
+            distance += 1
+            grown = numpy.zeros_like(frontier)
+            grown[1:, :] |= frontier[:-1, :]
+            grown[:-1, :] |= frontier[1:, :]
+            grown[:, 1:] |= frontier[:, :-1]
+            grown[:, :-1] |= frontier[:, 1:]
+            frontier = grown & passable_map & (distances == UNREACHABLE)
+            distances[frontier] = distance
+        return distances
+
+    @staticmethod
+    def compute_directions(distances: numpy.ndarray):
+        # Index in NEIGHBOR_OFFSETS of the neighbor closest to the targets, -1 for none
+        padded = numpy.pad(distances, 1, constant_values=UNREACHABLE)
+        neighbor_distances = numpy.stack(
+            [
+                padded[
+                    1 + offset.x : padded.shape[0] - 1 + offset.x,
+                    1 + offset.y : padded.shape[1] - 1 + offset.y,
+                ]
+                for offset in NEIGHBOR_OFFSETS
+            ]
+        )
+        directions = neighbor_distances.argmin(axis=0).astype(numpy.int8)
+        closest_distances = neighbor_distances.min(axis=0)
+        directions[closest_distances >= distances] = -1
+        return directions
+
+    def get_distance(self, pos: Point):
+        distance = int(self.distances[pos.x, pos.y])
+        return None if distance == UNREACHABLE else distance
+
+    def get_next_step(self, pos: Point):
+        """
+        Next position toward the nearest target, None on a target or when unreachable.
+        A character on an impassable cell still gets the step out to a reachable neighbor.
+        """
+        direction = self.directions[pos.x, pos.y]
+        if direction < 0:
+            return None
+        return pos + NEIGHBOR_OFFSETS[direction]
+
+
+class FlowFieldService:
+    """
+    Flow fields shared by every character, one per (restricted tile types, targets).
+
+    Characters converging on the same location reuse one field instead of searching
+    a path each. Fields are kept in an LRU and dropped when the grid version changes.
+    """
+
+    def __init__(self, grid, max_fields=PATH_FINDING.MAX_FLOW_FIELDS) -> None:
+        self.grid = grid
+        self.max_fields = max_fields
+        self.grid_version = None
+        self.fields: OrderedDict[tuple, FlowField] = OrderedDict()
+        self.compute_count = 0
+        self.hit_count = 0
+
+    def sync(self):
+        if self.grid_version != self.grid.get_version():
+            self.fields.clear()
+            self.grid_version = self.grid.get_version()
+
+    def get_field(self, restricted_tile_types, targets) -> FlowField:
+        self.sync()
+        key = (frozenset(restricted_tile_types), frozenset(targets))
+        if key in self.fields:
+            self.hit_count += 1
+            self.fields.move_to_end(key)
+            return self.fields[key]
+
+        self.compute_count += 1
+        passable_map = self.grid.get_path_finder().get_passable_map(key[0])
+        self.fields[key] = FlowField(passable_map, key[1])
+        while len(self.fields) > self.max_fields:
+            self.fields.popitem(last=False)
+        return self.fields[key]
+
+    def get_next_step(self, restricted_tile_types, pos: Point, targets):
+        if not (0 <= pos.x < self.grid.width and 0 <= pos.y < self.grid.height):
+            return None
+        return self.get_field(restricted_tile_types, targets).get_next_step(pos)
+
+    def get_stats(self):
+        return {
+            "computed_fields": self.compute_count,
+            "field_hits": self.hit_count,
+            "cached_fields": len(self.fields),
+        }
@@ -1,5 +1,11 @@
+import numpy
+
 from components.world.tile import Tile, GroundTile, TownTile, tile_map
 from components.world.store import get_store, EntityType
+from components.display.damage_tracker import get_damage_tracker
+from components.world.spatial_index import SpatialIndex
+from components.world.path_finder import PathFinder
+from components.world.flow_field import FlowFieldService
 from components.common.point import Point
 
 
@@ -9,6 +15,18 @@ class Grid:
         self.initialize_tiles(grid_data)
         self.width = len(self.tiles)
         self.height = len(self.tiles[0])
+        Point.intern_area(self.width, self.height)
+        # Per-cell flags mirrored from the tiles, only refreshed when a tile changes
+        self.tile_id_map = numpy.array(self.tiles, dtype=numpy.int64)
+        self.obstacle_map = numpy.zeros((self.width, self.height), dtype=bool)
+        self.vision_blocking_map = numpy.zeros((self.width, self.height), dtype=bool)
+        # Bumped on every terrain change, lets caches built on top of the maps expire
+        self.version = 0
+        self.refresh_tile_maps()
+        # Characters by location, maintained by the character creation, Move and death
+        self.spatial_index = SpatialIndex()
+        self.path_finder = PathFinder(self)
+        self.flow_fields = FlowFieldService(self)
 
     # def convert_grid_data(self, grid_data):
     #     new_grid_data = [
@@ -31,8 +49,51 @@ class Grid:
                 store.add(EntityType.TILE, tile.id, tile)
         self.tiles = [[tile.id for tile in row] for row in self.tiles]
 
+    def refresh_tile_maps(self):
+        store = get_store()
+        for x, row in enumerate(self.tiles):
+            for y, tile_id in enumerate(row):
+                tile = store.get(EntityType.TILE, tile_id)
+                self.obstacle_map[x, y] = tile.is_obstacle()
+                self.vision_blocking_map[x, y] = tile.is_block_vision()
+        self.version += 1
+
+    # Must be called whenever the obstacle or vision status of the tile at pos changes
+    def on_tile_changed(self, pos: Point):
+        tile = get_store().get(EntityType.TILE, self.tiles[pos.x][pos.y])
+        self.obstacle_map[pos.x, pos.y] = tile.is_obstacle()
+        self.vision_blocking_map[pos.x, pos.y] = tile.is_block_vision()
+        self.version += 1
+
+    def set_tile(self, pos: Point, tile: Tile):
+        store = get_store()
+        store.remove(EntityType.TILE, self.tiles[pos.x][pos.y])
+        store.add(EntityType.TILE, tile.id, tile)
+        self.tiles[pos.x][pos.y] = tile.id
+        self.tile_id_map[pos.x, pos.y] = tile.id
+        self.on_tile_changed(pos)
+        get_damage_tracker().mark_tile(tile.id)
+
+    def get_version(self):
+        return self.version
+
+    def get_spatial_index(self) -> SpatialIndex:
+        return self.spatial_index
+
+    def get_path_finder(self) -> PathFinder:
+        return self.path_finder
+
+    def get_flow_fields(self) -> FlowFieldService:
+        return self.flow_fields
+
+    def get_obstacle_map(self):
+        return self.obstacle_map
+
+    def get_vision_blocking_map(self):
+        return self.vision_blocking_map
+
     def is_valid_location(self, pos: Point):
-        if pos.x < 0 or pos.x >= self.width or pos.y < 0 or pos.y > self.height:
+        if pos.x < 0 or pos.x >= self.width or pos.y < 0 or pos.y >= self.height:
             return False
         return True
 
@@ -44,7 +105,7 @@ class Grid:
     def is_moveable_tile(self, pos: Point):
         if not self.is_valid_location(pos):
             return False
-        if self.tiles[pos.x][pos.y].is_obstacle:
+        if self.obstacle_map[pos.x, pos.y]:
             return False
         return True
 
@@ -0,0 +1,151 @@
+import heapq
+from collections import OrderedDict
+
+import numpy
+
+from components.common.point import Point, NEIGHBOR_OFFSETS
+from components.world.store import get_store, EntityType
+from data.game_settings import PATH_FINDING
+
+# Marks a cached search without any path, a missing key means not searched yet
+NO_PATH = object()
+
+
+class PathFinder:
+    """
+    A* over the passability map of a grid, one map per set of restricted tile types.
+
+    Every found path is cached as next steps keyed by (restricted tile types, position, goal),
+    so a character following a path only searches once. The passability maps and the
+    cached steps are dropped whenever the grid version changes.
+    """
+
+    def __init__(self, grid, max_cached_steps=PATH_FINDING.MAX_CACHED_STEPS) -> None:
+        self.grid = grid
+        self.max_cached_steps = max_cached_steps
+        self.grid_version = None
+        # frozenset of restricted tile types: passable cells, as an array and as a flat list
+        self.passable_maps: dict[frozenset, numpy.ndarray] = {}
+        self.flat_passable_maps: dict[frozenset, list[bool]] = {}
+        self.next_steps = OrderedDict()
+        self.search_count = 0
+        self.hit_count = 0
+
+    def sync(self):
+        if self.grid_version != self.grid.get_version():
+            self.passable_maps.clear()
+            self.flat_passable_maps.clear()
+            self.next_steps.clear()
+            self.grid_version = self.grid.get_version()
+
+    def get_passable_map(self, restricted_tile_types: frozenset) -> numpy.ndarray:
+        self.sync()
+        if restricted_tile_types not in self.passable_maps:
+            passable_map = self.compute_passable_map(restricted_tile_types)
+            passable_map.setflags(write=False)
+            self.passable_maps[restricted_tile_types] = passable_map
+        return self.passable_maps[restricted_tile_types]
+
+    def compute_passable_map(self, restricted_tile_types: frozenset) -> numpy.ndarray:
+        store = get_store()
+        restricted_tile_types = tuple(restricted_tile_types)
+        passable_map = ~self.grid.get_obstacle_map()
+        if restricted_tile_types:
+            for x, row in enumerate(self.grid.tiles):
+                for y, tile_id in enumerate(row):
+                    if isinstance(
+                        store.get(EntityType.TILE, tile_id), restricted_tile_types
+                    ):
+                        passable_map[x, y] = False
+        return passable_map
+
+    def get_flat_passable_map(self, restricted_tile_types: frozenset):
+        if restricted_tile_types not in self.flat_passable_maps:
+            self.flat_passable_maps[restricted_tile_types] = (
+                self.get_passable_map(restricted_tile_types).ravel().tolist()
+            )
+        return self.flat_passable_maps[restricted_tile_types]
+
+    def get_next_step(self, restricted_tile_types, start: Point, goal: Point):
+        """Next position from start on a shortest path to goal, None when unreachable."""
+        self.sync()
+        restricted_tile_types = frozenset(restricted_tile_types)
+        key = (restricted_tile_types, start, goal)
+        next_step = self.next_steps.get(key)
+        if next_step is not None:
+            self.hit_count += 1
+            self.next_steps.move_to_end(key)
+            return None if next_step is NO_PATH else next_step
+
+        path = self.find_path(restricted_tile_types, start, goal)
+        if path is None:
+            self.cache_step(key, NO_PATH)
+            return None
+        for position, next_position in zip([start] + path, path):
+            self.cache_step((restricted_tile_types, position, goal), next_position)
+        return path[0]
+
+    def cache_step(self, key, next_step):
+        self.next_steps[key] = next_step
+        self.next_steps.move_to_end(key)
+        while len(self.next_steps) > self.max_cached_steps:
+            self.next_steps.popitem(last=False)
+
+    def find_path(self, restricted_tile_types: frozenset, start: Point, goal: Point):
+        """Positions from start (excluded) to goal (included), None when unreachable."""
+        width, height = self.grid.width, self.grid.height
+        if start == goal or not (0 <= goal.x < width and 0 <= goal.y < height):
+            return None
+        passable = self.get_flat_passable_map(restricted_tile_types)
+        start_index, goal_index = start.x * height + start.y, goal.x * height + goal.y
+        if not passable[goal_index]:
+            return None
+
+        self.search_count += 1
+        # Flat cell indexes, x * height + y, with the Manhattan distance as heuristic
+        neighbor_offsets = [
+            (offset.x, offset.y, offset.x * height + offset.y)
+            for offset in NEIGHBOR_OFFSETS
+        ]
+        costs = {start_index: 0}
+        parents = {start_index: None}
+        open_heap = [(Point.get_distance_man(start, goal), 0, start_index)]
+        while open_heap:
+            _, cost, index = heapq.heappop(open_heap)
+            if index == goal_index:
+                break
+            if cost > costs[index]:
+                continue
+            x, y = divmod(index, height)
+            for offset_x, offset_y, offset_index in neighbor_offsets:
+                next_x, next_y = x + offset_x, y + offset_y
+                if not (0 <= next_x < width and 0 <= next_y < height):
+                    continue
+                next_index = index + offset_index
+                if not passable[next_index]:
+                    continue
+                next_cost = cost + 1
+                if next_cost < costs.get(next_index, next_cost + 1):
+                    costs[next_index] = next_cost
+                    parents[next_index] = index
+                    heuristic = abs(next_x - goal.x) + abs(next_y - goal.y)
+                    heapq.heappush(
+                        open_heap, (next_cost + heuristic, next_cost, next_index)
+                    )
+        else:
+            return None
+
+        path = []
+        index = goal_index
+        while index != start_index:
+            path.append(Point.get(*divmod(index, height)))
+            index = parents[index]
+        path.reverse()
+        return path
+
+    def get_stats(self):
+        return {
+            "searches": self.search_count,
+            "cache_hits": self.hit_count,
+            "cached_steps": len(self.next_steps),
+        }
@@ -0,0 +1,146 @@
+import numpy
+
+from components.common.point import Point
+from components.world.tile import tile_map
+
+
+class RegionPartition:
+    """
+    Split of the map into rectangular regions, by recursive bisection.
+
+    Every cut is placed close to the line balancing the passable cells of both sides,
+    preferring the lines crossing the fewest passable cells, so regions follow the water
+    and walls separating the areas of the map and few characters walk across them.
+    """
+
+    # A cut may move this far from the balanced position, as a ratio of the passable cells
+    BALANCE_TOLERANCE = 0.2
+
+    def __init__(self, region_map: numpy.ndarray, region_count: int) -> None:
+        # region_map[x][y]: region id of the cell
+        self.region_map = region_map
+        self.region_count = region_count
+
+    @classmethod
+    def from_grid_data(cls, grid_data, region_count: int) -> "RegionPartition":
+        # Only the tile classes are needed, no tile is registered in the store
+        obstacle_tile_ids = {
+            tile_id
+            for tile_id, tile_class in tile_map.items()
+            if tile_class().is_obstacle()
+        }
+        passable_map = ~numpy.isin(numpy.array(grid_data), list(obstacle_tile_ids))
+        return cls.from_passable_map(passable_map, region_count)
+
+    @classmethod
+    def from_passable_map(cls, passable_map: numpy.ndarray, region_count: int):
+        region_map = numpy.zeros(passable_map.shape, dtype=numpy.int32)
+        cls.split(
+            passable_map,
+            region_map,
+            0,
+            passable_map.shape[0],
+            0,
+            passable_map.shape[1],
+            0,
+            region_count,
+        )
+        return cls(region_map, region_count)
+
+    @classmethod
+    def split(
+        cls,
+        passable_map,
+        region_map,
+        min_x,
+        max_x,
+        min_y,
+        max_y,
+        first_region,
+        region_count,
+    ):
+        if region_count == 1:
+            region_map[min_x:max_x, min_y:max_y] = first_region
+            return
+
+        # Cut across the longer side, into regions proportional to the region counts
+        axis = 0 if max_x - min_x >= max_y - min_y else 1
+        area = passable_map[min_x:max_x, min_y:max_y]
+        line_counts = area.sum(axis=1 - axis)
+        cumulative_counts = numpy.cumsum(line_counts)
+        first_region_count = region_count // 2
+        balanced_count = cumulative_counts[-1] * first_region_count / region_count
+        tolerance = cumulative_counts[-1] * cls.BALANCE_TOLERANCE
+
+        cuts = range(1, len(line_counts))
+        imbalances = {
+            cut: abs(cumulative_counts[cut - 1] - balanced_count) for cut in cuts
+        }
+        candidate_cuts = [cut for cut in cuts if imbalances[cut] <= tolerance] or [
+            min(cuts, key=imbalances.get)
+        ]
+        lines = area if axis == 0 else area.T
+        # Cells passable on both sides of the cut are where characters walk across
+        best_cut = min(
+            candidate_cuts,
+            key=lambda cut: (
+                int((lines[cut - 1] & lines[cut]).sum()),
+                imbalances[cut],
+            ),
+        )
+
+        if axis == 0:
+            cut_x = min_x + best_cut
+            cls.split(
+                passable_map,
+                region_map,
+                min_x,
+                cut_x,
+                min_y,
+                max_y,
+                first_region,
+                first_region_count,
+            )
+            cls.split(
+                passable_map,
+                region_map,
+                cut_x,
+                max_x,
+                min_y,
+                max_y,
+                first_region + first_region_count,
+                region_count - first_region_count,
+            )
+        else:
+            cut_y = min_y + best_cut
+            cls.split(
+                passable_map,
+                region_map,
+                min_x,
+                max_x,
+                min_y,
+                cut_y,
+                first_region,
+                first_region_count,
+            )
+            cls.split(
+                passable_map,
+                region_map,
+                min_x,
+                max_x,
+                cut_y,
+                max_y,
+                first_region + first_region_count,
+                region_count - first_region_count,
+            )
+
+    def get_region(self, pos: Point):
+        return int(self.region_map[pos.x, pos.y])
+
+    def get_region_count(self):
+        return self.region_count
+
+    def get_region_sizes(self):
+        return numpy.bincount(
+            self.region_map.ravel(), minlength=self.region_count
+        ).tolist()
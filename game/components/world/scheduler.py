@@ -0,0 +1,67 @@
+import heapq
+from enum import Enum
+
+
+class PacingMode(Enum):
+    REAL_TIME = 1  # Follow the wall clock, used by the UI
+    AS_FAST_AS_POSSIBLE = 2  # Jump straight to the next due action, used by batch runs
+
+
+class ActionScheduler:
+    # Min-heap of (next_action_tick, sequence, character_id)
+    # Entries are removed lazily, an entry is stale when its tick differs from next_action_ticks
+    def __init__(self) -> None:
+        self.queue = []
+        self.next_action_ticks = {}
+        self.action_intervals = {}
+        self.sequence = 0
+
+    def schedule(self, character_id, tick: int, interval: int):
+        self.next_action_ticks[character_id] = tick
+        self.action_intervals[character_id] = interval
+        heapq.heappush(self.queue, (tick, self.sequence, character_id))
+        self.sequence += 1
+
+    def unschedule(self, character_id):
+        self.next_action_ticks.pop(character_id, None)
+        self.action_intervals.pop(character_id, None)
+
+    def has(self, character_id):
+        return character_id in self.next_action_ticks
+
+    def discard_stale(self):
+        while self.queue:
+            tick, _, character_id = self.queue[0]
+            if self.next_action_ticks.get(character_id) == tick:
+                return
+            heapq.heappop(self.queue)
+
+    def peek_next_tick(self):
+        self.discard_stale()
+        if self.queue:
+            return self.queue[0][0]
+        return None
+
+    def pop_due(self, current_tick: int):
+        due_character_ids = []
+        while True:
+            self.discard_stale()
+            if not self.queue or self.queue[0][0] > current_tick:
+                break
+            _, _, character_id = heapq.heappop(self.queue)
+            self.next_action_ticks.pop(character_id)
+            due_character_ids.append(character_id)
+        return due_character_ids
+
+    def get_next_action_tick(self, character_id):
+        return self.next_action_ticks.get(character_id)
+
+    # Remaining part of the waiting time until the next action, 1 means just acted
+    def get_action_percentage(self, character_id, current_tick: int):
+        if character_id not in self.next_action_ticks:
+            return 0
+        remaining_ticks = self.next_action_ticks[character_id] - current_tick
+        return max(0, remaining_ticks / self.action_intervals[character_id])
+
+    def __len__(self):
+        return len(self.next_action_ticks)
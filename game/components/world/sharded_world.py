@@ -0,0 +1,254 @@
+import pickle
+import random
+import multiprocessing
+from enum import Enum
+
+from components.action.event import Event
+from components.character.character_info import CharacterInfo
+from components.character.character_table import get_character_table
+from components.world.map_loader import MapLoader
+from components.world.world_builder import WorldBuilder
+from components.world.region_partition import RegionPartition
+from components.world.scheduler import PacingMode
+from components.world.store import get_store, EntityType
+
+from data.logs.logger import get_logger
+from data.game_settings import SHARDING
+
+logger = get_logger(__name__)
+
+
+class ShardMessageType(Enum):
+    # coordinator -> worker: (STEP, (target_tick, pickled incoming characters))
+    STEP = 1
+    # worker -> coordinator: (STEP_DONE, (outgoing (region, faction, pickled character), report))
+    STEP_DONE = 2
+    # coordinator -> worker: (STOP, None), answered by (STOPPED, report)
+    STOP = 3
+    STOPPED = 4
+
+
+class RegionWorker:
+    """
+    Simulation of one region of the map, runs in its own process.
+
+    The worker builds the whole world with the same seed as the other workers, so every
+    process has the same grid and tile ids, then keeps only the generators spawning in its
+    region. Characters walking out of the region are handed off at the next barrier,
+    characters in a combat stay until the combat is over.
+    """
+
+    def __init__(
+        self, region, partition: RegionPartition, map_path, seed, char_speed_multiplier
+    ) -> None:
+        self.region = region
+        self.partition = partition
+        # Unique ids across the regions, the handed off characters keep theirs
+        CharacterInfo.id_counter = region * SHARDING.ID_STRIDE + 1
+        Event.id_counter = region * SHARDING.ID_STRIDE
+
+        random.seed(seed)
+        self.world, _ = WorldBuilder.build(
+            map_path,
+            char_speed_multiplier=char_speed_multiplier,
+            pacing_mode=PacingMode.AS_FAST_AS_POSSIBLE,
+        )
+        self.world.set_generators(
+            [
+                generator
+                for generator in self.world.get_generators()
+                if partition.get_region(generator.location) == region
+            ]
+        )
+        random.seed(seed + region + 1)
+
+    def step(self, target_tick, incoming_characters):
+        for character_data in incoming_characters:
+            self.world.add_character(pickle.loads(character_data))
+        self.world.advance_to(target_tick)
+        return self.pop_outgoing_characters(), self.get_report()
+
+    def pop_outgoing_characters(self):
+        outgoing_characters = []
+        for character in get_store().get_all(EntityType.CHARACTER):
+            if not character.is_alive() or character.get_combat_event_id() is not None:
+                continue
+            region = self.partition.get_region(character.get_location())
+            if region != self.region:
+                outgoing_characters.append(
+                    (region, character.get_race(), pickle.dumps(character))
+                )
+                self.world.remove_character(character)
+        return outgoing_characters
+
+    def get_report(self):
+        character_table = get_character_table()
+        return {
+            "region": self.region,
+            "tick": self.world.get_current_tick(),
+            "action_count": self.world.get_action_count(),
+            "alive": character_table.count_by_faction(is_alive=True),
+            "dead": character_table.count_by_faction(is_alive=False),
+            "characters": [
+                {
+                    "id": character.get_id(),
+                    "faction": character.get_race(),
+                    "x": character.get_location().x,
+                    "y": character.get_location().y,
+                    "level": character.get_current_level(),
+                }
+                for character in get_store().get_all(EntityType.CHARACTER)
+                if character.is_alive()
+            ],
+        }
+
+    @staticmethod
+    def run(connection, region, partition, map_path, seed, char_speed_multiplier):
+        # Process entry point, serves the coordinator messages until STOP
+        worker = RegionWorker(region, partition, map_path, seed, char_speed_multiplier)
+        while True:
+            message_type, payload = connection.recv()
+            if message_type is ShardMessageType.STEP:
+                target_tick, incoming_characters = payload
+                connection.send(
+                    (
+                        ShardMessageType.STEP_DONE,
+                        worker.step(target_tick, incoming_characters),
+                    )
+                )
+            elif message_type is ShardMessageType.STOP:
+                connection.send((ShardMessageType.STOPPED, worker.get_report()))
+                connection.close()
+                return
+            else:
+                raise Exception(f"Unexpected shard message '{message_type}'")
+
+
+class ShardCoordinator:
+    """
+    Runs a world split into regions, one worker process per region.
+
+    Every step sends the next target tick with the characters handed off to each region,
+    then waits for all the workers, which is the barrier. The characters leaving a region
+    are routed to the region of their new position for the next step. The reports of the
+    workers are aggregated for monitoring and rendering.
+    """
+
+    def __init__(
+        self,
+        map_path=None,
+        region_count=SHARDING.REGION_COUNT,
+        seed=None,
+        char_speed_multiplier=None,
+        ticks_per_barrier=SHARDING.TICKS_PER_BARRIER,
+    ) -> None:
+        self.map_path = map_path or WorldBuilder.default_map_path
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.char_speed_multiplier = char_speed_multiplier
+        self.ticks_per_barrier = ticks_per_barrier
+        self.partition = RegionPartition.from_grid_data(
+            MapLoader.load_map(self.map_path), region_count
+        )
+        self.current_tick = 0
+        self.handoff_count = 0
+        self.connections = []
+        self.processes = []
+        # region: (faction, pickled character) waiting for the next step of the region
+        self.pending_characters = {region: [] for region in range(region_count)}
+        self.reports = {}
+
+    def start(self):
+        for region in range(self.partition.get_region_count()):
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=RegionWorker.run,
+                args=(
+                    worker_connection,
+                    region,
+                    self.partition,
+                    self.map_path,
+                    self.seed,
+                    self.char_speed_multiplier,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self.connections.append(connection)
+            self.processes.append(process)
+        logger.info(
+            "Started %s region workers, region sizes %s",
+            len(self.processes),
+            self.partition.get_region_sizes(),
+        )
+
+    def step(self):
+        target_tick = self.current_tick + self.ticks_per_barrier
+        for region, connection in enumerate(self.connections):
+            incoming_characters = [
+                character_data for _, character_data in self.pending_characters[region]
+            ]
+            connection.send((ShardMessageType.STEP, (target_tick, incoming_characters)))
+            self.pending_characters[region] = []
+
+        for connection in self.connections:
+            message_type, (outgoing_characters, report) = connection.recv()
+            if message_type is not ShardMessageType.STEP_DONE:
+                raise Exception(f"Unexpected shard message '{message_type}'")
+            self.reports[report["region"]] = report
+            for region, faction, character_data in outgoing_characters:
+                self.pending_characters[region].append((faction, character_data))
+                self.handoff_count += 1
+        self.current_tick = target_tick
+
+    def run(self, ticks):
+        while self.current_tick < ticks:
+            self.step()
+
+    def stop(self):
+        for connection in self.connections:
+            connection.send((ShardMessageType.STOP, None))
+        for connection in self.connections:
+            _, report = connection.recv()
+            self.reports[report["region"]] = report
+        for process in self.processes:
+            process.join()
+        self.connections = []
+        self.processes = []
+
+    def get_current_tick(self):
+        return self.current_tick
+
+    def get_action_count(self):
+        return sum(report["action_count"] for report in self.reports.values())
+
+    def get_handoff_count(self):
+        return self.handoff_count
+
+    @staticmethod
+    def merge_counts(counts_list):
+        merged_counts = {}
+        for counts in counts_list:
+            for faction, count in counts.items():
+                merged_counts[faction] = merged_counts.get(faction, 0) + count
+        return merged_counts
+
+    def get_population(self):
+        # Characters waiting for a handoff are alive and counted by no region yet
+        alive_count = self.merge_counts(
+            report["alive"] for report in self.reports.values()
+        )
+        for pending_characters in self.pending_characters.values():
+            for faction, _ in pending_characters:
+                alive_count[faction] = alive_count.get(faction, 0) + 1
+        dead_count = self.merge_counts(
+            report["dead"] for report in self.reports.values()
+        )
+        return alive_count, dead_count
+
+    def get_characters(self):
+        # Alive characters of every region at the last barrier, for rendering and monitoring
+        return [
+            character
+            for report in self.reports.values()
+            for character in report["characters"]
+        ]
@@ -0,0 +1,171 @@
+from components.common.point import Point
+
+BUCKET_SIZE = 8
+
+
+class SpatialIndex:
+    """
+    Characters by location, kept in uniform buckets of bucket_size x bucket_size cells.
+
+    Every cell and bucket also keeps a bitmask of the factions standing in it, so the
+    queries filtered by factions skip the cells and buckets without any of them.
+    Queries cost the number of buckets overlapping the query area plus the number of
+    characters in them.
+    """
+
+    def __init__(self, bucket_size=BUCKET_SIZE) -> None:
+        self.bucket_size = bucket_size
+        # character_id: (pos, faction)
+        self.locations: dict[int, tuple[Point, str]] = {}
+        # pos: {character_id: faction}
+        self.cells: dict[Point, dict[int, str]] = {}
+        # (bucket_x, bucket_y): {character_id: (pos, faction)}
+        self.buckets: dict[tuple[int, int], dict[int, tuple[Point, str]]] = {}
+        self.faction_bits: dict[str, int] = {}
+        # {pos or (bucket_x, bucket_y): {faction: count}}, the masks are derived from them
+        self.cell_faction_counts: dict[Point, dict[str, int]] = {}
+        self.cell_masks: dict[Point, int] = {}
+        self.bucket_faction_counts: dict[tuple[int, int], dict[str, int]] = {}
+        self.bucket_masks: dict[tuple[int, int], int] = {}
+
+    def get_faction_bit(self, faction):
+        if faction not in self.faction_bits:
+            self.faction_bits[faction] = 1 << len(self.faction_bits)
+        return self.faction_bits[faction]
+
+    def get_faction_mask(self, factions):
+        mask = 0
+        for faction in factions:
+            mask |= self.get_faction_bit(faction)
+        return mask
+
+    def get_bucket(self, x, y):
+        return x // self.bucket_size, y // self.bucket_size
+
+    @staticmethod
+    def add_faction(faction_counts, masks, key, faction, faction_bit):
+        counts = faction_counts.setdefault(key, {})
+        counts[faction] = counts.get(faction, 0) + 1
+        masks[key] = masks.get(key, 0) | faction_bit
+
+    @staticmethod
+    def remove_faction(faction_counts, masks, key, faction, faction_bit):
+        counts = faction_counts[key]
+        counts[faction] -= 1
+        if counts[faction] == 0:
+            counts.pop(faction)
+            masks[key] &= ~faction_bit
+            if not counts:
+                faction_counts.pop(key)
+                masks.pop(key)
+
+    def add(self, character_id, faction, pos: Point):
+        if character_id in self.locations:
+            raise Exception(f"Character {character_id} is already in the spatial index")
+        faction_bit = self.get_faction_bit(faction)
+        bucket = self.get_bucket(pos.x, pos.y)
+
+        self.locations[character_id] = (pos, faction)
+        self.cells.setdefault(pos, {})[character_id] = faction
+        self.buckets.setdefault(bucket, {})[character_id] = (pos, faction)
+        self.add_faction(
+            self.cell_faction_counts, self.cell_masks, pos, faction, faction_bit
+        )
+        self.add_faction(
+            self.bucket_faction_counts, self.bucket_masks, bucket, faction, faction_bit
+        )
+
+    def remove(self, character_id):
+        if character_id not in self.locations:
+            raise Exception(f"Character {character_id} is not in the spatial index")
+        pos, faction = self.locations.pop(character_id)
+        faction_bit = self.faction_bits[faction]
+        bucket = self.get_bucket(pos.x, pos.y)
+
+        cell_character_ids = self.cells[pos]
+        cell_character_ids.pop(character_id)
+        if not cell_character_ids:
+            self.cells.pop(pos)
+        bucket_characters = self.buckets[bucket]
+        bucket_characters.pop(character_id)
+        if not bucket_characters:
+            self.buckets.pop(bucket)
+        self.remove_faction(
+            self.cell_faction_counts, self.cell_masks, pos, faction, faction_bit
+        )
+        self.remove_faction(
+            self.bucket_faction_counts, self.bucket_masks, bucket, faction, faction_bit
+        )
+
+    def move(self, character_id, pos: Point):
+        _, faction = self.locations[character_id]
+        self.remove(character_id)
+        self.add(character_id, faction, pos)
+
+    def has(self, character_id):
+        return character_id in self.locations
+
+    def get_location(self, character_id):
+        pos, _ = self.locations[character_id]
+        return pos
+
+    def get_character_ids_at(self, pos: Point, factions=None):
+        cell_character_ids = self.cells.get(pos)
+        if not cell_character_ids:
+            return []
+        if factions is None:
+            return list(cell_character_ids)
+        if not self.cell_masks[pos] & self.get_faction_mask(factions):
+            return []
+        return [
+            character_id
+            for character_id, faction in cell_character_ids.items()
+            if faction in factions
+        ]
+
+    def has_factions_at(self, pos: Point, factions):
+        return bool(self.cell_masks.get(pos, 0) & self.get_faction_mask(factions))
+
+    def get_character_ids_in_rect(self, min_x, min_y, max_x, max_y, factions=None):
+        """Characters within the inclusive rect, optionally only of the given factions."""
+        return [
+            character_id
+            for character_id, _ in self.iterate_rect(
+                min_x, min_y, max_x, max_y, factions
+            )
+        ]
+
+    def get_character_ids_in_radius(self, pos: Point, radius: int, factions=None):
+        """Characters within the Manhattan distance radius of pos, like the vision diamond."""
+        return [
+            character_id
+            for character_id, _ in self.iterate_radius(pos, radius, factions)
+        ]
+
+    def iterate_radius(self, pos: Point, radius: int, factions=None):
+        for character_id, other_pos in self.iterate_rect(
+            pos.x - radius, pos.y - radius, pos.x + radius, pos.y + radius, factions
+        ):
+            if Point.get_distance_man(pos, other_pos) <= radius:
+                yield character_id, other_pos
+
+    def iterate_rect(self, min_x, min_y, max_x, max_y, factions=None):
+        faction_mask = None if factions is None else self.get_faction_mask(factions)
+        min_bucket_x, min_bucket_y = self.get_bucket(min_x, min_y)
+        max_bucket_x, max_bucket_y = self.get_bucket(max_x, max_y)
+        for bucket_x in range(min_bucket_x, max_bucket_x + 1):
+            for bucket_y in range(min_bucket_y, max_bucket_y + 1):
+                bucket = (bucket_x, bucket_y)
+                bucket_characters = self.buckets.get(bucket)
+                if not bucket_characters:
+                    continue
+                if faction_mask is not None and not (
+                    self.bucket_masks[bucket] & faction_mask
+                ):
+                    continue
+                for character_id, (pos, faction) in bucket_characters.items():
+                    if not (min_x <= pos.x <= max_x and min_y <= pos.y <= max_y):
+                        continue
+                    if factions is not None and faction not in factions:
+                        continue
+                    yield character_id, pos
@@ -1,7 +1,7 @@
 from enum import Enum
 import threading
 
-from components.database.producer import produce_messages
+from components.database.producer import produce_messages, is_producing_enabled
 
 
 class EntityType(Enum):
@@ -14,48 +14,67 @@ class EntityType(Enum):
 
 class Store:
     def __init__(self) -> None:
-        self.data = {}
+        # One table per entity type keyed by the entity id, typed lookups never touch other types
+        self.tables = {entity_type: {} for entity_type in EntityType}
         self.recently_added = {
             EntityType.CHARACTER: None,
             EntityType.ITEM: None,
             EntityType.EVENT: None,
         }
+        # Characters ordered by level, rebuilt on demand when marked as dirty
+        self.level_ordered_characters = None
+
+    # Forget every entity, before building another world in the same process
+    def reset(self):
+        for table in self.tables.values():
+            table.clear()
+        for entity_type in self.recently_added:
+            self.recently_added[entity_type] = None
+        self.level_ordered_characters = None
 
     @staticmethod
     def get_key(entity_type: EntityType, id):
         return f"{entity_type.value}@{id}"
 
     def add(self, entity_type: EntityType, id, obj):
-        key = Store.get_key(entity_type, id)
-        if key in self.data:
+        table = self.tables[entity_type]
+        if id in table:
             raise Exception(f"Id: '{id}' already exists in data store")
 
-        if hasattr(obj, "to_dict") and callable(getattr(obj, "to_dict")):
+        if (
+            is_producing_enabled()
+            and hasattr(obj, "to_dict")
+            and callable(getattr(obj, "to_dict"))
+        ):
             obj_dict = obj.to_dict()
             obj_dict["data_action"] = "update"
             produce_messages(obj_dict)
 
-        self.data[key] = obj
+        table[id] = obj
         if entity_type in (EntityType.CHARACTER, EntityType.ITEM, EntityType.EVENT):
             self.recently_added[entity_type] = obj
+        if entity_type == EntityType.CHARACTER:
+            self.invalidate_level_order()
 
     def remove(self, entity_type: EntityType, id):
-        key = Store.get_key(entity_type, id)
-
-        obj = self.data[key]
-        if hasattr(obj, "to_dict") and callable(getattr(obj, "to_dict")):
+        table = self.tables[entity_type]
+
+        obj = table[id]
+        if (
+            is_producing_enabled()
+            and hasattr(obj, "to_dict")
+            and callable(getattr(obj, "to_dict"))
+        ):
             obj_dict = obj.to_dict()
             obj_dict["data_action"] = "delete"
             produce_messages(obj_dict)
 
-        if key in self.data:
-            self.data.pop(key)
+        table.pop(id)
+        if entity_type == EntityType.CHARACTER:
+            self.invalidate_level_order()
 
     def get(self, entity_type: EntityType, id):
-        key = Store.get_key(entity_type, id)
-        if key in self.data:
-            return self.data[key]
-        return None
+        return self.tables[entity_type].get(id)
 
     def get_recently_added(self, entity_type: EntityType):
         if entity_type in self.recently_added:
@@ -63,20 +82,24 @@ class Store:
         return None
 
     def get_all(self, entity_type: EntityType):
-        all_entities = [
-            obj
-            for key, obj in self.data.items()
-            if key.startswith(f"{entity_type.value}")
-        ]
-        # Get character descending by level, because when drawing, we should draw the highest level character
-        # if multiple characters are standing on the same tile
-        if entity_type == EntityType.CHARACTER:
-            all_entities = sorted(
-                all_entities,
+        return list(self.tables[entity_type].values())
+
+    def count(self, entity_type: EntityType):
+        return len(self.tables[entity_type])
+
+    def invalidate_level_order(self):
+        self.level_ordered_characters = None
+
+    # Get character descending by level, because when drawing, we should draw the highest level character
+    # if multiple characters are standing on the same tile
+    def get_all_by_level(self):
+        if self.level_ordered_characters is None:
+            self.level_ordered_characters = sorted(
+                self.tables[EntityType.CHARACTER].values(),
                 key=lambda char: char.get_level().get_current_level(),
                 reverse=True,
             )
-        return all_entities
+        return self.level_ordered_characters
 
 
 store = Store()
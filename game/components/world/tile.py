@@ -1,6 +1,8 @@
-import pygame
+from types import MappingProxyType
 
 from components.action.event import EventType
+from components.display.damage_tracker import get_damage_tracker
+from components.utils.random_utils import WeightedSampler
 from components.character.status import GroundTileBuff, TownTileBuff
 from components.item.equipment import DamagedAncientArmor, DamagedAncientSword
 
@@ -9,23 +11,37 @@ from components.item.equipment import DamagedAncientArmor, DamagedAncientSword
 # TODO: WHERE TF IS THE TILE's LOCATION POINT PROPERTY
 class Tile:
     id_counter = 1
+    image_path = None
     image = None
 
     def __init__(self) -> None:
         self.id = Tile.id_counter
         Tile.id_counter += 1
         self.character_ids = {}
-        self.is_tile_display_changed = False
         self.is_combat = False
         self.event_dict_ids = {}
         self.collectable_items = {}
+        # Bumped whenever the state remembered by characters changes (combat, collectable items)
+        self.version = 0
+        self.snapshot = None
+        self.collectable_item_sampler = None
+        self.collectable_item_sampler_version = -1
 
     @classmethod
     def get_name(cls):
         return cls.__name__
 
+    @classmethod
+    def get_image_path(cls):
+        return cls.image_path
+
+    # Sprites are only loaded when a renderer asks for them, so the simulation can run headless
     @classmethod
     def get_image(cls):
+        if cls.image is None and cls.image_path:
+            import pygame
+
+            cls.image = pygame.image.load(cls.image_path)
         return cls.image
 
     def get_id(self):
@@ -45,9 +61,19 @@ class Tile:
             return self.event_dict_ids[event_type]
         return None
 
+    def get_version(self):
+        return self.version
+
+    # The snapshot is shared by every character remembering this version of the tile
+    def get_snapshot(self):
+        if self.snapshot is None or self.snapshot.get_version() != self.version:
+            self.snapshot = TileSnapshot(self)
+        return self.snapshot
+
     def set_tile_combat_status(self, is_combat: bool, combat_event_id=None):
         if self.is_combat != is_combat:
-            self.is_tile_display_changed = True
+            get_damage_tracker().mark_tile(self.id)
+            self.version += 1
         self.is_combat = is_combat
 
         if self.is_combat:
@@ -60,18 +86,11 @@ class Tile:
 
     def add_character_id(self, character_id):
         self.character_ids[character_id] = 1
-        self.is_tile_display_changed = False
+        get_damage_tracker().mark_tile(self.id)
 
     def remove_character_id(self, character_id):
         self.character_ids.pop(character_id)
-        if len(self.character_ids) == 0:
-            self.is_tile_display_changed = True
-
-    def should_redraw(self):
-        return self.is_tile_display_changed
-
-    def reset_redraw_status(self):
-        self.is_tile_display_changed = False
+        get_damage_tracker().mark_tile(self.id)
 
     def character_move_in(self, character):
         self.add_character_id(character.get_info().id)
@@ -83,6 +102,79 @@ class Tile:
     def get_collectable_items(self):
         return self.collectable_items
 
+    # Sampler of the collectable items by their drop chance, rebuilt when the items change
+    def get_collectable_item_sampler(self):
+        if self.collectable_item_sampler_version != self.version:
+            self.collectable_item_sampler = WeightedSampler(
+                self.collectable_items.keys(), self.collectable_items.values()
+            )
+            self.collectable_item_sampler_version = self.version
+        return self.collectable_item_sampler
+
+    def set_collectable_items(self, collectable_items):
+        self.collectable_items = collectable_items
+        self.version += 1
+
+    def get_collectable_item_list(self):
+        return list(self.collectable_items.keys())
+
+    def is_collectable(self):
+        return len(self.collectable_items) > 0
+
+
+class TileSnapshot:
+    # Immutable summary of a tile at a given version, what a character remembers about it
+    __slots__ = ("id", "name", "version", "is_combat", "collectable_items")
+
+    def __init__(self, tile: Tile) -> None:
+        object.__setattr__(self, "id", tile.get_id())
+        object.__setattr__(self, "name", tile.get_name())
+        object.__setattr__(self, "version", tile.get_version())
+        object.__setattr__(self, "is_combat", tile.is_combat_happen())
+        object.__setattr__(
+            self,
+            "collectable_items",
+            MappingProxyType(dict(tile.get_collectable_items())),
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    # Snapshots travel with the memories of a character handed off to another process
+    def __getstate__(self):
+        return (
+            self.id,
+            self.name,
+            self.version,
+            self.is_combat,
+            dict(self.collectable_items),
+        )
+
+    def __setstate__(self, state):
+        id, name, version, is_combat, collectable_items = state
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "is_combat", is_combat)
+        object.__setattr__(
+            self, "collectable_items", MappingProxyType(collectable_items)
+        )
+
+    def get_id(self):
+        return self.id
+
+    def get_name(self):
+        return self.name
+
+    def get_version(self):
+        return self.version
+
+    def is_combat_happen(self):
+        return self.is_combat
+
+    def get_collectable_items(self):
+        return self.collectable_items
+
     def get_collectable_item_list(self):
         return list(self.collectable_items.keys())
 
@@ -91,7 +183,7 @@ class Tile:
 
 
 class HumanGeneratorTile(Tile):
-    image = pygame.image.load("data/sprites/generator.png")
+    image_path = "data/sprites/generator.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -101,7 +193,7 @@ class HumanGeneratorTile(Tile):
 
 
 class DemonGeneratorTile(Tile):
-    image = pygame.image.load("data/sprites/generator.png")
+    image_path = "data/sprites/generator.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -111,7 +203,7 @@ class DemonGeneratorTile(Tile):
 
 
 class WaterTile(Tile):
-    image = pygame.image.load("data/sprites/water1.png")
+    image_path = "data/sprites/water1.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -121,7 +213,7 @@ class WaterTile(Tile):
 
 
 class GroundTile(Tile):
-    image = pygame.image.load("data/sprites/ground1.png")
+    image_path = "data/sprites/ground1.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -137,7 +229,7 @@ class GroundTile(Tile):
 
 
 class VillageTile(Tile):
-    image = pygame.image.load("data/sprites/village1.png")
+    image_path = "data/sprites/village1.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -147,7 +239,7 @@ class VillageTile(Tile):
 
 
 class TownTile(Tile):
-    image = pygame.image.load("data/sprites/town1.png")
+    image_path = "data/sprites/town1.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -163,7 +255,7 @@ class TownTile(Tile):
 
 
 class SwampTile(Tile):
-    image = pygame.image.load("data/sprites/swamp1.png")
+    image_path = "data/sprites/swamp1.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -173,7 +265,7 @@ class SwampTile(Tile):
 
 
 class ForestTile(Tile):
-    image = pygame.image.load("data/sprites/forest1.png")
+    image_path = "data/sprites/forest1.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -183,7 +275,7 @@ class ForestTile(Tile):
 
 
 class CorruptedTile(Tile):
-    image = pygame.image.load("data/sprites/corrupted1.png")
+    image_path = "data/sprites/corrupted1.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -193,7 +285,7 @@ class CorruptedTile(Tile):
 
 
 class AshTile(Tile):
-    image = pygame.image.load("data/sprites/ash1.png")
+    image_path = "data/sprites/ash1.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -203,7 +295,7 @@ class AshTile(Tile):
 
 
 class CastleTile(Tile):
-    image = pygame.image.load("data/sprites/castle1.png")
+    image_path = "data/sprites/castle1.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -213,7 +305,7 @@ class CastleTile(Tile):
 
 
 class BattlefieldTile(Tile):
-    image = pygame.image.load("data/sprites/battlefield1.png")
+    image_path = "data/sprites/battlefield1.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -227,7 +319,7 @@ class BattlefieldTile(Tile):
 
 
 class MysticTile(Tile):
-    image = pygame.image.load("data/sprites/mystic1.png")
+    image_path = "data/sprites/mystic1.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -237,7 +329,7 @@ class MysticTile(Tile):
 
 
 class RuinTile(Tile):
-    image = pygame.image.load("data/sprites/ruin1.png")
+    image_path = "data/sprites/ruin1.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -247,7 +339,7 @@ class RuinTile(Tile):
 
 
 class CoreTile(Tile):
-    image = pygame.image.load("data/sprites/core1.png")
+    image_path = "data/sprites/core1.png"
 
     def __init__(self) -> None:
         super().__init__()
@@ -1,31 +1,37 @@
-import pygame
-from queue import PriorityQueue
 import time
 
 # from components.global_object.world_notification import (
 #     get_world_notification_manager,
 #     WorldNotificationType,
 # )
-from components.display.drawer import Drawer
-from components.display.character_info_display import CharacterInfoDisplay
-from components.display.world_display import WorldDisplay
 from components.world.grid import Grid
 from components.world.store import get_store, EntityType
-from components.configuration.display_setting import DisplaySetting
+from components.world.scheduler import ActionScheduler, PacingMode
 from components.common.point import Point
 from components.character.character import Character
 from components.character.character_stat import StatDefinition
+from components.character.character_table import get_character_table
+from components.action.combat_engine import get_combat_engine
 from components.utils.tile_utils import get_tile_object
 from components.race.race import Human, Demon
 
-from data.logs.logger import logger
+from data.logs.logger import get_logger
+from data.game_settings import SIMULATION
+
+logger = get_logger(__name__)
 
 
 class World:
-    def __init__(self, grid_data, generators) -> None:
+    def __init__(
+        self, grid_data, generators, pacing_mode: PacingMode = PacingMode.REAL_TIME
+    ) -> None:
         get_store().add(EntityType.GRID, 0, Grid(grid_data))
 
-        self.character_action_values = {}
+        self.scheduler = ActionScheduler()
+        self.pacing_mode = pacing_mode
+        self.current_tick = 0
+        self.action_count = 0
+        self.start_timestamp = time.perf_counter()
         self.generators = generators
         self.char_speed_multiplier = 1
         self.tracking_info_characters = {}
@@ -111,16 +117,69 @@ class World:
     def set_already_focused_on_character(self):
         self.just_select_focusing_character = False
 
-    def update(self):
+    def get_current_tick(self):
+        return self.current_tick
+
+    def get_generators(self):
+        return self.generators
+
+    def set_generators(self, generators):
+        self.generators = generators
+
+    # Characters handed off by another region of a sharded world
+    def add_character(self, character):
+        character.enter_world()
+        self.schedule_next_action(character)
+        if character.get_race() in self.tracking_info_character_factions:
+            self.tracking_info_characters[character.get_id()] = character
+
+    def remove_character(self, character):
+        character_id = character.get_id()
+        self.scheduler.unschedule(character_id)
+        self.tracking_info_characters.pop(character_id, None)
+        if self.focusing_character_id == character_id:
+            self.focusing_character_id = None
+        character.leave_world()
+
+    def get_action_count(self):
+        return self.action_count
+
+    def get_action_interval(self, character):
+        seconds_per_action = (
+            100 / self.char_speed_multiplier
+        ) / character.get_final_stat().get_stat_value(StatDefinition.SPEED)
+        return max(1, round(seconds_per_action * SIMULATION.TICKS_PER_SECOND))
+
+    def schedule_next_action(self, character):
+        action_interval = self.get_action_interval(character)
+        next_action_tick = self.current_tick + action_interval
+        self.scheduler.schedule(character.get_id(), next_action_tick, action_interval)
+        get_character_table().set_value(
+            "next_action_tick", character.get_table_slot(), next_action_tick
+        )
+
+    def get_next_event_tick(self):
+        next_ticks = [
+            generator.get_next_spawn_tick()
+            for generator in self.generators
+            if not generator.is_stop()
+        ]
+        next_action_tick = self.scheduler.peek_next_tick()
+        if next_action_tick is not None:
+            next_ticks.append(next_action_tick)
+        return min(next_ticks) if next_ticks else None
+
+    def update_generators(self):
         store = get_store()
 
         for generator in self.generators:
             if not generator.is_stop():
-                is_new_character_spawn = generator.update()
+                is_new_character_spawn = generator.update(self.current_tick)
                 if is_new_character_spawn:
                     recently_added_character = store.get_recently_added(
                         EntityType.CHARACTER
                     )
+                    self.schedule_next_action(recently_added_character)
                     if (
                         recently_added_character.get_race()
                         in self.tracking_info_character_factions
@@ -129,23 +188,53 @@ class World:
                             recently_added_character.get_id()
                         ] = recently_added_character
 
-        all_characters = store.get_all(EntityType.CHARACTER)
-        for character in all_characters:
-            cid = character.get_info().id
-            if character.is_alive() == False:
-                if cid in self.character_action_values:
-                    self.character_action_values.pop(cid)
-            else:
-                seconds_per_action = (
-                    100 / self.char_speed_multiplier
-                ) / character.get_final_stat().get_stat(StatDefinition.SPEED).value
-                if cid not in self.character_action_values:
-                    self.character_action_values[cid] = seconds_per_action + time.time()
-                if self.character_action_values[cid] < time.time():
-                    character.do_action()
-                    self.character_action_values[cid] = seconds_per_action + time.time()
-
-                action_percentage = (
-                    self.character_action_values[cid] - time.time()
-                ) / seconds_per_action
-                character.update_action_percentage(action_percentage)
+    def update_characters(self):
+        store = get_store()
+        due_characters = [
+            store.get(EntityType.CHARACTER, cid)
+            for cid in self.scheduler.pop_due(self.current_tick)
+        ]
+        # The attacks of all fighters due in this tick are computed together
+        combat_engine = get_combat_engine()
+        combat_engine.prepare_attacks(due_characters)
+
+        for character in due_characters:
+            if not character.is_alive():
+                continue
+            character.do_action()
+            self.action_count += 1
+            if character.is_alive():
+                self.schedule_next_action(character)
+        combat_engine.clear_prepared_attacks()
+
+    def update_action_percentages(self):
+        for cid, character in self.tracking_info_characters.items():
+            character.update_action_percentage(
+                self.scheduler.get_action_percentage(cid, self.current_tick)
+            )
+
+    # Process every spawn and action due up to target_tick, in tick order
+    def advance_to(self, target_tick: int):
+        next_event_tick = self.get_next_event_tick()
+        while next_event_tick is not None and next_event_tick <= target_tick:
+            self.current_tick = max(self.current_tick, next_event_tick)
+            self.update_generators()
+            self.update_characters()
+            next_event_tick = self.get_next_event_tick()
+        self.current_tick = max(self.current_tick, target_tick)
+        self.update_action_percentages()
+
+    def update(self):
+        if self.pacing_mode is PacingMode.REAL_TIME:
+            target_tick = int(
+                (time.perf_counter() - self.start_timestamp)
+                * SIMULATION.TICKS_PER_SECOND
+            )
+        else:
+            next_event_tick = self.get_next_event_tick()
+            target_tick = (
+                next_event_tick
+                if next_event_tick is not None
+                else self.current_tick + 1
+            )
+        self.advance_to(target_tick)
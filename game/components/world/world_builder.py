@@ -0,0 +1,72 @@
+from components.common.point import Point
+from components.action.event import Event
+from components.action.combat_engine import get_combat_engine
+from components.character.character_info import CharacterInfo
+from components.character.character_table import get_character_table
+from components.display.damage_tracker import get_damage_tracker
+from components.world.tile import Tile
+from components.world.store import get_store
+from components.world.world import World
+from components.world.scheduler import PacingMode
+from components.world.map_loader import MapLoader
+from components.world.character_generator import (
+    HumanGenerator,
+    DemonGenerator,
+    RuinMobGenerator,
+    ForsetMobGenerator,
+)
+from components.utils.random_utils import random_once
+
+
+class WorldBuilder:
+    default_map_path = "data/world/map2.txt"
+
+    @staticmethod
+    def create_generators(grid_data, mob_generator_amount=1):
+        demon_spawn = False
+        human_spawn = False
+        generators = []
+        for x in range(len(grid_data)):
+            for y in range(len(grid_data[0])):
+                # TODO: Avoid hard-coded tile value
+                if grid_data[x][y] == 8 and not demon_spawn:
+                    generators.append(DemonGenerator(1, 1, Point(x, y)))
+                    demon_spawn = True
+                elif grid_data[x][y] == 3 and not human_spawn:
+                    generators.append(HumanGenerator(1, 1, Point(x, y)))
+                    human_spawn = True
+                elif grid_data[x][y] == 11 and random_once(0.25):
+                    generators.append(
+                        RuinMobGenerator(1, mob_generator_amount, Point(x, y))
+                    )
+                elif grid_data[x][y] == 5 and random_once(0.25):
+                    generators.append(
+                        ForsetMobGenerator(1, mob_generator_amount, Point(x, y))
+                    )
+        return generators
+
+    # Drop the previous world of the process, the entities and the id counters start over
+    @staticmethod
+    def reset():
+        get_store().reset()
+        get_character_table().reset()
+        get_combat_engine().reset()
+        get_damage_tracker().clear()
+        Tile.id_counter = 1
+        CharacterInfo.id_counter = 1
+        Event.id_counter = 0
+
+    # Build the world from a map file, without touching any display or sprite
+    @staticmethod
+    def build(
+        map_path=None,
+        char_speed_multiplier=None,
+        pacing_mode: PacingMode = PacingMode.REAL_TIME,
+        mob_generator_amount=1,
+    ):
+        grid_data = MapLoader.load_map(map_path or WorldBuilder.default_map_path)
+        generators = WorldBuilder.create_generators(grid_data, mob_generator_amount)
+        world = World(grid_data, generators, pacing_mode=pacing_mode)
+        if char_speed_multiplier:
+            world.set_char_speed_multiplier(char_speed_multiplier)
+        return world, grid_data
@@ -6,3 +6,54 @@ class ACTION:
     HIGH_ESCAPE_CHANCE = 0.9
 
     BASE_POWER_PERCEPTION_ACCURACY = 90
+
+
+class SIMULATION:
+    # Simulation time unit, one second of game time is split into this many ticks
+    TICKS_PER_SECOND = 100
+    # Recompute the cached values on every access and raise when they differ, slow, for debugging only
+    VERIFY_CACHES = False
+
+
+class LOGGING:
+    # Root level, DEBUG traces every action and slows long simulations down
+    LEVEL = "INFO"
+    # Levels by module name prefix, e.g. {"components.action.goal": "DEBUG"}
+    MODULE_LEVELS = {}
+    FILE_PATH = "app.log"
+    IS_CONSOLE_ENABLED = True
+    # Write the records from a background thread, keeps the disk I/O out of the simulation
+    IS_BACKGROUND_WRITER_ENABLED = False
+    FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class STREAMING:
+    # Send the world changes to Kafka, consumed by data_streaming/kafka/push_to_mongodb.py
+    IS_ENABLED = False
+    BOOTSTRAP_SERVERS = "localhost:9092"
+    TOPIC = "rpgs"
+    COMPRESSION_TYPE = "gzip"
+    LINGER_MS = 50
+    # Pending entities kept between two flushes, new entities are dropped when it is full
+    MAX_PENDING_MESSAGES = 10000
+    FLUSH_INTERVAL = 0.5
+    # Seconds between two publications of the changed fields, and between two full keyframes
+    PUBLISH_INTERVAL = 1
+    KEYFRAME_INTERVAL = 30
+
+
+class PATH_FINDING:
+    # Next steps of the found paths kept in the LRU cache, shared by every character
+    MAX_CACHED_STEPS = 4096
+    # Flow fields toward shared static targets kept in the LRU cache
+    MAX_FLOW_FIELDS = 64
+
+
+class SHARDING:
+    # Regions of the map, each one simulated by its own worker process
+    REGION_COUNT = 2
+    # Ticks simulated by the workers between two barriers, handoffs happen at the barriers
+    TICKS_PER_BARRIER = 10
+    # Id range of the characters and events created by each region, keeps the ids unique
+    ID_STRIDE = 10_000_000
@@ -1,20 +1,71 @@
-import logging
 import sys
+import queue
+import atexit
+import logging
+import logging.handlers
+
+from data.game_settings import LOGGING
+
+is_configured = False
+queue_listener: logging.handlers.QueueListener = None
+
+
+def setup_logging():
+    """
+    Configure the root handlers and the per-module levels from the LOGGING settings.
+    Only the first call configures, every module logger is a child of the root logger.
+    """
+    global is_configured, queue_listener
+    if is_configured:
+        return
+    is_configured = True
+
+    formatter = logging.Formatter(LOGGING.FORMAT, datefmt=LOGGING.DATE_FORMAT)
+    handlers = []
+    if LOGGING.FILE_PATH:
+        # Log to a file with UTF-8 encoding
+        handlers.append(logging.FileHandler(LOGGING.FILE_PATH, encoding="utf-8"))
+    if LOGGING.IS_CONSOLE_ENABLED:
+        handlers.append(logging.StreamHandler(sys.stdout))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    root_logger = logging.getLogger()
+    if LOGGING.IS_BACKGROUND_WRITER_ENABLED:
+        # The simulation thread only enqueues the records, the listener thread writes them
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        queue_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        queue_listener.start()
+        atexit.register(stop_logging)
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+
+    set_level(LOGGING.LEVEL)
+    for module_name, level in LOGGING.MODULE_LEVELS.items():
+        set_level(level, module_name)
+
+
+def stop_logging():
+    # Flush the records still waiting in the background writer queue
+    global queue_listener
+    if queue_listener:
+        queue_listener.stop()
+        queue_listener = None
+
+
+def set_level(level, module_name=None):
+    if isinstance(level, str):
+        level = level.upper()
+    logging.getLogger(module_name).setLevel(level)
+
+
+def get_logger(name):
+    setup_logging()
+    return logging.getLogger(name)
+
 
-# Set up logging with UTF-8 encoding for the StreamHandler
-logging.basicConfig(
-    level=logging.DEBUG,  # Set the log level
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",  # Log message format
-    datefmt="%Y-%m-%d %H:%M:%S",  # Date format
-    handlers=[
-        logging.FileHandler(
-            "app.log", encoding="utf-8"
-        ),  # Log to a file with UTF-8 encoding
-        logging.StreamHandler(sys.stdout),  # Log to console with default UTF-8 encoding
-    ],
-)
-
-logger = logging.getLogger(__name__)
-
-# Example log with special characters
-logger.info("This is a test log with special characters: ñ, é, ü")
+logger = get_logger(__name__)
@@ -11,6 +11,7 @@ from components.configuration.display_setting import DisplaySetting
 from components.world.world import World
 from components.display.character_info_display import CharacterInfoDisplay
 from components.display.world_display import WorldDisplay
+from components.display.damage_tracker import FrameStats
 from components.character.character import Character
 from components.character.character_info import CharacterInfo
 from components.character.character_stat import CharacterStat
@@ -19,14 +20,7 @@ from components.control.monitoring import Monitoring
 from components.common.point import Point
 from components.control.control_event_handler import ControlEventHandler
 from components.world.map_generator import generate_voronoi_map
-from components.world.character_generator import (
-    HumanGenerator,
-    DemonGenerator,
-    RuinMobGenerator,
-    ForsetMobGenerator,
-)
-from components.world.map_loader import MapLoader
-from components.utils.random_utils import random_once
+from components.world.world_builder import WorldBuilder
 
 
 class Game:
@@ -54,6 +48,7 @@ class Game:
         # TODO: Later optimization and refactoring
         self.max_refresh_per_second = 120
         self.last_refresh = time.perf_counter()
+        self.frame_stats = FrameStats()
 
     def initialize_game(self):
         pygame.init()
@@ -61,33 +56,14 @@ class Game:
         self.font = pygame.font.Font(None, 20)
         self.info_font = pygame.font.Font(None, 25)
 
-    def initialize_generators(self, grid_data):
-        demon_spawn = False
-        human_spawn = False
-        generators = []
-        for x in range(len(grid_data)):
-            for y in range(len(grid_data[0])):
-                # TODO: Avoid hard-coded tile value
-                if grid_data[x][y] == 8 and not demon_spawn:
-                    generators.append(DemonGenerator(1, 1, Point(x, y)))
-                    demon_spawn = True
-                elif grid_data[x][y] == 3 and not human_spawn:
-                    generators.append(HumanGenerator(1, 1, Point(x, y)))
-                    human_spawn = True
-                elif grid_data[x][y] == 11 and random_once(0.25):
-                    generators.append(RuinMobGenerator(1, 1, Point(x, y)))
-                elif grid_data[x][y] == 5 and random_once(0.25):
-                    generators.append(ForsetMobGenerator(1, 1, Point(x, y)))
-        return generators
-
     def initialize_world(self):
         # grid_data = generate_voronoi_map(self.max_x_cell, self.max_y_cell) # Random generated map
-        grid_data = MapLoader.load_map("data/world/map2.txt")  # Load defined map
+        # generators = [] # TODO: Temporary not spawn any characters to test regions
+        self.world, grid_data = WorldBuilder.build(
+            WorldBuilder.default_map_path
+        )  # Load defined map
         self.max_x_cell = len(grid_data[0])
         self.max_y_cell = len(grid_data)
-        generators = self.initialize_generators(grid_data)
-        # generators = [] # TODO: Temporary not spawn any characters to test regions
-        self.world = World(grid_data, generators)
 
     def get_all_surfaces(self):
         surfaces = {}
@@ -105,8 +81,9 @@ class Game:
         )
         return surfaces_pos
 
+    # Returns the rects of the window changed by this frame
     def draw(self):
-        self.world_display.draw(
+        rects = self.world_display.draw(
             self.surface,
             self.font,
             self.display_setting,
@@ -118,7 +95,7 @@ class Game:
             self.world.get_focusing_character(),
         )
 
-        self.character_info_display.draw(
+        rects += self.character_info_display.draw(
             self.surface,
             self.info_font,
             self.display_setting,
@@ -126,6 +103,7 @@ class Game:
         )
 
         self.is_display_changed = False
+        return rects
 
     def update_information_based_on_event(self):
         selected_tile_pos = self.control_event_handler.get_selected_tile_pos()
@@ -202,11 +180,12 @@ class Game:
 
             self.update()
 
-            self.draw()
+            rects = self.draw()
 
-            # Update display
+            # Update only the changed parts of the display
             # pygame.display.flip()
-            pygame.display.update()
+            pygame.display.update(rects)
+            self.frame_stats.record_frame(rects)
 
         # Quit Pygame
         pygame.quit()
@@ -0,0 +1,155 @@
+import sys
+import time
+import argparse
+
+sys.path.append("..")
+sys.path.append(".")
+
+from components.world.world_builder import WorldBuilder
+from components.world.scheduler import PacingMode
+from components.world.sharded_world import ShardCoordinator
+from components.character.character_table import get_character_table
+from data.game_settings import SIMULATION
+from data.logs.logger import set_level
+
+
+class Simulation:
+    # Headless engine, drives World.update without any surface, font or sprite
+    def __init__(
+        self,
+        map_path=None,
+        char_speed_multiplier=None,
+        pacing_mode: PacingMode = PacingMode.AS_FAST_AS_POSSIBLE,
+        mob_generator_amount=1,
+    ) -> None:
+        self.world, _ = WorldBuilder.build(
+            map_path,
+            char_speed_multiplier=char_speed_multiplier,
+            pacing_mode=pacing_mode,
+            mob_generator_amount=mob_generator_amount,
+        )
+
+    def step(self):
+        self.world.update()
+
+    def advance_to(self, tick):
+        self.world.advance_to(tick)
+
+    def get_tick_count(self):
+        return self.world.get_current_tick()
+
+    def run(self, ticks=None, duration=None):
+        start = time.perf_counter()
+        while (ticks is None or self.get_tick_count() < ticks) and (
+            duration is None or time.perf_counter() - start < duration
+        ):
+            self.step()
+        return time.perf_counter() - start
+
+    def get_population(self):
+        character_table = get_character_table()
+        return (
+            character_table.count_by_faction(is_alive=True),
+            character_table.count_by_faction(is_alive=False),
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the world simulation headless, without any rendering."
+    )
+    parser.add_argument(
+        "--ticks", type=int, help="Number of simulation ticks to run", required=False
+    )
+    parser.add_argument(
+        "--duration", type=float, help="Wall-clock limit in seconds", required=False
+    )
+    parser.add_argument("--map", type=str, help="Map file to load", required=False)
+    parser.add_argument(
+        "--char-speed", type=float, help="Character speed multiplier", required=False
+    )
+    parser.add_argument(
+        "--real-time",
+        action="store_true",
+        help="Pace the simulation with the wall clock instead of running as fast as possible",
+    )
+    parser.add_argument(
+        "--log-level", type=str, default="WARNING", help="Root logging level"
+    )
+    parser.add_argument(
+        "--verify-caches",
+        action="store_true",
+        help="Compare every cached value against its uncached computation",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Split the map into this many regions, each simulated in its own process",
+    )
+    args = parser.parse_args()
+
+    set_level(args.log_level)
+    SIMULATION.VERIFY_CACHES = args.verify_caches
+    if args.ticks is None and args.duration is None:
+        parser.error("one of --ticks or --duration is required")
+
+    if args.shards > 1:
+        if args.ticks is None or args.real_time:
+            parser.error("--shards runs as fast as possible and requires --ticks")
+        run_sharded(args)
+        return
+
+    simulation = Simulation(
+        map_path=args.map,
+        char_speed_multiplier=args.char_speed,
+        pacing_mode=(
+            PacingMode.REAL_TIME if args.real_time else PacingMode.AS_FAST_AS_POSSIBLE
+        ),
+    )
+    elapsed = simulation.run(ticks=args.ticks, duration=args.duration)
+
+    alive_count, dead_count = simulation.get_population()
+    print_summary(
+        simulation.get_tick_count(),
+        simulation.world.get_action_count(),
+        elapsed,
+        alive_count,
+        dead_count,
+    )
+
+
+def run_sharded(args):
+    coordinator = ShardCoordinator(
+        map_path=args.map,
+        region_count=args.shards,
+        char_speed_multiplier=args.char_speed,
+    )
+    coordinator.start()
+    start = time.perf_counter()
+    coordinator.run(args.ticks)
+    elapsed = time.perf_counter() - start
+    coordinator.stop()
+
+    alive_count, dead_count = coordinator.get_population()
+    print_summary(
+        coordinator.get_current_tick(),
+        coordinator.get_action_count(),
+        elapsed,
+        alive_count,
+        dead_count,
+    )
+    print(f"HANDOFFS: {coordinator.get_handoff_count()}")
+
+
+def print_summary(tick_count, action_count, elapsed, alive_count, dead_count):
+    print(
+        f"Ran {tick_count} ticks and {action_count} actions in {elapsed:.2f}s "
+        f"({action_count / max(elapsed, 1e-9):.0f} actions/s)"
+    )
+    print(f"ALIVE: {alive_count}")
+    print(f"DEAD: {dead_count}")
+
+
+if __name__ == "__main__":
+    main()